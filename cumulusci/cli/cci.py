@@ -18,17 +18,10 @@ from cumulusci.utils import get_cci_upgrade_command
 from cumulusci.utils.http.requests_utils import init_requests_trust
 from cumulusci.utils.logging import tee_stdout_stderr
 
-from .error import error
-from .flow import flow
 from .logger import get_tempfile_logger, init_logger
-from .org import org
-from .plan import plan
-from .project import project
-from .robot import robot
 from .runtime import CliRuntime, pass_runtime
-from .service import service
-from .task import task
 from .utils import (
+    LazyGroup,
     check_latest_version,
     get_installed_version,
     get_latest_final_version,
@@ -41,6 +34,43 @@ SUGGEST_ERROR_COMMAND = (
 
 USAGE_ERRORS = (CumulusCIUsageError, click.UsageError)
 
+# Top-level command groups, which are only imported when they are run.
+# The help text must match the group's own help text.
+COMMAND_GROUPS = {
+    "error": (
+        "cumulusci.cli.error:error",
+        "Get or share information about an error",
+    ),
+    "flow": (
+        "cumulusci.cli.flow:flow",
+        "Commands for finding and running flows for a project",
+    ),
+    "org": (
+        "cumulusci.cli.org:org",
+        "Commands for connecting and interacting with Salesforce orgs",
+    ),
+    "plan": (
+        "cumulusci.cli.plan:plan",
+        "Commands for getting information about MetaDeploy plans",
+    ),
+    "project": (
+        "cumulusci.cli.project:project",
+        "Commands for interacting with project repository configurations",
+    ),
+    "robot": (
+        "cumulusci.cli.robot:robot",
+        "Commands for working with Robot Framework",
+    ),
+    "service": (
+        "cumulusci.cli.service:service",
+        "Commands for connecting services to the keychain",
+    ),
+    "task": (
+        "cumulusci.cli.task:task",
+        "Commands for finding and running tasks for a project",
+    ),
+}
+
 
 #
 # Root command
@@ -192,7 +222,7 @@ def version_info_wrapper(
     ctx.exit()
 
 
-@click.group("main", help="")
+@click.group("main", help="", cls=LazyGroup, lazy_subcommands=COMMAND_GROUPS)
 @click.option(  # based on https://click.palletsprojects.com/en/8.1.x/options/#callbacks-and-eager-options
     "--version",
     is_flag=True,
@@ -230,15 +260,3 @@ def shell(runtime, script=None, python=None):
         exec(python, variables)
     else:
         code.interact(local=variables)
-
-
-# Top Level Groups
-
-cli.add_command(error)
-cli.add_command(project)
-cli.add_command(org)
-cli.add_command(service)
-cli.add_command(task)
-cli.add_command(flow)
-cli.add_command(plan)
-cli.add_command(robot)
@@ -1,7 +1,9 @@
 import contextlib
+import importlib
 import io
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -466,14 +468,54 @@ def test_shell__no_project(interact):
 
 
 def test_cover_command_groups():
-    run_click_command(cci.project)
-    run_click_command(cci.org)
-    run_click_command(cci.task)
-    run_click_command(cci.flow)
-    run_click_command(cci.service)
+    for name in ("project", "org", "task", "flow", "service"):
+        run_click_command(cci.cli.get_command(None, name))
     # no assertion; this test is for coverage of empty methods
 
 
+def test_command_groups__help():
+    for name, (import_path, help) in cci.COMMAND_GROUPS.items():
+        module_name, attribute = import_path.split(":")
+        group = getattr(importlib.import_module(module_name), attribute)
+        assert group.name == name
+        assert group.get_short_help_str(1000) == help
+
+
+# Modules that `cci --help` may import beyond those needed by CliRuntime
+MAX_HELP_MODULES = 60
+
+HELP_SCRIPT = """
+import sys
+from unittest import mock
+
+import cumulusci.cli.runtime
+
+before = set(sys.modules)
+from cumulusci.cli import cci
+
+with mock.patch.object(cci, "check_latest_version"):
+    cci.main(["cci", "--help"])
+print("\\n".join(sorted(set(sys.modules) - before)), file=sys.stderr)
+"""
+
+
+def test_help__imports():
+    """`cci --help` should not import the command groups."""
+    result = subprocess.run(
+        [sys.executable, "-c", HELP_SCRIPT],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "HOME": tempfile.mkdtemp()},
+    )
+    assert result.returncode == 0, result.stderr
+    assert "task     Commands for finding and running tasks" in result.stdout
+
+    imported = result.stderr.split()
+    group_modules = {path.split(":")[0] for path, _ in cci.COMMAND_GROUPS.values()}
+    assert not group_modules.intersection(imported)
+    assert len(imported) <= MAX_HELP_MODULES, imported
+
+
 @mock.patch(
     "cumulusci.cli.runtime.CliRuntime.get_org",
     lambda *args, **kwargs: (MagicMock(), MagicMock()),
@@ -3,6 +3,7 @@ import sys
 import time
 from unittest import mock
 
+import click
 import pkg_resources
 import pytest
 import requests
@@ -120,3 +121,24 @@ def test_longpath_warn_on_win(console_print, is_enabled):
 
     is_enabled.assert_called_once()
     console_print.assert_called_once_with(utils.WIN_LONG_PATH_WARNING)
+
+
+@mock.patch("cumulusci.cli.utils.importlib.import_module")
+def test_lazy_group(import_module):
+    import_module.return_value.hello = click.Command("hello", help="Say hello")
+
+    @click.group(
+        cls=utils.LazyGroup,
+        lazy_subcommands={"hello": ("some.module:hello", "Say hello")},
+    )
+    def cli():
+        pass
+
+    ctx = click.Context(cli)
+    assert "hello  Say hello" in cli.get_help(ctx)
+    assert [c.value for c in cli.shell_complete(ctx, "he")] == ["hello"]
+    import_module.assert_not_called()
+
+    assert cli.get_command(ctx, "hello") is import_module.return_value.hello
+    assert cli.get_command(ctx, "hello") is import_module.return_value.hello
+    import_module.assert_called_once_with("some.module")
@@ -1,9 +1,11 @@
 import contextlib
+import importlib
 import os
 import re
 import sys
 import time
 from collections import defaultdict
+from typing import Dict, Optional, Tuple
 
 import click
 import pkg_resources
@@ -24,6 +26,54 @@ HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Control\\FileSystem.
 """
 
 
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported only when they are run.
+
+    `lazy_subcommands` maps the name of each subcommand to the import path
+    of the command, as `module:attribute`, and its help text. The help text
+    is used to list the subcommands in `--help` output and in shell
+    completion, so that neither needs to import them."""
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self._describing = False
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            import_path, help = self.lazy_subcommands[cmd_name]
+            if self._describing:
+                return click.Command(cmd_name, help=help)
+            module_name, attribute = import_path.split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        with self._describe_only():
+            super().format_commands(ctx, formatter)
+
+    def shell_complete(self, ctx, incomplete):
+        with self._describe_only():
+            return super().shell_complete(ctx, incomplete)
+
+    @contextlib.contextmanager
+    def _describe_only(self):
+        self._describing = True
+        try:
+            yield
+        finally:
+            self._describing = False
+
+
 def group_items(items):
     """Given a list of dicts with 'group' keys,
     returns those items in lists categorized group"""
@@ -30,6 +30,7 @@ class FlowConfig(BaseConfig):
     tier: str
     preflight_message: str
     error_message: str
+    polling: dict
     tasks: dict  # deprecated
 
 
@@ -0,0 +1,127 @@
+"""A cache of parsed, validated and merged cumulusci.yml files.
+
+Every cci command used to read the universal cumulusci.yml, the global and
+project cumulusci.yml files and any local overrides, validate each of them
+and then merge them together. The cache stores the result in
+~/.cumulusci/config_cache, keyed by the content of every input file and the
+CumulusCI version, so a change to any of them is picked up automatically.
+
+Files that produce warnings when they are loaded are never cached, so that
+the warnings are shown every time."""
+
+import hashlib
+import os
+import pickle
+import threading
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import cumulusci
+from cumulusci.utils.yaml.cumulusci_yml import (
+    ErrorDict,
+    _log_yaml_errors,
+    cci_safe_load,
+    default_logger,
+)
+
+logger = getLogger(__name__)
+
+CONFIG_CACHE_DIR = "config_cache"
+
+# Number of merged configs kept in ~/.cumulusci/config_cache
+MAX_CACHED_CONFIGS = 20
+
+# Non-breaking spaces in a yml file are replaced with a warning
+NBSP = "\u00A0".encode("utf-8")
+
+
+class ConfigSources:
+    """The content of the yml files that make up one config."""
+
+    def __init__(self, paths: Dict[str, Optional[str]], **texts: Optional[str]):
+        self.content: Dict[str, Optional[bytes]] = {
+            name: Path(path).read_bytes() if path else None
+            for name, path in paths.items()
+        }
+        self.content.update(
+            (name, text.encode("utf-8") if text else None)
+            for name, text in texts.items()
+        )
+        self.key = self._get_key()
+
+    def _get_key(self) -> str:
+        h = hashlib.sha256(cumulusci.__version__.encode("utf-8"))
+        for name, content in sorted(self.content.items()):
+            h.update(b"\0" + name.encode("utf-8") + b"\0")
+            if content is not None:
+                h.update(hashlib.sha256(content).digest())
+        return h.hexdigest()
+
+    @property
+    def has_nbsp(self) -> bool:
+        return any(content and NBSP in content for content in self.content.values())
+
+
+def load_config_file(source, context: str = None, logger=None) -> Tuple[dict, bool]:
+    """Load a cumulusci.yml file, logging any validation warnings.
+
+    Returns the config and whether it was loaded without warnings."""
+    errors: List[ErrorDict] = []
+    config = cci_safe_load(source, context, on_error=errors.append)
+    if errors:
+        _log_yaml_errors(logger or default_logger, errors)
+    return config, not errors
+
+
+class ConfigCache:
+    """Stores merged configs as pickles in a directory owned by the user.
+
+    The cache directory is never inside a project, since loading a pickle
+    can run arbitrary code."""
+
+    def __init__(self, cumulusci_config_dir: Path):
+        self.cache_dir = Path(cumulusci_config_dir) / CONFIG_CACHE_DIR
+
+    def load(self, sources: ConfigSources) -> Optional[dict]:
+        cache_file = self.cache_dir / f"{sources.key}.pickle"
+        try:
+            with open(cache_file, "rb") as f:
+                config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Cannot read config cache {cache_file}: {e}")
+            return None
+
+        # Mark this entry as recently used
+        cache_file.touch()
+        return config
+
+    def save(self, sources: ConfigSources, config: dict):
+        if sources.has_nbsp:
+            return
+        cache_file = self.cache_dir / f"{sources.key}.pickle"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that other processes
+            # never see part of an entry.
+            temp_file = cache_file.with_suffix(
+                f".{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            temp_file.write_bytes(pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+            temp_file.replace(cache_file)
+            self._prune()
+        except OSError as e:
+            logger.debug(f"Cannot write config cache {cache_file}: {e}")
+
+    def _prune(self):
+        cached = []
+        for cache_file in self.cache_dir.glob("*.pickle"):
+            try:
+                cached.append((cache_file.stat().st_mtime, cache_file))
+            except FileNotFoundError:
+                continue
+        cached.sort(reverse=True)
+        for _, stale_file in cached[MAX_CACHED_CONFIGS:]:
+            stale_file.unlink(missing_ok=True)
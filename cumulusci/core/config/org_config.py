@@ -1,8 +1,10 @@
+import json
 import os
 import re
 from collections import defaultdict, namedtuple
 from contextlib import contextmanager
 from datetime import date, datetime
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -24,12 +26,21 @@ from cumulusci.utils.http.requests_utils import safe_json_from_response
 from cumulusci.utils.version_strings import StrictVersion
 
 SKIP_REFRESH = os.environ.get("CUMULUSCI_DISABLE_REFRESH")
+CACHE_INSTALLED_PACKAGES = os.environ.get("CUMULUSCI_CACHE_INSTALLED_PACKAGES")
 SANDBOX_MYDOMAIN_RE = re.compile(r"\.cs\d+\.my\.(.*)salesforce\.com")
 MYDOMAIN_RE = re.compile(r"\.my\.(.*)salesforce\.com")
 
 
 VersionInfo = namedtuple("VersionInfo", ["id", "number"])
 
+INSTALLED_PACKAGES_QUERY = (
+    "SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
+    "SubscriberPackageVersion.Id, SubscriberPackageVersion.MajorVersion, "
+    "SubscriberPackageVersion.MinorVersion, SubscriberPackageVersion.PatchVersion, "
+    "SubscriberPackageVersion.BuildNumber, SubscriberPackageVersion.IsBeta "
+    "FROM InstalledSubscriberPackage"
+)
+
 
 class OrgConfig(BaseConfig):
     """Salesforce org configuration (i.e. org credentials)"""
@@ -328,45 +339,107 @@ class OrgConfig(BaseConfig):
         Beta version of a package are represented as "1.2.3b5", where 5 is the build number.
         """
         if self._installed_packages is None:
-            isp_result = self.salesforce_client.restful(
-                "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
-                "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
-            )
+            packages = self._load_installed_packages_cache()
+            if packages is None:
+                packages = self._query_installed_packages()
+                self._save_installed_packages_cache(packages)
+
             _installed_packages = defaultdict(list)
-            for isp in isp_result["records"]:
-                sp = isp["SubscriberPackage"]
-                try:
-                    spv_result = self.salesforce_client.restful(
-                        "tooling/query/?q=SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
-                        f"IsBeta FROM SubscriberPackageVersion WHERE Id='{isp['SubscriberPackageVersionId']}'"
-                    )
-                except SalesforceError as err:
-                    self.logger.warning(
-                        f"Ignoring error while trying to check installed package {isp['SubscriberPackageVersionId']}: {err.content}"
-                    )
-                    continue
-                if not spv_result["records"]:
-                    # This _shouldn't_ happen, but it is possible in customer orgs.
-                    continue
-                spv = spv_result["records"][0]
-
-                version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
-                if spv["PatchVersion"]:
-                    version += f".{spv['PatchVersion']}"
-                if spv["IsBeta"]:
-                    version += f"b{spv['BuildNumber']}"
-                version_info = VersionInfo(spv["Id"], StrictVersion(version))
-                namespace = sp["NamespacePrefix"]
+            for package in packages:
+                version = package["Version"]
+                version_info = VersionInfo(package["Id"], StrictVersion(version))
+                namespace = package["NamespacePrefix"]
                 _installed_packages[namespace].append(version_info)
                 namespace_version = f"{namespace}@{version}"
                 _installed_packages[namespace_version].append(version_info)
-                _installed_packages[sp["Id"]].append(version_info)
+                _installed_packages[package["SubscriberPackageId"]].append(version_info)
 
             self._installed_packages = _installed_packages
         return self._installed_packages
 
+    def _query_installed_packages(self):
+        """Returns a list of the installed package versions, fetched
+        together with their packages in a single Tooling API query."""
+        try:
+            isp_result = self.salesforce_client.restful(
+                f"tooling/query/?q={INSTALLED_PACKAGES_QUERY}"
+            )
+        except SalesforceError as err:
+            self.logger.debug(
+                f"Querying installed packages one at a time, because the combined query failed: {err.content}"
+            )
+            return self._query_installed_packages_individually()
+
+        return [
+            _get_installed_package(isp["SubscriberPackage"], spv)
+            for isp in isp_result["records"]
+            # This _shouldn't_ be empty, but it is possible in customer orgs.
+            if (spv := isp.get("SubscriberPackageVersion"))
+        ]
+
+    def _query_installed_packages_individually(self):
+        isp_result = self.salesforce_client.restful(
+            "tooling/query/?q=SELECT SubscriberPackage.Id, SubscriberPackage.NamespacePrefix, "
+            "SubscriberPackageVersionId FROM InstalledSubscriberPackage"
+        )
+        packages = []
+        for isp in isp_result["records"]:
+            try:
+                spv_result = self.salesforce_client.restful(
+                    "tooling/query/?q=SELECT Id, MajorVersion, MinorVersion, PatchVersion, BuildNumber, "
+                    f"IsBeta FROM SubscriberPackageVersion WHERE Id='{isp['SubscriberPackageVersionId']}'"
+                )
+            except SalesforceError as err:
+                self.logger.warning(
+                    f"Ignoring error while trying to check installed package {isp['SubscriberPackageVersionId']}: {err.content}"
+                )
+                continue
+            if not spv_result["records"]:
+                # This _shouldn't_ happen, but it is possible in customer orgs.
+                continue
+            packages.append(
+                _get_installed_package(
+                    isp["SubscriberPackage"], spv_result["records"][0]
+                )
+            )
+        return packages
+
+    def _can_cache_installed_packages(self):
+        return bool(
+            self.keychain and self.org_id and self.username and self.get_domain()
+        )
+
+    def _get_installed_packages_cache_file(self):
+        with self.get_orginfo_cache_dir("installed_packages") as directory:
+            return os.path.join(directory.getsyspath(), f"{self.org_id}.json")
+
+    def _load_installed_packages_cache(self):
+        if not (CACHE_INSTALLED_PACKAGES and self._can_cache_installed_packages()):
+            return None
+        cache_file = self._get_installed_packages_cache_file()
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            self.logger.warning(
+                f"Cannot read installed packages cache `{cache_file}`. Reason `{e}`."
+            )
+            return None
+
+    def _save_installed_packages_cache(self, packages):
+        if not (CACHE_INSTALLED_PACKAGES and self._can_cache_installed_packages()):
+            return
+        with open(
+            self._get_installed_packages_cache_file(), "w", encoding="utf-8"
+        ) as f:
+            json.dump(packages, f)
+
     def reset_installed_packages(self):
         self._installed_packages = None
+        if CACHE_INSTALLED_PACKAGES and self._can_cache_installed_packages():
+            Path(self._get_installed_packages_cache_file()).unlink(missing_ok=True)
 
     def save(self):
         assert self.keychain, "Keychain was not set on OrgConfig"
@@ -592,3 +665,19 @@ class OrgConfig(BaseConfig):
                 new_dependencies.append(dependency)
 
         return new_dependencies
+
+
+def _get_installed_package(sp: dict, spv: dict) -> dict:
+    """Combine a SubscriberPackage and SubscriberPackageVersion record
+    into a summary of an installed package."""
+    version = f"{spv['MajorVersion']}.{spv['MinorVersion']}"
+    if spv["PatchVersion"]:
+        version += f".{spv['PatchVersion']}"
+    if spv["IsBeta"]:
+        version += f"b{spv['BuildNumber']}"
+    return {
+        "Id": spv["Id"],
+        "SubscriberPackageId": sp["Id"],
+        "NamespacePrefix": sp["NamespacePrefix"],
+        "Version": version,
+    }
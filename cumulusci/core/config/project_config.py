@@ -26,6 +26,11 @@ from pydantic import ValidationError
 
 from cumulusci.core.config import FlowConfig, TaskConfig
 from cumulusci.core.config.base_task_flow_config import BaseTaskFlowConfig
+from cumulusci.core.config.config_cache import (
+    ConfigCache,
+    ConfigSources,
+    load_config_file,
+)
 from cumulusci.core.exceptions import (
     ConfigError,
     GithubException,
@@ -46,7 +51,6 @@ from cumulusci.utils.git import current_branch, git_path, parse_repo_url, split_
 from cumulusci.utils.yaml.cumulusci_yml import (
     GitHubSourceModel,
     LocalFolderSourceModel,
-    cci_safe_load,
 )
 
 sys.modules.setdefault(
@@ -159,27 +163,50 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
                 f"The file {self.config_filename} was not found in the repo root: {repo_root}. Are you in a CumulusCI Project directory?"
             )
 
+        sources = ConfigSources(
+            {
+                "universal_config": self.universal_config_obj.config_universal_path,
+                "global_config": self.universal_config_obj.config_global_path,
+                "project_config": self.config_project_path,
+                "project_local_config": self.config_project_local_path,
+            },
+            additional_yaml=self.additional_yaml,
+        )
+        cache = ConfigCache(self.universal_config_obj.cumulusci_config_dir)
+        cached = cache.load(sources)
+        if cached:
+            self.config_project.update(cached["config_project"])
+            self.config_project_local.update(cached["config_project_local"])
+            self.config_additional_yaml.update(cached["config_additional_yaml"])
+            self.config = cached["config"]
+            self._validate_config()
+            return
+
         # Load the project's yaml config file
-        project_config = cci_safe_load(self.config_project_path, logger=self.logger)
+        project_config, valid = load_config_file(
+            self.config_project_path, logger=self.logger
+        )
 
         if project_config:
             self.config_project.update(project_config)
 
         # Load the local project yaml config file if it exists
         if self.config_project_local_path:
-            local_config = cci_safe_load(
+            local_config, local_valid = load_config_file(
                 self.config_project_local_path, logger=self.logger
             )
+            valid = valid and local_valid
             if local_config:
                 self.config_project_local.update(local_config)
 
         # merge in any additional yaml that was passed along
         if self.additional_yaml:
-            additional_yaml_config = cci_safe_load(
+            additional_yaml_config, additional_valid = load_config_file(
                 StringIO(self.additional_yaml),
                 self.config_project_path,
                 logger=self.logger,
             )
+            valid = valid and additional_valid
             if additional_yaml_config:
                 self.config_additional_yaml.update(additional_yaml_config)
 
@@ -193,6 +220,17 @@ class BaseProjectConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
             }
         )
 
+        if valid:
+            cache.save(
+                sources,
+                {
+                    "config_project": self.config_project,
+                    "config_project_local": self.config_project_local,
+                    "config_additional_yaml": self.config_additional_yaml,
+                    "config": self.config,
+                },
+            )
+
         self._validate_config()
 
     def _validate_config(self):
@@ -19,6 +19,7 @@ from cumulusci.core.config import (
     OrgConfig,
     ServiceConfig,
     UniversalConfig,
+    org_config,
 )
 from cumulusci.core.config.org_config import VersionInfo
 from cumulusci.core.dependencies.dependencies import (
@@ -1176,6 +1177,64 @@ class TestOrgConfig:
         with pytest.raises(Exception, match=expected_exception):
             config.get_community_info("bogus")
 
+    MOCK_INSTALLED_PACKAGES_RESULT = {
+        "size": 4,
+        "totalSize": 4,
+        "done": True,
+        "records": [
+            {
+                "SubscriberPackage": {
+                    "Id": "03350000000DEz4AAG",
+                    "NamespacePrefix": "GW_Volunteers",
+                },
+                "SubscriberPackageVersion": {
+                    "Id": "04t1T00000070yqQAA",
+                    "MajorVersion": 3,
+                    "MinorVersion": 119,
+                    "PatchVersion": 0,
+                    "BuildNumber": 5,
+                    "IsBeta": False,
+                },
+            },
+            {
+                "SubscriberPackage": {
+                    "Id": "03350000000DEz5AAG",
+                    "NamespacePrefix": "GW_Volunteers",
+                },
+                "SubscriberPackageVersion": {
+                    "Id": "04t000000000001AAA",
+                    "MajorVersion": 12,
+                    "MinorVersion": 0,
+                    "PatchVersion": 1,
+                    "BuildNumber": 1,
+                    "IsBeta": False,
+                },
+            },
+            {
+                "SubscriberPackage": {
+                    "Id": "03350000000DEz7AAG",
+                    "NamespacePrefix": "TESTY",
+                },
+                "SubscriberPackageVersion": {
+                    "Id": "04t000000000002AAA",
+                    "MajorVersion": 1,
+                    "MinorVersion": 10,
+                    "PatchVersion": 0,
+                    "BuildNumber": 5,
+                    "IsBeta": True,
+                },
+            },
+            {
+                "SubscriberPackage": {
+                    "Id": "03350000000DEz4AAG",
+                    "NamespacePrefix": "blah",
+                },
+                "SubscriberPackageVersion": None,
+            },
+        ],
+    }
+
+    # Responses to querying each package version separately
     MOCK_TOOLING_PACKAGE_RESULTS = [
         {
             "size": 2,
@@ -1268,51 +1327,163 @@ class TestOrgConfig:
         SalesforceError(None, None, None, None),
     ]
 
+    EXPECTED_INSTALLED_PACKAGES = {
+        "GW_Volunteers": [
+            VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119")),
+            VersionInfo("04t000000000001AAA", StrictVersion("12.0.1")),
+        ],
+        "GW_Volunteers@3.119": [
+            VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119"))
+        ],
+        "GW_Volunteers@12.0.1": [
+            VersionInfo("04t000000000001AAA", StrictVersion("12.0.1"))
+        ],
+        "TESTY": [VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))],
+        "TESTY@1.10b5": [VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))],
+        "03350000000DEz4AAG": [
+            VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119"))
+        ],
+        "03350000000DEz5AAG": [
+            VersionInfo("04t000000000001AAA", StrictVersion("12.0.1"))
+        ],
+        "03350000000DEz7AAG": [
+            VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))
+        ],
+    }
+
     @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
     def test_installed_packages(self, sf):
         config = OrgConfig({}, "test")
-        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+        sf.restful.return_value = self.MOCK_INSTALLED_PACKAGES_RESULT
 
-        expected = {
-            "GW_Volunteers": [
-                VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119")),
-                VersionInfo("04t000000000001AAA", StrictVersion("12.0.1")),
-            ],
-            "GW_Volunteers@3.119": [
-                VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119"))
-            ],
-            "GW_Volunteers@12.0.1": [
-                VersionInfo("04t000000000001AAA", StrictVersion("12.0.1"))
-            ],
-            "TESTY": [VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))],
-            "TESTY@1.10b5": [
-                VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))
-            ],
-            "03350000000DEz4AAG": [
-                VersionInfo("04t1T00000070yqQAA", StrictVersion("3.119"))
-            ],
-            "03350000000DEz5AAG": [
-                VersionInfo("04t000000000001AAA", StrictVersion("12.0.1"))
-            ],
-            "03350000000DEz7AAG": [
-                VersionInfo("04t000000000002AAA", StrictVersion("1.10.0b5"))
-            ],
-        }
         # get it twice so we can make sure it is cached
-        assert config.installed_packages == expected
-        assert config.installed_packages == expected
-        sf.restful.assert_called()
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        sf.restful.assert_called_once()
 
         sf.restful.reset_mock()
-        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
         config.reset_installed_packages()
-        assert config.installed_packages == expected
-        sf.restful.assert_called()
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        sf.restful.assert_called_once()
+
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__query_fails(self, sf):
+        config = OrgConfig({}, "test")
+        sf.restful.side_effect = [
+            SalesforceError(None, None, None, None)
+        ] + self.MOCK_TOOLING_PACKAGE_RESULTS
+
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        assert sf.restful.call_count == 7
+
+    @mock.patch.object(org_config, "CACHE_INSTALLED_PACKAGES", "1")
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__persistent_cache(self, sf, tmp_path):
+        def get_org_config():
+            return OrgConfig(
+                {
+                    "instance_url": "https://example.my.salesforce.com",
+                    "username": "test@example.com",
+                    "org_id": "00D000000000001",
+                },
+                "test",
+                keychain=DummyKeychain(cache_dir=tmp_path),
+            )
+
+        sf.restful.return_value = self.MOCK_INSTALLED_PACKAGES_RESULT
+        assert get_org_config().installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        sf.restful.reset_mock()
+
+        config = get_org_config()
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        sf.restful.assert_not_called()
+
+        config.reset_installed_packages()
+        assert not list(tmp_path.rglob("*.json"))
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        sf.restful.assert_called_once()
+
+    @mock.patch.object(org_config, "CACHE_INSTALLED_PACKAGES", None)
+    def test_reset_installed_packages__cache_disabled(self, tmp_path):
+        config = OrgConfig(
+            {
+                "instance_url": "https://example.my.salesforce.com",
+                "username": "test@example.com",
+                "org_id": "00D000000000001",
+            },
+            "test",
+            keychain=DummyKeychain(cache_dir=tmp_path),
+        )
+        config._installed_packages = {}
+
+        config.reset_installed_packages()
+
+        assert config._installed_packages is None
+        assert not list(tmp_path.iterdir())
+
+    @mock.patch.object(org_config, "CACHE_INSTALLED_PACKAGES", "1")
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__persistent_cache_invalid(self, sf, tmp_path, caplog):
+        config = OrgConfig(
+            {
+                "instance_url": "https://example.my.salesforce.com",
+                "username": "test@example.com",
+                "org_id": "00D000000000001",
+            },
+            "test",
+            keychain=DummyKeychain(cache_dir=tmp_path),
+        )
+        cache_file = config._get_installed_packages_cache_file()
+        with open(cache_file, "w") as f:
+            f.write("{")
+        sf.restful.return_value = self.MOCK_INSTALLED_PACKAGES_RESULT
+
+        assert config.installed_packages == self.EXPECTED_INSTALLED_PACKAGES
+        assert "Cannot read installed packages cache" in caplog.text
+
+    @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
+    def test_installed_packages__single_query_matches_individual(self, sf):
+        packages = [
+            {
+                "SubscriberPackage": {"Id": f"033{i:012}", "NamespacePrefix": f"ns{i}"},
+                "SubscriberPackageVersionId": f"04t{i:012}",
+                "SubscriberPackageVersion": {
+                    "Id": f"04t{i:012}",
+                    "MajorVersion": 1,
+                    "MinorVersion": i,
+                    "PatchVersion": 0,
+                    "BuildNumber": 1,
+                    "IsBeta": False,
+                },
+            }
+            for i in range(5)
+        ]
+
+        def restful(path):
+            if "FROM SubscriberPackageVersion" in path:
+                version_id = path.split("'")[1]
+                return {
+                    "records": [
+                        p["SubscriberPackageVersion"]
+                        for p in packages
+                        if p["SubscriberPackageVersionId"] == version_id
+                    ]
+                }
+            return {"records": packages}
+
+        sf.restful.side_effect = restful
+        individually = OrgConfig({}, "test")._query_installed_packages_individually()
+        assert sf.restful.call_count == 6
+
+        sf.restful.reset_mock()
+        single = OrgConfig({}, "test")._query_installed_packages()
+        assert sf.restful.call_count == 1
+        assert single == individually
 
     @mock.patch("cumulusci.core.config.org_config.OrgConfig.salesforce_client")
     def test_has_minimum_package_version(self, sf):
         config = OrgConfig({}, "test")
-        sf.restful.side_effect = self.MOCK_TOOLING_PACKAGE_RESULTS
+        sf.restful.return_value = self.MOCK_INSTALLED_PACKAGES_RESULT
 
         assert config.has_minimum_package_version("TESTY", "1.9")
         assert config.has_minimum_package_version("TESTY", "1.10b5")
@@ -0,0 +1,163 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.config import BaseProjectConfig, UniversalConfig, config_cache
+from cumulusci.core.config.config_cache import ConfigCache, ConfigSources
+from cumulusci.utils import cd
+
+PROJECT_YML = """
+project:
+    package:
+        name: Test
+tasks:
+    my_task:
+        class_path: cumulusci.tasks.util.Sleep
+"""
+
+
+@pytest.fixture
+def universal_config():
+    UniversalConfig.config = None
+    yield UniversalConfig()
+    UniversalConfig.config = None
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "cumulusci.yml").write_text(PROJECT_YML)
+    with cd(tmp_path):
+        yield tmp_path
+
+
+def cached_files():
+    return list((Path.home() / ".cumulusci" / "config_cache").glob("*.pickle"))
+
+
+class TestConfigSources:
+    def test_key(self, tmp_path):
+        yml = tmp_path / "cumulusci.yml"
+        yml.write_text("project: {}")
+        key = ConfigSources({"project_config": str(yml)}).key
+
+        assert ConfigSources({"project_config": str(yml)}).key == key
+        assert ConfigSources({"project_config": None}).key != key
+        assert ConfigSources({"other_config": str(yml)}).key != key
+        assert ConfigSources({"project_config": str(yml)}, extra="x").key != key
+
+        yml.write_text("project: {name: Changed}")
+        assert ConfigSources({"project_config": str(yml)}).key != key
+
+    def test_key__version(self, tmp_path):
+        key = ConfigSources({}, additional_yaml="project: {}").key
+        with mock.patch("cumulusci.__version__", "0.0.1"):
+            assert ConfigSources({}, additional_yaml="project: {}").key != key
+
+
+class TestConfigCache:
+    def test_load__missing(self, tmp_path):
+        assert ConfigCache(tmp_path).load(ConfigSources({})) is None
+
+    def test_load__unreadable(self, tmp_path):
+        sources = ConfigSources({})
+        cache = ConfigCache(tmp_path)
+        cache.save(sources, {"project": {}})
+        (tmp_path / "config_cache" / f"{sources.key}.pickle").write_bytes(b"oops")
+
+        assert cache.load(sources) is None
+
+    def test_save__nbsp(self, tmp_path):
+        sources = ConfigSources({}, additional_yaml="project:\n\u00A0 name: Test")
+        cache = ConfigCache(tmp_path)
+        cache.save(sources, {"project": {}})
+
+        assert cache.load(sources) is None
+
+    def test_save__not_writable(self, tmp_path, caplog):
+        caplog.set_level("DEBUG")
+        (tmp_path / "config_cache").write_text("not a directory")
+
+        ConfigCache(tmp_path).save(ConfigSources({}), {"project": {}})
+
+        assert "Cannot write config cache" in caplog.text
+
+    def test_save__prunes(self, tmp_path):
+        cache = ConfigCache(tmp_path)
+        with mock.patch.object(config_cache, "MAX_CACHED_CONFIGS", 2):
+            for i in range(3):
+                cache.save(ConfigSources({}, additional_yaml=str(i)), {"i": i})
+
+        assert len(list(cache.cache_dir.glob("*.pickle"))) == 2
+        assert cache.load(ConfigSources({}, additional_yaml="2")) == {"i": 2}
+
+
+class TestUniversalConfigCache:
+    def test_cached(self, universal_config):
+        assert len(cached_files()) == 1
+
+        UniversalConfig.config = None
+        with mock.patch.object(config_cache, "cci_safe_load") as cci_safe_load:
+            cached_config = UniversalConfig()
+
+        cci_safe_load.assert_not_called()
+        assert cached_config.config == universal_config.config
+        assert cached_config.config_universal == universal_config.config_universal
+
+    def test_global_config_changed(self, universal_config):
+        (Path.home() / ".cumulusci" / "cumulusci.yml").write_text(
+            "tasks:\n    newtesttask:\n        description: test description"
+        )
+        UniversalConfig.config = None
+
+        config = UniversalConfig()
+
+        assert config.tasks__newtesttask__description == "test description"
+        assert len(cached_files()) == 2
+
+
+class TestProjectConfigCache:
+    def test_cached(self, universal_config, project_dir):
+        project_config = BaseProjectConfig(universal_config)
+
+        with mock.patch.object(config_cache, "cci_safe_load") as cci_safe_load:
+            cached_config = BaseProjectConfig(universal_config)
+
+        cci_safe_load.assert_not_called()
+        assert cached_config.config == project_config.config
+        assert cached_config.config_project == project_config.config_project
+        assert cached_config.tasks__my_task__class_path == "cumulusci.tasks.util.Sleep"
+        assert cached_config.config is not project_config.config
+
+    def test_project_config_changed(self, universal_config, project_dir):
+        BaseProjectConfig(universal_config)
+        (project_dir / "cumulusci.yml").write_text(
+            PROJECT_YML.replace("util.Sleep", "util.Delete")
+        )
+
+        project_config = BaseProjectConfig(universal_config)
+
+        assert (
+            project_config.tasks__my_task__class_path == "cumulusci.tasks.util.Delete"
+        )
+
+    def test_additional_yaml(self, universal_config, project_dir):
+        BaseProjectConfig(universal_config)
+
+        project_config = BaseProjectConfig(
+            universal_config, additional_yaml="project:\n    package:\n        name: X"
+        )
+
+        assert project_config.project__package__name == "X"
+        assert project_config.config_additional_yaml
+
+    def test_warnings_not_cached(self, universal_config, project_dir, caplog):
+        (project_dir / "cumulusci.yml").write_text("unknown_key: 1\n" + PROJECT_YML)
+
+        BaseProjectConfig(universal_config)
+        caplog.clear()
+        BaseProjectConfig(universal_config)
+
+        assert "CumulusCI Configuration Warning" in caplog.text
+        assert len(cached_files()) == 1  # only the universal config
@@ -2,12 +2,16 @@ import os
 from pathlib import Path
 
 from cumulusci.core.config import BaseTaskFlowConfig
+from cumulusci.core.config.config_cache import (
+    ConfigCache,
+    ConfigSources,
+    load_config_file,
+)
 from cumulusci.core.config.project_config import (
     BaseProjectConfig,
     ProjectConfigPropertiesMixin,
 )
 from cumulusci.core.utils import merge_config
-from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load
 
 __location__ = os.path.dirname(os.path.realpath(__file__))
 
@@ -70,12 +74,29 @@ class UniversalConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
         if UniversalConfig.config is not None:
             return
 
+        sources = ConfigSources(
+            {
+                "universal_config": self.config_universal_path,
+                "global_config": self.config_global_path,
+            }
+        )
+        cache = ConfigCache(self.cumulusci_config_dir)
+        cached = cache.load(sources)
+        if cached:
+            UniversalConfig.config_universal = cached["config_universal"]
+            UniversalConfig.config_global = cached["config_global"]
+            UniversalConfig.config = cached["config"]
+            return
+
         # load the universal config
-        UniversalConfig.config_universal = cci_safe_load(self.config_universal_path)
+        UniversalConfig.config_universal, valid = load_config_file(
+            self.config_universal_path
+        )
 
         # Load the local config
         if self.config_global_path:
-            config = cci_safe_load(self.config_global_path)
+            config, global_valid = load_config_file(self.config_global_path)
+            valid = valid and global_valid
         else:
             config = {}
         UniversalConfig.config_global = config
@@ -86,3 +107,13 @@ class UniversalConfig(BaseTaskFlowConfig, ProjectConfigPropertiesMixin):
                 "global_config": UniversalConfig.config_global,
             }
         )
+
+        if valid:
+            cache.save(
+                sources,
+                {
+                    "config_universal": UniversalConfig.config_universal,
+                    "config_global": UniversalConfig.config_global,
+                    "config": UniversalConfig.config,
+                },
+            )
@@ -39,7 +39,7 @@ from cumulusci.utils import (
     temporary_dir,
 )
 from cumulusci.utils.yaml.model_parser import HashableBaseModel
-from cumulusci.utils.ziputils import zip_subfolder
+from cumulusci.utils.ziputils import zip_subfolder_view
 
 logger = logging.getLogger(__name__)
 
@@ -592,7 +592,7 @@ class UnmanagedDependency(StaticDependency, abc.ABC):
             zip_extract_subfolder = self.subfolder
 
         if zip_extract_subfolder:
-            zip_src = zip_subfolder(zip_src, zip_extract_subfolder)
+            zip_src = zip_subfolder_view(zip_src, zip_extract_subfolder)
 
         source_format = get_source_format_for_zipfile(
             zip_src, self.subfolder if not zip_extract_subfolder else None
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import pydantic
+
+import cumulusci
+from cumulusci.core.config.project_config import BaseProjectConfig
+from cumulusci.core.dependencies.dependencies import (
+    AVAILABLE_DEPENDENCY_CLASSES,
+    Dependency,
+    DependencyPin,
+    StaticDependency,
+)
+from cumulusci.utils.git import split_repo_url
+
+logger = logging.getLogger(__name__)
+
+LOCKFILE_DIR = "dependency_locks"
+
+# API endpoints, relative to a repository, whose ETags are checked
+ETAG_ENDPOINTS = {"repo": (), "releases": ("releases",)}
+
+# Maximum number of repositories checked for changes at once
+MAX_VALIDATION_WORKERS = 8
+
+STATIC_DEPENDENCY_CLASSES = {
+    dependency_class.__name__: dependency_class
+    for dependency_class in AVAILABLE_DEPENDENCY_CLASSES
+    if issubclass(dependency_class, StaticDependency)
+}
+
+
+def get_lockfile_key(
+    dependencies: List[Dependency],
+    strategies: Iterable[str],
+    pins: List[DependencyPin],
+    filter_key=None,
+) -> str:
+    """Return a key identifying one request to resolve dependencies.
+
+    Must be called before the dependencies are resolved, since resolving
+    them changes them."""
+    key = {
+        "version": cumulusci.__version__,
+        "dependencies": [[type(d).__name__, d.dict()] for d in dependencies],
+        "pins": [[type(p).__name__, p.dict()] for p in pins],
+        "strategies": [str(s) for s in strategies],
+        "filter": filter_key,
+    }
+    return hashlib.sha256(
+        json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class DependencyLockfile:
+    """A cache of the static dependencies that a set of dynamic dependencies
+    resolved to, stored in the project's .cci directory.
+
+    Along with the resolved dependencies we store the ETags of each GitHub
+    repository that had to be resolved, and of its list of releases.
+    Pushing a branch or tag changes the repository's ETag and publishing
+    or editing a release changes the releases' ETag, so the cache is only
+    used if a conditional request for each of them is answered with
+    304 Not Modified. Those requests don't count against the GitHub
+    API rate limit."""
+
+    def __init__(self, context: BaseProjectConfig, key: str):
+        self.context = context
+        self.key = key
+
+    @property
+    def path(self):
+        return self.context.cache_dir / LOCKFILE_DIR / f"{self.key}.json"
+
+    def load(self) -> Optional[List[StaticDependency]]:
+        """Return the cached dependencies, or None if there are none
+        or any of the repositories they were resolved from has changed."""
+        try:
+            lock = json.loads(self.path.read_text(encoding="utf-8"))
+            dependencies = [
+                STATIC_DEPENDENCY_CLASSES[class_name].parse_obj(spec)
+                for class_name, spec in lock["dependencies"]
+            ]
+            repos = lock["repos"]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, pydantic.ValidationError) as e:
+            logger.warning(f"Cannot read dependency lockfile `{self.path}`: {e}")
+            return None
+
+        with ThreadPoolExecutor(max_workers=MAX_VALIDATION_WORKERS) as executor:
+            unchanged = all(
+                executor.map(
+                    lambda item: self._is_unchanged(*item), sorted(repos.items())
+                )
+            )
+        if not unchanged:
+            return None
+
+        logger.info("Using cached dependency resolution")
+        return dependencies
+
+    def save(self, dependencies: List[StaticDependency], repos: Iterable[str]):
+        """Store resolved dependencies along with the current ETags
+        of the repositories they were resolved from."""
+        repos = sorted(set(repos))
+        with ThreadPoolExecutor(max_workers=MAX_VALIDATION_WORKERS) as executor:
+            etags = dict(zip(repos, executor.map(self._get_etags, repos)))
+
+        lock = {
+            "dependencies": [[type(d).__name__, d.dict()] for d in dependencies],
+            "repos": etags,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix(".json.tmp")
+        temp_file.write_text(json.dumps(lock, indent=2), encoding="utf-8")
+        temp_file.replace(self.path)
+
+    def _get(self, github: str, endpoint: str, etag: Optional[str] = None):
+        owner, name = split_repo_url(github)
+        session = self.context.get_github_api(github).session
+        url = session.build_url("repos", owner, name, *ETAG_ENDPOINTS[endpoint])
+        headers = {"If-None-Match": etag} if etag else {}
+        return session.get(url, headers=headers)
+
+    def _get_etags(self, github: str) -> Dict[str, Optional[str]]:
+        return {
+            endpoint: self._get(github, endpoint).headers.get("ETag")
+            for endpoint in ETAG_ENDPOINTS
+        }
+
+    def _is_unchanged(self, github: str, etags: Dict[str, Optional[str]]) -> bool:
+        try:
+            for endpoint in ETAG_ENDPOINTS:
+                etag = etags.get(endpoint)
+                if not etag or self._get(github, endpoint, etag).status_code != 304:
+                    logger.debug(f"Dependency lockfile is out of date for {github}")
+                    return False
+        except Exception as e:
+            logger.debug(f"Cannot validate dependency lockfile for {github}: {e}")
+            return False
+        return True
@@ -1,5 +1,6 @@
 import abc
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from github3.exceptions import NotFoundError
@@ -25,6 +26,7 @@ from cumulusci.core.dependencies.github import (
     get_remote_project_config,
     get_repo,
 )
+from cumulusci.core.dependencies.lockfile import DependencyLockfile, get_lockfile_key
 from cumulusci.core.enums import StrEnum
 from cumulusci.core.exceptions import CumulusCIException, DependencyResolutionError
 from cumulusci.core.github import (
@@ -40,6 +42,9 @@ from cumulusci.utils.git import (
     is_release_branch_or_child,
 )
 
+# Maximum number of dependencies resolved or flattened at once
+MAX_RESOLUTION_WORKERS = 8
+
 
 class DependencyResolutionStrategy(StrEnum):
     """Enum that defines a strategy for resolving a dynamic dependency into a static dependency."""
@@ -58,6 +63,15 @@ class DependencyResolutionStrategy(StrEnum):
     UNMANAGED_HEAD = "unmanaged"
 
 
+# Strategies whose results only change when a ref is pushed or a release published
+LOCKFILE_STRATEGIES = [
+    DependencyResolutionStrategy.STATIC_TAG_REFERENCE,
+    DependencyResolutionStrategy.BETA_RELEASE_TAG,
+    DependencyResolutionStrategy.RELEASE_TAG,
+    DependencyResolutionStrategy.UNMANAGED_HEAD,
+]
+
+
 class AbstractResolver(abc.ABC):
     """Abstract base class for dependency resolution strategies."""
 
@@ -553,6 +567,9 @@ def dependency_filter_ignore_deps(ignore_deps: List[dict]) -> Callable:
 
         return True
 
+    # Lets get_static_dependencies() cache dependencies resolved with this filter
+    should_include.lockfile_key = ignore_deps
+
     return should_include
 
 
@@ -563,6 +580,7 @@ def get_static_dependencies(
     strategies: Optional[List[DependencyResolutionStrategy]] = None,
     filter_function: Optional[Callable] = None,
     pins: Optional[List[DependencyPin]] = None,
+    use_lockfile: bool = False,
 ) -> List[StaticDependency]:
     """Resolves the dependencies of a CumulusCI project
     to convert dynamic GitHub dependencies into static dependencies
@@ -578,6 +596,12 @@ def get_static_dependencies(
     :param filter_function: if provided, call the function with each dependency
                             (including transitive ones) encountered, and include
                             those for which True is returned.
+    :param use_lockfile: if True, reuse the dependencies from the last identical
+                         resolution if none of the repositories they were
+                         resolved from have changed since, and store them for
+                         next time otherwise. Only strategies that don't depend
+                         on commit statuses are supported, and a filter_function
+                         must have a `lockfile_key` attribute.
     """
     if dependencies is None:
         dependencies = parse_dependencies(context.project__dependencies)
@@ -590,34 +614,79 @@ def get_static_dependencies(
         strategies = get_resolver_stack(context, resolution_strategy)
     if filter_function is None:
         filter_function = lambda x: True  # noqa: E731
+        filter_function.lockfile_key = None
+
+    lockfile = None
+    if use_lockfile and _can_use_lockfile(strategies, filter_function):
+        lockfile = DependencyLockfile(
+            context,
+            get_lockfile_key(
+                dependencies, strategies, pins, filter_function.lockfile_key
+            ),
+        )
+        locked = lockfile.load()
+        if locked is not None:
+            return locked
+
+    # GitHub repositories whose current state we depend on
+    resolved_repos = set()
+
+    def unique(it: Iterable):
+        seen = set()
+
+        for each in it:
+            if each not in seen:
+                seen.add(each)
+                yield each
+
+    # Each level of the dependency tree is resolved and then flattened
+    # concurrently, since both mostly wait on the GitHub API.
+    # `executor.map` returns results in input order, so the output order
+    # is the same as when the dependencies are handled one at a time.
+    with ThreadPoolExecutor(max_workers=MAX_RESOLUTION_WORKERS) as executor:
+        while any(not d.is_flattened or not d.is_resolved for d in dependencies):
+            # Identical dependencies resolve and flatten identically,
+            # so only handle the first of each.
+            dependencies = list(unique(dependencies))
+            unresolved = [
+                d
+                for d in dependencies
+                if isinstance(d, DynamicDependency) and not d.is_resolved
+            ]
+            resolved_repos.update(
+                d.github for d in unresolved if isinstance(d, BaseGitHubDependency)
+            )
+            # Finish resolving the dependencies using our given strategies.
+            list(
+                executor.map(lambda d: d.resolve(context, strategies, pins), unresolved)
+            )
 
-    while any(not d.is_flattened or not d.is_resolved for d in dependencies):
-        for d in dependencies:
-            if isinstance(d, DynamicDependency) and not d.is_resolved:
-                # Finish resolving the dependency using our given strategies.
-                d.resolve(context, strategies, pins)
-
-        def unique(it: Iterable):
-            seen = set()
-
-            for each in it:
-                if each not in seen:
-                    seen.add(each)
-                    yield each
-
-        dependencies = list(
-            unique(
-                itertools.chain(
-                    *list(
-                        d.flatten(context) for d in dependencies if filter_function(d)
-                    )
-                ),
+            dependencies = list(
+                unique(
+                    itertools.chain(
+                        *executor.map(
+                            lambda d: d.flatten(context),
+                            [d for d in dependencies if filter_function(d)],
+                        )
+                    ),
+                )
             )
-        )
 
     # Make sure, if we had no flattening or resolving to do, that we apply the ignore list.
     # Type is guaranteed via the logic above.
-    return [d for d in dependencies if filter_function(d)]  # type: ignore
+    dependencies = [d for d in dependencies if filter_function(d)]
+    if lockfile:
+        lockfile.save(dependencies, resolved_repos)
+    return dependencies  # type: ignore
+
+
+def _can_use_lockfile(
+    strategies: List[DependencyResolutionStrategy], filter_function: Callable
+) -> bool:
+    # Commit statuses can change without changing the repository's ETag
+    return all(s in LOCKFILE_STRATEGIES for s in strategies) and hasattr(
+        filter_function, "lockfile_key"
+    )
 
 
 def resolve_dependency(
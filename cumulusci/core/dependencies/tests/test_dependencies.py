@@ -766,7 +766,7 @@ class TestUnmanagedZipURLDependency:
 
     @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
     @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
-    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder_view")
     def test_get_metadata_package_zip_builder__mdapi_root(
         self, subfolder_mock, download_zip_mock, zipbuilder_mock
     ):
@@ -799,7 +799,7 @@ class TestUnmanagedZipURLDependency:
 
     @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
     @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
-    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder_view")
     def test_get_metadata_package_zip_builder__mdapi_subfolder(
         self, subfolder_mock, download_zip_mock, zipbuilder_mock
     ):
@@ -834,7 +834,7 @@ class TestUnmanagedZipURLDependency:
 
     @mock.patch("cumulusci.core.dependencies.dependencies.MetadataPackageZipBuilder")
     @mock.patch("cumulusci.core.dependencies.dependencies.download_extract_zip")
-    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder")
+    @mock.patch("cumulusci.core.dependencies.dependencies.zip_subfolder_view")
     @mock.patch("cumulusci.core.sfdx.sfdx")
     def test_get_metadata_package_zip_builder__sfdx(
         self, sfdx_mock, subfolder_mock, download_zip_mock, zipbuilder_mock
@@ -0,0 +1,121 @@
+import json
+from unittest import mock
+
+import pytest
+
+from cumulusci.core.dependencies.dependencies import (
+    GitHubDependencyPin,
+    GitHubDynamicDependency,
+    PackageNamespaceVersionDependency,
+    UnmanagedGitHubRefDependency,
+)
+from cumulusci.core.dependencies.lockfile import DependencyLockfile, get_lockfile_key
+from cumulusci.core.dependencies.resolvers import DependencyResolutionStrategy
+
+REPO_URL = "https://github.com/SFDO-Tooling/RootRepo"
+DEPENDENCIES = [
+    PackageNamespaceVersionDependency(namespace="foo", version="1.0"),
+    UnmanagedGitHubRefDependency(github=REPO_URL, ref="abcdef", subfolder="src"),
+]
+
+
+@pytest.fixture
+def session():
+    session = mock.Mock()
+    session.build_url = lambda *parts: "/".join(["https://api.github.com", *parts])
+    session.get.side_effect = lambda url, headers: mock.Mock(
+        status_code=304 if headers else 200, headers={"ETag": f'"{url}"'}
+    )
+    return session
+
+
+@pytest.fixture
+def context(tmp_path, session):
+    context = mock.Mock()
+    context.cache_dir = tmp_path
+    context.get_github_api.return_value.session = session
+    return context
+
+
+class TestGetLockfileKey:
+    def test_get_lockfile_key(self):
+        dependencies = [GitHubDynamicDependency(github=REPO_URL)]
+        strategies = [DependencyResolutionStrategy.RELEASE_TAG]
+        key = get_lockfile_key(dependencies, strategies, [])
+
+        assert key == get_lockfile_key(
+            [GitHubDynamicDependency(github=REPO_URL)], strategies, []
+        )
+        assert key != get_lockfile_key(
+            dependencies, [DependencyResolutionStrategy.BETA_RELEASE_TAG], []
+        )
+        assert key != get_lockfile_key(
+            dependencies, strategies, [GitHubDependencyPin(github=REPO_URL, tag="1")]
+        )
+        assert key != get_lockfile_key(
+            dependencies, strategies, [], [{"namespace": "foo"}]
+        )
+
+
+class TestDependencyLockfile:
+    def test_save_and_load(self, context, session, tmp_path):
+        lockfile = DependencyLockfile(context, "key")
+        assert lockfile.load() is None
+
+        lockfile.save(DEPENDENCIES, [REPO_URL, REPO_URL])
+
+        lock = json.loads((tmp_path / "dependency_locks" / "key.json").read_text())
+        assert lock["repos"] == {
+            REPO_URL: {
+                "repo": '"https://api.github.com/repos/SFDO-Tooling/RootRepo"',
+                "releases": '"https://api.github.com/repos/SFDO-Tooling/RootRepo/releases"',
+            }
+        }
+
+        session.get.reset_mock()
+        assert DependencyLockfile(context, "key").load() == DEPENDENCIES
+        session.get.assert_has_calls(
+            [
+                mock.call(
+                    "https://api.github.com/repos/SFDO-Tooling/RootRepo",
+                    headers={
+                        "If-None-Match": '"https://api.github.com/repos/SFDO-Tooling/RootRepo"'
+                    },
+                ),
+                mock.call(
+                    "https://api.github.com/repos/SFDO-Tooling/RootRepo/releases",
+                    headers={
+                        "If-None-Match": '"https://api.github.com/repos/SFDO-Tooling/RootRepo/releases"'
+                    },
+                ),
+            ]
+        )
+
+    def test_load__repo_changed(self, context, session):
+        DependencyLockfile(context, "key").save(DEPENDENCIES, [REPO_URL])
+        session.get.side_effect = lambda url, headers: mock.Mock(
+            status_code=200 if url.endswith("releases") else 304
+        )
+
+        assert DependencyLockfile(context, "key").load() is None
+
+    def test_load__no_etag(self, context, session):
+        session.get.side_effect = lambda url, headers: mock.Mock(
+            status_code=200, headers={}
+        )
+        DependencyLockfile(context, "key").save(DEPENDENCIES, [REPO_URL])
+
+        assert DependencyLockfile(context, "key").load() is None
+
+    def test_load__request_error(self, context, session):
+        DependencyLockfile(context, "key").save(DEPENDENCIES, [REPO_URL])
+        session.get.side_effect = ConnectionError
+
+        assert DependencyLockfile(context, "key").load() is None
+
+    def test_load__unreadable(self, context, tmp_path, caplog):
+        (tmp_path / "dependency_locks").mkdir()
+        (tmp_path / "dependency_locks" / "key.json").write_text("{")
+
+        assert DependencyLockfile(context, "key").load() is None
+        assert "Cannot read dependency lockfile" in caplog.text
@@ -1,3 +1,5 @@
+import json
+import threading
 from typing import List, Optional, Tuple
 from unittest import mock
 
@@ -59,6 +61,39 @@ class ConcreteDynamicDependency(DynamicDependency):
         return ""
 
 
+class BarrierDynamicDependency(DynamicDependency):
+    """Dependency that can only resolve once `barrier` has as many parties
+    waiting as it expects, so it deadlocks unless resolved concurrently."""
+
+    label: str
+    resolved: Optional[bool] = False
+
+    @property
+    def is_resolved(self):
+        return self.resolved
+
+    def resolve(
+        self,
+        context: BaseProjectConfig,
+        strategies: List[DependencyResolutionStrategy],
+        pins=None,
+    ):
+        RESOLVE_CALLS.append(self.label)
+        BARRIER.wait()
+        self.resolved = True
+
+    def flatten(self, context: BaseProjectConfig):
+        return [PackageNamespaceVersionDependency(namespace=self.label, version="1.0")]
+
+    @property
+    def name(self):
+        return self.label
+
+
+RESOLVE_CALLS = []
+BARRIER = threading.Barrier(1)
+
+
 class TestGitHubTagResolver:
     def test_github_tag_resolver(self, project_config):
         tag = mock.Mock()
@@ -669,6 +704,90 @@ class TestStaticDependencyResolution:
             ),
         ]
 
+    def test_get_static_dependencies__concurrent(self, project_config):
+        global BARRIER
+        BARRIER = threading.Barrier(3, timeout=5)
+        RESOLVE_CALLS.clear()
+        dependencies = [
+            BarrierDynamicDependency(label="c"),
+            BarrierDynamicDependency(label="a"),
+            BarrierDynamicDependency(label="b"),
+            BarrierDynamicDependency(label="a"),
+        ]
+
+        result = get_static_dependencies(
+            project_config,
+            dependencies=dependencies,
+            strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+        )
+
+        # Output keeps the input order, and the duplicate is resolved once
+        assert [d.namespace for d in result] == ["c", "a", "b"]
+        assert sorted(RESOLVE_CALLS) == ["a", "b", "c"]
+
+    def test_get_static_dependencies__lockfile(self, project_config, tmp_path):
+        project_config.cache_dir = tmp_path
+        session = project_config.get_github_api.return_value.session
+        session.get.side_effect = lambda url, headers: mock.Mock(
+            status_code=304 if headers else 200, headers={"ETag": "etag"}
+        )
+
+        def resolve():
+            return get_static_dependencies(
+                project_config,
+                dependencies=[
+                    GitHubDynamicDependency(
+                        github="https://github.com/SFDO-Tooling/RootRepo"
+                    )
+                ],
+                strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+                use_lockfile=True,
+            )
+
+        expected = resolve()
+        (lock_path,) = (tmp_path / "dependency_locks").glob("*.json")
+        assert sorted(json.loads(lock_path.read_text())["repos"]) == [
+            "https://github.com/SFDO-Tooling/DependencyRepo",
+            "https://github.com/SFDO-Tooling/RootRepo",
+        ]
+
+        with mock.patch.object(
+            project_config, "get_repo_from_url", side_effect=AssertionError
+        ):
+            assert resolve() == expected
+
+    def test_get_static_dependencies__lockfile_unsupported(
+        self, project_config, tmp_path
+    ):
+        project_config.cache_dir = tmp_path
+
+        get_static_dependencies(
+            project_config,
+            dependencies=[
+                GitHubDynamicDependency(
+                    github="https://github.com/SFDO-Tooling/RootRepo"
+                )
+            ],
+            strategies=[
+                DependencyResolutionStrategy.COMMIT_STATUS_EXACT_BRANCH,
+                DependencyResolutionStrategy.RELEASE_TAG,
+            ],
+            use_lockfile=True,
+        )
+        get_static_dependencies(
+            project_config,
+            dependencies=[
+                GitHubDynamicDependency(
+                    github="https://github.com/SFDO-Tooling/RootRepo"
+                )
+            ],
+            strategies=[DependencyResolutionStrategy.RELEASE_TAG],
+            filter_function=lambda d: True,
+            use_lockfile=True,
+        )
+
+        assert not (tmp_path / "dependency_locks").exists()
+
     def test_get_static_dependencies__pins(self, project_config):
         gh = GitHubDynamicDependency(github="https://github.com/SFDO-Tooling/RootRepo")
 
@@ -556,7 +556,12 @@ class FlowCoordinator:
         steps = []
 
         for number, step_config in self.flow_config.steps.items():
-            specs = self._visit_step(number, step_config, self.project_config)
+            specs = self._visit_step(
+                number,
+                step_config,
+                self.project_config,
+                parent_polling=self.flow_config.polling,
+            )
             steps.extend(specs)
 
         return sorted(steps, key=attrgetter("step_num"))
@@ -570,6 +575,7 @@ class FlowCoordinator:
         parent_options: Optional[dict] = None,
         parent_ui_options: Optional[dict] = None,
         from_flow: Optional[str] = None,
+        parent_polling: Optional[dict] = None,
     ) -> List[StepSpec]:
         """
         for each step (as defined in the flow YAML), _visit_step is called with only
@@ -584,6 +590,7 @@ class FlowCoordinator:
         :param parent_options: used when called recursively for nested steps, options from parent flow
         :param parent_ui_options: used when called recursively for nested steps, UI options from parent flow
         :param from_flow: used when called recursively for nested steps, name of parent flow
+        :param parent_polling: polling configuration of the flow (or outermost flow) containing this step
         :return: List[StepSpec] a list of all resolved steps including/under the one passed in
         """
         step_number = StepVersion(str(number))
@@ -647,6 +654,10 @@ class FlowCoordinator:
                 task_config_dict["checks"] = []
             task_config_dict["checks"].extend(step_config.get("checks", []))
 
+            # apply the flow's polling configuration unless the task has its own
+            if parent_polling and "polling" not in task_config_dict["options"]:
+                task_config_dict["options"]["polling"] = copy.deepcopy(parent_polling)
+
             # merge runtime options
             if name in self.runtime_options:
                 task_config_dict["options"].update(self.runtime_options[name])
@@ -694,6 +705,7 @@ class FlowCoordinator:
                     parent_options=step_options,
                     parent_ui_options=step_ui_options,
                     from_flow=path,
+                    parent_polling=parent_polling or flow_config.polling,
                 )
         return visited_steps
 
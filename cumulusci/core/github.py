@@ -4,6 +4,7 @@ import os
 import re
 import time
 import webbrowser
+from pathlib import Path
 from string import Template
 from typing import Callable, Optional, Union
 from urllib.parse import urlparse
@@ -42,6 +43,7 @@ from cumulusci.oauth.client import (
     get_device_oauth_token,
 )
 from cumulusci.utils.git import parse_repo_url
+from cumulusci.utils.http.cache import CachingHTTPAdapter
 from cumulusci.utils.http.requests_utils import safe_json_from_response
 from cumulusci.utils.yaml.cumulusci_yml import cci_safe_load
 
@@ -82,6 +84,31 @@ class GitHubRety(Retry):
 retries = GitHubRety(status_forcelist=(401, 502, 503, 504), backoff_factor=0.3)
 adapter = HTTPAdapter(max_retries=retries)
 
+GITHUB_CACHE_DEFAULT_MAX_MB = 100
+caching_adapter: Optional[CachingHTTPAdapter] = None
+
+
+def get_github_adapter() -> HTTPAdapter:
+    """Return the adapter to attach to github sessions.
+
+    If the CUMULUSCI_GITHUB_CACHE environment variable is set to True,
+    this is an adapter that caches responses on disk and revalidates them
+    with conditional requests, shared by all sessions in the process."""
+    global caching_adapter
+    if os.environ.get("CUMULUSCI_GITHUB_CACHE") != "True":
+        return adapter
+    if caching_adapter is None:
+        max_mb = int(
+            os.environ.get("CUMULUSCI_GITHUB_CACHE_MAX_MB")
+            or GITHUB_CACHE_DEFAULT_MAX_MB
+        )
+        caching_adapter = CachingHTTPAdapter(
+            Path.home() / ".cumulusci" / "github_cache",
+            max_size=max_mb * 1024 * 1024,
+            max_retries=retries,
+        )
+    return caching_adapter
+
 
 def get_github_api(username=None, password=None):
     """Old API that only handles logging in as a user.
@@ -89,8 +116,9 @@ def get_github_api(username=None, password=None):
     Here for backwards-compatibility during the transition.
     """
     gh = login(username, password)
-    gh.session.mount("http://", adapter)
-    gh.session.mount("https://", adapter)
+    github_adapter = get_github_adapter()
+    gh.session.mount("http://", github_adapter)
+    gh.session.mount("https://", github_adapter)
     return gh
 
 
@@ -119,8 +147,9 @@ def get_github_api_for_repo(keychain, repo_url, session=None) -> GitHub:
     )
 
     # Apply retry policy
-    gh.session.mount("http://", adapter)
-    gh.session.mount("https://", adapter)
+    github_adapter = get_github_adapter()
+    gh.session.mount("http://", github_adapter)
+    gh.session.mount("https://", github_adapter)
 
     GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
     APP_KEY = os.environ.get("GITHUB_APP_KEY", "").encode("utf-8")
@@ -0,0 +1,140 @@
+"""Strategies for how long to wait between polls of a long-running operation,
+such as a metadata deployment, package install, or Apex test run.
+
+Tasks and flows select a strategy with the `polling` option, e.g.::
+
+    polling:
+        strategy: exponential
+        fast_polls: 3
+        factor: 1.5
+        max_interval: 30
+        jitter: 0.1
+"""
+
+import abc
+import random
+import typing as T
+import uuid
+
+from pydantic import BaseModel, Extra, Field
+
+
+class PollingStrategy(abc.ABC):
+    """Decides how long to wait after each poll."""
+
+    @abc.abstractmethod
+    def get_interval(self, poll_count: int, initial_interval: float) -> float:
+        """Return the number of seconds to wait after poll number `poll_count`
+        (counting from 1), given the interval the caller started with."""
+        ...
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """Always wait for the initial interval."""
+
+    def get_interval(self, poll_count: int, initial_interval: float) -> float:
+        return initial_interval
+
+
+class LinearPollingStrategy(PollingStrategy):
+    """Add a second to the interval every three polls, without limit.
+
+    This was CumulusCI's only polling behavior before strategies were added."""
+
+    def get_interval(self, poll_count: int, initial_interval: float) -> float:
+        return initial_interval + (poll_count - 1) // 3
+
+
+class ExponentialPollingStrategy(PollingStrategy):
+    """Poll at the initial interval for the first `fast_polls` polls, then
+    grow the interval by `factor` each poll up to `max_interval` seconds.
+
+    Each interval is randomly adjusted by up to `jitter` (a fraction of the
+    interval) so that many processes polling at once spread out their
+    requests. The adjustment depends only on the poll number, so asking for
+    the same interval twice gives the same answer."""
+
+    def __init__(
+        self,
+        fast_polls: int = 3,
+        factor: float = 1.5,
+        max_interval: float = 30,
+        jitter: float = 0.1,
+    ):
+        self.fast_polls = fast_polls
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self._seed = uuid.uuid4().hex
+
+    def get_interval(self, poll_count: int, initial_interval: float) -> float:
+        if poll_count <= self.fast_polls:
+            return initial_interval
+
+        # Never poll faster than the caller asked for
+        max_interval = max(self.max_interval, initial_interval)
+        interval = initial_interval * self.factor ** (poll_count - self.fast_polls)
+        if self.jitter:
+            rand = random.Random(f"{self._seed}:{poll_count}")
+            interval *= 1 + rand.uniform(-self.jitter, self.jitter)
+        return min(interval, max_interval)
+
+
+class PollingOptions(BaseModel):
+    strategy: T.Literal["exponential", "linear", "fixed"] = "exponential"
+    fast_polls: int = Field(3, ge=0)
+    factor: float = Field(1.5, ge=1)
+    max_interval: float = Field(30, gt=0)
+    jitter: float = Field(0.1, ge=0, lt=1)
+
+    class Config:
+        extra = Extra.forbid
+
+
+def get_polling_strategy(options: T.Optional[dict] = None) -> PollingStrategy:
+    """Create a polling strategy from the `polling` option of a task or flow.
+
+    Raises pydantic.ValidationError if the options are not valid."""
+    parsed = PollingOptions.parse_obj(options or {})
+    if parsed.strategy == "fixed":
+        return FixedPollingStrategy()
+    elif parsed.strategy == "linear":
+        return LinearPollingStrategy()
+    return ExponentialPollingStrategy(
+        fast_polls=parsed.fast_polls,
+        factor=parsed.factor,
+        max_interval=parsed.max_interval,
+        jitter=parsed.jitter,
+    )
+
+
+class PollStats:
+    """Counts polls and the time spent waiting between them.
+
+    `wasted_wait_s` is the time spent in the last wait before each operation
+    was found to be complete. It is an upper bound on how much sooner the
+    result could have been noticed with more frequent polling."""
+
+    def __init__(self):
+        self.polls = 0
+        self.wait_s = 0.0
+        self.wasted_wait_s = 0.0
+        self._last_wait_s = 0.0
+
+    def record_poll(self):
+        self.polls += 1
+
+    def record_wait(self, seconds: float):
+        self.wait_s += seconds
+        self._last_wait_s = seconds
+
+    def record_complete(self):
+        self.wasted_wait_s += self._last_wait_s
+        self._last_wait_s = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "poll_count": self.polls,
+            "wait_s": round(self.wait_s, 3),
+            "wasted_wait_s": round(self.wasted_wait_s, 3),
+        }
@@ -12,6 +12,8 @@ from pydantic import ValidationError
 
 from cumulusci.core.exceptions import CumulusCIException, TaskOptionsError
 from cumulusci.core.source_transforms.transforms import (
+    BundleStaticResourcesOptions,
+    BundleStaticResourcesTransform,
     CleanMetaXMLTransform,
     FindReplaceIdAPI,
     FindReplaceTransform,
@@ -22,6 +24,7 @@ from cumulusci.core.source_transforms.transforms import (
     SourceTransformSpec,
     StripUnwantedComponentsOptions,
     StripUnwantedComponentTransform,
+    apply_streaming_transforms,
 )
 from cumulusci.salesforce_api.package_zip import MetadataPackageZipBuilder
 from cumulusci.utils import temporary_dir
@@ -297,6 +300,97 @@ def test_remove_feature_parameters__inactive(task_context):
     )
 
 
+def test_streaming_transforms__single_pass(task_context):
+    xml_data = """<?xml version="1.0" encoding="UTF-8"?>
+<ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
+    <apiVersion>56.0</apiVersion>
+    <packageVersions>
+        <namespace>npe01</namespace>
+    </packageVersions>
+</ApexClass>
+"""
+    xml_data_clean = """<ApexClass xmlns="http://soap.sforce.com/2006/04/metadata">
+    <apiVersion>56.0</apiVersion>
+    </ApexClass>"""
+
+    with mock.patch(
+        "cumulusci.salesforce_api.package_zip.apply_streaming_transforms",
+        wraps=apply_streaming_transforms,
+    ) as apply:
+        builder = MetadataPackageZipBuilder.from_zipfile(
+            ZipFileSpec(
+                {
+                    Path("classes") / "___NAMESPACE___Foo.cls": "%%%NAMESPACE%%%foo",
+                    Path("classes") / "___NAMESPACE___Foo.cls-meta.xml": xml_data,
+                    Path("featureParameters") / "blah.featureParameterInteger": "foo",
+                    Path("featureParameters") / "binary": b"\xFF\xFF",
+                    Path("staticresources") / "binary": b"\xFF\xFF",
+                }
+            ).as_zipfile(),
+            options={
+                "namespace_inject": "ns",
+                "unmanaged": False,
+                "package_type": "Unlocked",
+            },
+            transforms=[
+                FindReplaceTransform(
+                    FindReplaceTransformOptions.parse_obj(
+                        {"patterns": [{"find": "foo", "replace": "bar"}]}
+                    )
+                )
+            ],
+            context=task_context,
+        )
+
+    apply.assert_called_once()
+    assert [type(t) for t in apply.call_args[0][1]] == [
+        FindReplaceTransform,
+        NamespaceInjectionTransform,
+        CleanMetaXMLTransform,
+        RemoveFeatureParametersTransform,
+    ]
+    assert (
+        ZipFileSpec(
+            {
+                Path("classes") / "ns__Foo.cls": "ns__bar",
+                Path("classes") / "ns__Foo.cls-meta.xml": xml_data_clean,
+                Path("staticresources") / "binary": b"\xFF\xFF",
+            }
+        )
+        == builder.zf
+    )
+
+
+def test_streaming_transforms__split_by_other_transforms(task_context):
+    zf = ZipFileSpec({Path("classes") / "Foo.cls": "foo"}).as_zipfile()
+    find_replace = FindReplaceTransform(
+        FindReplaceTransformOptions.parse_obj(
+            {"patterns": [{"find": "foo", "replace": "bar"}]}
+        )
+    )
+    strip = StripUnwantedComponentTransform(
+        StripUnwantedComponentsOptions.parse_obj({"package_xml": "package.xml"})
+    )
+
+    with (
+        mock.patch(
+            "cumulusci.salesforce_api.package_zip.apply_streaming_transforms",
+            wraps=apply_streaming_transforms,
+        ) as apply,
+        mock.patch.object(
+            strip, "process", side_effect=lambda zf, ctx: zf
+        ) as strip_process,
+    ):
+        MetadataPackageZipBuilder.from_zipfile(
+            zf, transforms=[find_replace, strip], context=task_context
+        )
+
+    # The user transform and the default transforms are separated by
+    # a whole-package transform, so they cannot share a pass.
+    assert apply.call_count == 2
+    strip_process.assert_called_once()
+
+
 def test_bundle_static_resources(task_context):
     xml_data = """<?xml version="1.0" encoding="UTF-8"?>
 <Package xmlns="http://soap.sforce.com/2006/04/metadata">
@@ -1089,3 +1183,26 @@ def test_strip_unwanted_files(task_context):
             )
             == builder.zf
         )
+
+
+def test_cache_key__external_files(task_context, tmp_path):
+    (tmp_path / "resources").mkdir()
+    (tmp_path / "resources" / "foo.js").write_text("foo")
+    (tmp_path / "package.xml").write_text("<Package />")
+    bundle = BundleStaticResourcesTransform(
+        BundleStaticResourcesOptions(static_resource_path=str(tmp_path / "resources"))
+    )
+    strip = StripUnwantedComponentTransform(
+        StripUnwantedComponentsOptions(package_xml=str(tmp_path / "package.xml"))
+    )
+    bundle_key = bundle.cache_key(task_context)
+    strip_key = strip.cache_key(task_context)
+
+    assert bundle.cache_key(task_context) == bundle_key
+    assert strip.cache_key(task_context) == strip_key
+
+    (tmp_path / "resources" / "foo.js").write_text("bar")
+    (tmp_path / "package.xml").write_text("<Package></Package>")
+
+    assert bundle.cache_key(task_context) != bundle_key
+    assert strip.cache_key(task_context) != strip_key
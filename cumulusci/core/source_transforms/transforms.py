@@ -1,6 +1,6 @@
 import abc
-import functools
 import io
+import json
 import os
 import re
 import shutil
@@ -17,15 +17,15 @@ from cumulusci.core.enums import StrEnum
 from cumulusci.core.exceptions import CumulusCIException, TaskOptionsError
 from cumulusci.tasks.metadata.package import RemoveSourceComponents
 from cumulusci.utils import (
+    META_XML_CLEAN_DIRS,
     cd,
     inject_namespace,
     strip_namespace,
     temporary_dir,
     tokenize_namespace,
-    zip_clean_metaxml,
 )
-from cumulusci.utils.xml import metadata_tree
-from cumulusci.utils.ziputils import process_text_in_zipfile
+from cumulusci.utils.xml import metadata_tree, remove_xml_element_string
+from cumulusci.utils.ziputils import hash_directory_contents
 
 
 class SourceTransform(abc.ABC):
@@ -41,6 +41,78 @@ class SourceTransform(abc.ABC):
     def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
         ...
 
+    def cache_key(self, context: TaskContext) -> str:
+        """Return a string which changes whenever the output of this transform
+        could change for the same input. Used to key cached deployment packages."""
+        options = getattr(self, "options", None)
+        return json.dumps(
+            {
+                "transform": self.identifier,
+                "options": options.dict() if options is not None else None,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+
+class StreamingSourceTransform(SourceTransform):
+    """Abstract base class for a transformation which is applied to each file
+    in a deployment package independently.
+
+    Consecutive streaming transforms are applied together by
+    `apply_streaming_transforms`, so that each file in the package is read,
+    decoded, and written only once no matter how many of them there are."""
+
+    def start(self, context: TaskContext):
+        """Called once before any files are processed."""
+
+    def include_file(self, name: str, context: TaskContext) -> bool:
+        """Return False to omit a file from the package."""
+        return True
+
+    def process_file(
+        self, name: str, content: str, context: TaskContext
+    ) -> T.Tuple[str, str]:
+        """Return a (possibly modified) name and content for a file.
+
+        Only called for files that can be decoded as UTF-8."""
+        return name, content
+
+    def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
+        return apply_streaming_transforms(zf, [self], context)
+
+
+def apply_streaming_transforms(
+    zf: ZipFile,
+    transforms: T.Sequence[StreamingSourceTransform],
+    context: TaskContext,
+) -> ZipFile:
+    """Apply a sequence of streaming transforms in a single pass over a zip file.
+
+    Returns a new zip file."""
+    for transform in transforms:
+        transform.start(context)
+
+    zip_dest = ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED)
+    for name in zf.namelist():
+        content = zf.read(name)
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            # Probably a binary file; don't change it
+            text = None
+
+        for transform in transforms:
+            if not transform.include_file(name, context):
+                break
+            if text is not None:
+                name, text = transform.process_file(name, text, context)
+        else:
+            # writestr handles either bytes or text, and will implicitly encode text as utf-8
+            zip_dest.writestr(name, content if text is None else text)
+    zf.close()
+    return zip_dest
+
 
 class SourceTransformSpec(BaseModel):
     transform: str
@@ -100,7 +172,7 @@ class NamespaceInjectionOptions(BaseModel):
     namespaced_org: bool = False
 
 
-class NamespaceInjectionTransform(SourceTransform):
+class NamespaceInjectionTransform(StreamingSourceTransform):
     """Source transform that applies namespace injection, stripping, and tokenization."""
 
     options_model = NamespaceInjectionOptions
@@ -111,22 +183,13 @@ class NamespaceInjectionTransform(SourceTransform):
     def __init__(self, options: NamespaceInjectionOptions):
         self.options = options
 
-    def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
+    def start(self, context: TaskContext):
         if self.options.namespace_tokenize:
             context.logger.info(
                 f"Tokenizing namespace prefix {self.options.namespace_tokenize}__"
             )
-            zf = process_text_in_zipfile(
-                zf,
-                functools.partial(
-                    tokenize_namespace,
-                    namespace=self.options.namespace_tokenize,
-                    logger=context.logger,
-                ),
-            )
         if self.options.namespace_inject:
-            managed = not self.options.unmanaged
-            if managed:
+            if not self.options.unmanaged:
                 context.logger.info(
                     "Replacing namespace tokens from metadata with namespace prefix  "
                     f"{self.options.namespace_inject}__"
@@ -135,81 +198,93 @@ class NamespaceInjectionTransform(SourceTransform):
                 context.logger.info(
                     "Stripping namespace tokens from metadata for unmanaged deployment"
                 )
-            zf = process_text_in_zipfile(
-                zf,
-                functools.partial(
-                    inject_namespace,
-                    namespace=self.options.namespace_inject,
-                    managed=managed,
-                    namespaced_org=self.options.namespaced_org,
-                    logger=context.logger,
-                ),
-            )
         if self.options.namespace_strip:
             context.logger.info("Stripping namespace tokens from metadata")
-            zf = process_text_in_zipfile(
-                zf,
-                functools.partial(
-                    strip_namespace,
-                    namespace=self.options.namespace_strip,
-                    logger=context.logger,
-                ),
-            )
 
-        return zf
+    def process_file(
+        self, name: str, content: str, context: TaskContext
+    ) -> T.Tuple[str, str]:
+        if self.options.namespace_tokenize:
+            name, content = tokenize_namespace(
+                name,
+                content,
+                namespace=self.options.namespace_tokenize,
+                logger=context.logger,
+            )
+        if self.options.namespace_inject:
+            name, content = inject_namespace(
+                name,
+                content,
+                namespace=self.options.namespace_inject,
+                managed=not self.options.unmanaged,
+                namespaced_org=self.options.namespaced_org,
+                logger=context.logger,
+            )
+        if self.options.namespace_strip:
+            name, content = strip_namespace(
+                name,
+                content,
+                namespace=self.options.namespace_strip,
+                logger=context.logger,
+            )
+        return name, content
 
 
-class RemoveFeatureParametersTransform(SourceTransform):
+class RemoveFeatureParametersTransform(StreamingSourceTransform):
     """Source transform that removes Feature Parameters. Intended for use on Unlocked Package builds."""
 
     options_model = None
 
     identifier = "remove_feature_parameters"
 
-    def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
-        package_xml = None
-        zip_dest = ZipFile(io.BytesIO(), "w", zipfile.ZIP_DEFLATED)
-        for name in zf.namelist():
-            if name == "package.xml":
-                package_xml = zf.open(name)
-            elif name.startswith("featureParameters/"):
-                # skip feature parameters
-                context.logger.info(
-                    f"Skipping {name} because Feature Parameters are omitted."
-                )
-            else:
-                content = zf.read(name)
-                zip_dest.writestr(name, content)
+    def include_file(self, name: str, context: TaskContext) -> bool:
+        if name.startswith("featureParameters/"):
+            context.logger.info(
+                f"Skipping {name} because Feature Parameters are omitted."
+            )
+            return False
+        return True
 
-        # Remove from package.xml
-        if package_xml is not None:
-            package = metadata_tree.parse(package_xml)
-            for mdtype in (
-                "FeatureParameterInteger",
-                "FeatureParameterBoolean",
-                "FeatureParameterDate",
-            ):
-                section = package.find("types", name=mdtype)
-                if section is not None:
-                    package.remove(section)
-            package_xml = package.tostring(xml_declaration=True)
-            zip_dest.writestr("package.xml", package_xml)
+    def process_file(
+        self, name: str, content: str, context: TaskContext
+    ) -> T.Tuple[str, str]:
+        if name != "package.xml":
+            return name, content
 
-        return zip_dest
+        # Remove from package.xml
+        package = metadata_tree.fromstring(content.encode("utf-8"))
+        for mdtype in (
+            "FeatureParameterInteger",
+            "FeatureParameterBoolean",
+            "FeatureParameterDate",
+        ):
+            section = package.find("types", name=mdtype)
+            if section is not None:
+                package.remove(section)
+        return name, package.tostring(xml_declaration=True)
 
 
-class CleanMetaXMLTransform(SourceTransform):
+class CleanMetaXMLTransform(StreamingSourceTransform):
     """Source transform that cleans *-meta.xml files of references to specific package versions."""
 
     options_model = None
 
     identifier = "clean_meta_xml"
 
-    def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
+    def start(self, context: TaskContext):
         context.logger.info(
             "Cleaning meta.xml files of packageVersion elements for deploy"
         )
-        return zip_clean_metaxml(zf)
+
+    def process_file(
+        self, name: str, content: str, context: TaskContext
+    ) -> T.Tuple[str, str]:
+        if name.startswith(META_XML_CLEAN_DIRS) and name.endswith("-meta.xml"):
+            content_bytes = content.encode("utf-8")
+            clean_content = remove_xml_element_string("packageVersions", content_bytes)
+            if clean_content != content_bytes:
+                content = clean_content.decode("utf-8")
+        return name, content
 
 
 class BundleStaticResourcesOptions(BaseModel):
@@ -226,6 +301,14 @@ class BundleStaticResourcesTransform(SourceTransform):
     def __init__(self, options: BundleStaticResourcesOptions):
         self.options = options
 
+    def cache_key(self, context: TaskContext) -> str:
+        return json.dumps(
+            [
+                super().cache_key(context),
+                hash_directory_contents(self.options.static_resource_path),
+            ]
+        )
+
     def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
         path = os.path.realpath(self.options.static_resource_path)
 
@@ -404,7 +487,7 @@ class FindReplaceTransformOptions(BaseModel):
     ]
 
 
-class FindReplaceTransform(SourceTransform):
+class FindReplaceTransform(StreamingSourceTransform):
     """Source transform that applies one or more find-and-replace patterns."""
 
     options_model = FindReplaceTransformOptions
@@ -415,76 +498,89 @@ class FindReplaceTransform(SourceTransform):
     def __init__(self, options: FindReplaceTransformOptions):
         self.options = options
 
-    def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
+    def cache_key(self, context: TaskContext) -> str:
+        # Replacement values may come from the environment or the org,
+        # so resolve them rather than relying on the spec alone.
+        return json.dumps(
+            {
+                "transform": self.identifier,
+                "patterns": [
+                    {**spec.dict(), "replace": spec.get_replace_string(context)}
+                    for spec in self.options.patterns
+                ],
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    @staticmethod
+    def _transform_xpath(expression):
         # To handle xpath with namespaces, without
-        def transform_xpath(expression):
-            predicate_pattern = re.compile(r"\[.*?\]")
-            parts = expression.split("/")
-            transformed_parts = []
-
-            for part in parts:
-                if part:
-                    predicates = predicate_pattern.findall(part)
-                    tag = predicate_pattern.sub("", part)
-                    transformed_part = '/*[local-name()="' + tag + '"]'
-                    for predicate in predicates:
-                        transformed_part += predicate
-                    transformed_parts.append(transformed_part)
-            transformed_expression = "".join(transformed_parts)
-
-            return transformed_expression
-
-        def process_file(filename: str, content: str) -> T.Tuple[str, str]:
-            path = Path(filename)
-            for spec in self.options.patterns:
-                if not spec.paths or any(
-                    parent in path.parents for parent in spec.paths
-                ):
-                    try:
-                        # See if the content is an xml file
-                        content_bytes = content.encode("utf-8")
-                        root = ET.fromstring(content_bytes)
-
-                        # See if content has an xml declaration
-                        has_xml_declaration = content.strip().startswith("<?xml")
-
-                        # If find, we do not want to modify the tags in xml file, only the content
-                        if spec.find:
-                            stack = [root]
-                            while stack:
-                                element = stack.pop()
-                                if element.text and spec.find in element.text:
-                                    element.text = element.text.replace(
-                                        spec.find, spec.get_replace_string(context)
-                                    )
-                                stack.extend(element)
-                        # Modify the element given by xpath
-                        elif spec.xpath:
-                            transformed_xpath = transform_xpath(spec.xpath)
-                            elements_to_replace = root.xpath(transformed_xpath)
-                            for element in elements_to_replace:
-                                element.text = spec.get_replace_string(context)
-
-                        # Add xml declaration back to file, if it initally had xml declaration
-                        content = ET.tostring(
-                            root, encoding="utf-8", xml_declaration=has_xml_declaration
-                        ).decode("utf-8")
-
-                    except ET.XMLSyntaxError:
-                        if spec.find:
-                            content = content.replace(
-                                spec.find, spec.get_replace_string(context)
-                            )
-                        else:
-                            continue
-                    except ET.XPathError as e:
-                        raise ET.XPathError(
-                            f"An exception of type {type(e).__name__} occurred: {e} \nKindly check the xpath given"
+        predicate_pattern = re.compile(r"\[.*?\]")
+        parts = expression.split("/")
+        transformed_parts = []
+
+        for part in parts:
+            if part:
+                predicates = predicate_pattern.findall(part)
+                tag = predicate_pattern.sub("", part)
+                transformed_part = '/*[local-name()="' + tag + '"]'
+                for predicate in predicates:
+                    transformed_part += predicate
+                transformed_parts.append(transformed_part)
+        transformed_expression = "".join(transformed_parts)
+
+        return transformed_expression
+
+    def process_file(
+        self, filename: str, content: str, context: TaskContext
+    ) -> T.Tuple[str, str]:
+        path = Path(filename)
+        for spec in self.options.patterns:
+            if not spec.paths or any(parent in path.parents for parent in spec.paths):
+                try:
+                    # See if the content is an xml file
+                    content_bytes = content.encode("utf-8")
+                    root = ET.fromstring(content_bytes)
+
+                    # See if content has an xml declaration
+                    has_xml_declaration = content.strip().startswith("<?xml")
+
+                    # If find, we do not want to modify the tags in xml file, only the content
+                    if spec.find:
+                        stack = [root]
+                        while stack:
+                            element = stack.pop()
+                            if element.text and spec.find in element.text:
+                                element.text = element.text.replace(
+                                    spec.find, spec.get_replace_string(context)
+                                )
+                            stack.extend(element)
+                    # Modify the element given by xpath
+                    elif spec.xpath:
+                        transformed_xpath = self._transform_xpath(spec.xpath)
+                        elements_to_replace = root.xpath(transformed_xpath)
+                        for element in elements_to_replace:
+                            element.text = spec.get_replace_string(context)
+
+                    # Add xml declaration back to file, if it initally had xml declaration
+                    content = ET.tostring(
+                        root, encoding="utf-8", xml_declaration=has_xml_declaration
+                    ).decode("utf-8")
+
+                except ET.XMLSyntaxError:
+                    if spec.find:
+                        content = content.replace(
+                            spec.find, spec.get_replace_string(context)
                         )
+                    else:
+                        continue
+                except ET.XPathError as e:
+                    raise ET.XPathError(
+                        f"An exception of type {type(e).__name__} occurred: {e} \nKindly check the xpath given"
+                    )
 
-            return (filename, content)
-
-        return process_text_in_zipfile(zf, process_file)
+        return (filename, content)
 
 
 class StripUnwantedComponentsOptions(BaseModel):
@@ -499,6 +595,12 @@ class StripUnwantedComponentTransform(SourceTransform):
     def __init__(self, options: StripUnwantedComponentsOptions):
         self.options = options
 
+    def cache_key(self, context: TaskContext) -> str:
+        package_xml_path = Path(self.options.package_xml).expanduser()
+        return json.dumps(
+            [super().cache_key(context), package_xml_path.read_text(encoding="utf-8")]
+        )
+
     def process(self, zf: ZipFile, context: TaskContext) -> ZipFile:
         package_xml_path = os.path.abspath(os.path.expanduser(self.options.package_xml))
 
@@ -25,6 +25,7 @@ from cumulusci.core.exceptions import (
     TaskRequiresSalesforceOrg,
 )
 from cumulusci.core.flowrunner import FlowCoordinator, StepSpec, StepVersion
+from cumulusci.core.polling import PollingStrategy, PollStats, get_polling_strategy
 from cumulusci.utils import cd
 from cumulusci.utils.logging import redirect_output_to_logger
 from cumulusci.utils.metaprogramming import classproperty
@@ -68,7 +69,10 @@ class BaseTask:
     poll_complete: bool
     poll_count: int
     poll_interval_level: int
-    poll_interval_s: int
+    poll_interval_s: float
+    poll_initial_interval_s: float
+    poll_strategy: PollingStrategy
+    poll_stats: PollStats
 
     def __init__(
         self,
@@ -79,13 +83,17 @@ class BaseTask:
         name: Optional[str] = None,
         stepnum: Optional[StepVersion] = None,
         logger: Optional[logging.Logger] = None,
+        refresh_credentials: bool = True,
         **kwargs,
     ):
         self.project_config = project_config
         self.task_config = task_config
         self.org_config = org_config
+        # False if the caller has just refreshed the org's credentials
+        self.refresh_credentials = refresh_credentials
 
         self._reset_poll()
+        self.poll_stats = PollStats()
 
         # dict of return_values that can be used by task callers
         self.return_values = {}
@@ -105,6 +113,7 @@ class BaseTask:
             self._init_logger()
 
         self._init_options(kwargs)
+        self._init_polling()
         self._validate_options()
 
     def _init_logger(self):
@@ -158,7 +167,7 @@ class BaseTask:
 
         if self.Options:
             try:
-                specials = ["debug_before", "debug_after", "no_prompt"]
+                specials = ["debug_before", "debug_after", "no_prompt", "polling"]
                 options_without_specials = {
                     opt: val for opt, val in self.options.items() if opt not in specials
                 }
@@ -183,6 +192,15 @@ class BaseTask:
                     f"Task Options Error: Error in '{self.options}' option: '{e}'"
                 )
 
+    def _init_polling(self):
+        """Initializes self.poll_strategy from the `polling` option"""
+        # Some tasks skip option initialization altogether
+        options = getattr(self, "options", None) or {}
+        try:
+            self.poll_strategy = get_polling_strategy(options.get("polling"))
+        except ValidationError as e:
+            raise TaskOptionsError(f"Invalid polling option: {e}") from e
+
     def _validate_options(self):
         missing_required = []
         for name, config in list(self.task_options.items()):
@@ -210,7 +228,8 @@ class BaseTask:
                 "Use org default <name> to set a default org "
                 "or pass the org name with the --org option"
             )
-        self._update_credentials()
+        if self.refresh_credentials:
+            self._update_credentials()
         self._init_task()
 
         with stacked_task(self):
@@ -224,6 +243,8 @@ class BaseTask:
                 ):
                     self._log_begin()
                     self.result = self._run_task()
+                    if self.poll_stats.polls and isinstance(self.return_values, dict):
+                        self.return_values["polling"] = self.poll_stats.as_dict()
                     return self.return_values
 
     def _run_task(self) -> Any:
@@ -271,15 +292,20 @@ class BaseTask:
         self.poll_count = 0
         self.poll_interval_level = 0
         self.poll_interval_s = 1
+        self.poll_initial_interval_s = 1
 
     def _poll(self):
         """poll for a result in a loop"""
+        self.poll_initial_interval_s = self.poll_interval_s
         while True:
             self.poll_count += 1
+            self.poll_stats.record_poll()
             self._poll_action()
             if self.poll_complete:
+                self.poll_stats.record_complete()
                 break
             time.sleep(self.poll_interval_s)
+            self.poll_stats.record_wait(self.poll_interval_s)
             self._poll_update_interval()
 
     def _poll_action(self):
@@ -291,13 +317,13 @@ class BaseTask:
 
     def _poll_update_interval(self):
         """update the polling interval to be used next iteration"""
-        # Increase by 1 second every 3 polls
-        if self.poll_count // 3 > self.poll_interval_level:
+        interval = self.poll_strategy.get_interval(
+            self.poll_count + 1, self.poll_initial_interval_s
+        )
+        if int(interval) > int(self.poll_interval_s):
             self.poll_interval_level += 1
-            self.poll_interval_s += 1
-            self.logger.info(
-                "Increased polling interval to %d seconds", self.poll_interval_s
-            )
+            self.logger.info("Increased polling interval to %d seconds", interval)
+        self.poll_interval_s = interval
 
     def freeze(self, step: StepSpec) -> List[dict]:
         ui_step = {
@@ -283,6 +283,38 @@ class TestSimpleTestFlowCoordinator(AbstractFlowCoordinatorTest):
         flow = FlowCoordinator(self.project_config, flow_config)
         assert flow.steps[0].task_config["options"]["foo"] == "bar"
 
+    def test_init__polling(self):
+        self.project_config.config["flows"]["nested_flow"]["polling"] = {
+            "strategy": "fixed"
+        }
+        self.project_config.config["flows"]["test"] = {
+            "description": "Run a flow with a polling configuration",
+            "polling": {"max_interval": 10},
+            "steps": {
+                1: {"task": "pass_name"},
+                2: {"task": "pass_name", "options": {"polling": {"jitter": 0}}},
+                3: {"flow": "nested_flow"},
+            },
+        }
+        flow_config = self.project_config.get_flow("test")
+        flow = FlowCoordinator(self.project_config, flow_config)
+
+        assert [step.task_config["options"]["polling"] for step in flow.steps] == [
+            {"max_interval": 10},
+            {"jitter": 0},
+            {"max_interval": 10},
+        ]
+
+    def test_init__nested_polling(self):
+        self.project_config.config["flows"]["nested_flow"]["polling"] = {
+            "strategy": "fixed"
+        }
+        flow_config = self.project_config.get_flow("nested_flow_2")
+        flow = FlowCoordinator(self.project_config, flow_config)
+
+        assert "polling" not in flow.steps[0].task_config["options"]
+        assert flow.steps[1].task_config["options"]["polling"] == {"strategy": "fixed"}
+
     def test_init__bad_classpath(self):
         self.project_config.config["tasks"] = {
             "classless": {
@@ -44,6 +44,7 @@ from cumulusci.core.github import (
     format_github3_exception,
     get_auth_from_service,
     get_commit,
+    get_github_adapter,
     get_github_api,
     get_github_api_for_repo,
     get_latest_prerelease,
@@ -67,6 +68,7 @@ from cumulusci.core.github import (
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.tasks.github.tests.util_github_api import GithubApiTestMixin
 from cumulusci.tasks.release_notes.tests.utils import MockUtil
+from cumulusci.utils.http.cache import CachingHTTPAdapter
 
 
 class TestGithub(GithubApiTestMixin):
@@ -125,6 +127,29 @@ class TestGithub(GithubApiTestMixin):
 
             assert 1 == _make_request.call_count
 
+    @mock.patch("cumulusci.core.github.caching_adapter", None)
+    def test_get_github_adapter__cache(self, tmp_path):
+        with (
+            mock.patch.dict(
+                os.environ,
+                {
+                    "CUMULUSCI_GITHUB_CACHE": "True",
+                    "CUMULUSCI_GITHUB_CACHE_MAX_MB": "5",
+                },
+            ),
+            mock.patch("pathlib.Path.home", return_value=tmp_path),
+        ):
+            gh = get_github_api("TestUser", "TestPass")
+            cache_adapter = gh.session.get_adapter("https://")
+
+            assert isinstance(cache_adapter, CachingHTTPAdapter)
+            assert cache_adapter.cache_dir == tmp_path / ".cumulusci" / "github_cache"
+            assert cache_adapter.max_size == 5 * 1024 * 1024
+            assert 502 in cache_adapter.max_retries.status_forcelist
+            assert get_github_adapter() is cache_adapter
+
+        assert get_github_adapter() is github.adapter
+
     def test_github_api_retries(self, mock_http_response):
         gh = get_github_api("TestUser", "TestPass")
         adapter = gh.session.get_adapter("http://")
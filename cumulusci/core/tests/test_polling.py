@@ -0,0 +1,63 @@
+import pytest
+from pydantic import ValidationError
+
+from cumulusci.core.polling import (
+    ExponentialPollingStrategy,
+    FixedPollingStrategy,
+    LinearPollingStrategy,
+    PollStats,
+    get_polling_strategy,
+)
+
+
+def test_get_polling_strategy():
+    assert isinstance(get_polling_strategy(), ExponentialPollingStrategy)
+    assert isinstance(get_polling_strategy({"strategy": "fixed"}), FixedPollingStrategy)
+    assert isinstance(
+        get_polling_strategy({"strategy": "linear"}), LinearPollingStrategy
+    )
+
+    strategy = get_polling_strategy({"fast_polls": 0, "factor": 2, "jitter": 0})
+    assert [strategy.get_interval(n, 1) for n in range(1, 7)] == [2, 4, 8, 16, 30, 30]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"factor": 0.5}, {"jitter": 1}, {"max_interval": 0}, {"unknown": True}],
+)
+def test_get_polling_strategy__invalid(options):
+    with pytest.raises(ValidationError):
+        get_polling_strategy(options)
+
+
+def test_linear():
+    strategy = LinearPollingStrategy()
+    assert [strategy.get_interval(n, 1) for n in range(1, 8)] == [1, 1, 1, 2, 2, 2, 3]
+
+
+def test_exponential__initial_interval_above_ceiling():
+    strategy = ExponentialPollingStrategy(max_interval=5)
+    assert strategy.get_interval(10, 10) == 10
+
+
+def test_exponential__jitter():
+    strategy = ExponentialPollingStrategy(fast_polls=0, factor=1, jitter=0.5)
+    intervals = [strategy.get_interval(n, 10) for n in range(1, 50)]
+
+    assert all(5 <= interval <= 15 for interval in intervals)
+    assert len(set(intervals)) > 1
+    assert intervals == [strategy.get_interval(n, 10) for n in range(1, 50)]
+
+
+def test_poll_stats():
+    stats = PollStats()
+    stats.record_poll()
+    stats.record_wait(1)
+    stats.record_poll()
+    stats.record_wait(2.5)
+    stats.record_poll()
+    stats.record_complete()
+    stats.record_poll()
+    stats.record_complete()
+
+    assert stats.as_dict() == {"poll_count": 4, "wait_s": 3.5, "wasted_wait_s": 2.5}
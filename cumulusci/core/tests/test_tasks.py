@@ -31,6 +31,17 @@ class _SfdcTask(BaseTask):
         return -1
 
 
+class _TaskPolls(BaseTask):
+    polls_until_complete = 1
+
+    def _run_task(self):
+        self._poll()
+
+    def _poll_action(self):
+        if self.poll_count >= self.polls_until_complete:
+            self.poll_complete = True
+
+
 class _TaskWithOutput(BaseTask):
     def _run_task(self):
         print("1", end="")
@@ -207,6 +218,23 @@ class TestBaseTaskCallable:
         task()
         assert ORG_ID not in caplog.text
 
+    @mock.patch.object(_SfdcTask, "_update_credentials")
+    def test_update_credentials(self, update_credentials):
+        _SfdcTask(self.project_config, self.task_config, self.org_config)()
+        update_credentials.assert_called_once()
+
+    @mock.patch.object(_SfdcTask, "_update_credentials")
+    def test_update_credentials__already_refreshed(self, update_credentials):
+        task = _SfdcTask(
+            self.project_config,
+            self.task_config,
+            self.org_config,
+            refresh_credentials=False,
+        )
+        task()
+        update_credentials.assert_not_called()
+        assert "refresh_credentials" not in task.options
+
     def test_run_task(self):
         task = BaseTask(self.project_config, self.task_config, self.org_config)
         with pytest.raises(NotImplementedError):
@@ -228,7 +256,11 @@ class TestBaseTaskCallable:
 
     @mock.patch("cumulusci.core.tasks.time.sleep", mock.Mock())
     def test_poll(self):
-        task = BaseTask(self.project_config, self.task_config, self.org_config)
+        task = BaseTask(
+            self.project_config,
+            TaskConfig({"options": {"polling": {"strategy": "linear"}}}),
+            self.org_config,
+        )
 
         task.i = 0
 
@@ -243,6 +275,67 @@ class TestBaseTaskCallable:
         assert task.poll_interval_level == 1
         assert task.poll_interval_s == 2
 
+    @mock.patch("cumulusci.core.tasks.time.sleep")
+    def test_poll__exponential(self, sleep):
+        task = _TaskPolls(
+            self.project_config,
+            TaskConfig({"options": {"polling": {"max_interval": 4, "jitter": 0}}}),
+            self.org_config,
+        )
+        task.polls_until_complete = 8
+
+        assert task() == {
+            "polling": {"poll_count": 8, "wait_s": 14.125, "wasted_wait_s": 4}
+        }
+        assert [call.args[0] for call in sleep.call_args_list] == [
+            1,
+            1,
+            1,
+            1.5,
+            2.25,
+            3.375,
+            4,
+        ]
+
+    @mock.patch("cumulusci.core.tasks.time.sleep")
+    def test_poll__jitter(self, sleep):
+        task = _TaskPolls(self.project_config, self.task_config, self.org_config)
+        task.polls_until_complete = 20
+        task()
+
+        intervals = [call.args[0] for call in sleep.call_args_list]
+        assert intervals[:3] == [1, 1, 1]
+        assert max(intervals) <= 30
+        # The default ceiling is reached and then jittered below it
+        assert intervals[-1] >= 27
+        assert task.poll_strategy.get_interval(5, 1) == intervals[4]
+
+    def test_poll__fixed(self):
+        task = _TaskPolls(
+            self.project_config,
+            TaskConfig({"options": {"polling": {"strategy": "fixed"}}}),
+            self.org_config,
+        )
+        task.poll_interval_s = 2
+        task.polls_until_complete = 10
+        with mock.patch("cumulusci.core.tasks.time.sleep") as sleep:
+            task()
+
+        assert {call.args[0] for call in sleep.call_args_list} == {2}
+        assert task.return_values["polling"]["wait_s"] == 18
+
+    def test_poll__bad_polling_option(self):
+        with pytest.raises(TaskOptionsError, match="Invalid polling option"):
+            BaseTask(
+                self.project_config,
+                TaskConfig({"options": {"polling": {"strategy": "sometimes"}}}),
+                self.org_config,
+            )
+
+    def test_no_polling_return_value_without_polls(self):
+        task = _TaskHasResult(self.project_config, self.task_config, self.org_config)
+        assert task() == {}
+
     def test_explicit_logger(self):
         """Verify that the logger is properly set when passed in as an argument"""
         mock_logger = mock.Mock()
@@ -0,0 +1,112 @@
+import json
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Optional
+
+from simple_salesforce import Salesforce
+from simple_salesforce.exceptions import SalesforceGeneralError
+
+from cumulusci.core.config import OrgConfig
+
+
+class DescribeCache:
+    """Cache of sObject describes.
+
+    Describes are kept in memory for the life of the cache. When an
+    `org_config` is provided they are also stored on disk, under the org's
+    orginfo cache directory, keyed by org id, API version and sObject,
+    so that later tasks can revalidate them with an `If-Modified-Since`
+    request instead of downloading them again."""
+
+    def __init__(
+        self, sf: Salesforce, org_config: Optional[OrgConfig] = None, logger=None
+    ):
+        self.sf = sf
+        self.org_config = org_config
+        self.logger = logger or getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self._global_describe = None
+        self._describes: Dict[str, dict] = {}
+
+    def describe(self) -> dict:
+        """Return the global describe. This is only cached in memory."""
+        if self._global_describe is None:
+            self._global_describe = self.sf.describe()
+        return self._global_describe
+
+    def describe_sobject(self, sobject: str) -> dict:
+        """Return the describe for an sObject."""
+        describe = self._describes.get(sobject)
+        if describe is not None:
+            self.hits += 1
+        elif self._can_use_disk_cache():
+            describe = self._describe_with_disk_cache(sobject)
+        else:
+            self.misses += 1
+            describe = getattr(self.sf, sobject).describe()
+        self._describes[sobject] = describe
+        return describe
+
+    def log_stats(self):
+        self.logger.debug(f"Describe cache: {self.hits} hits, {self.misses} misses.")
+
+    def _can_use_disk_cache(self) -> bool:
+        return bool(
+            self.org_config
+            and self.org_config.keychain
+            and self.org_config.org_id
+            and self.org_config.username
+            and self.org_config.get_domain()
+        )
+
+    def _describe_with_disk_cache(self, sobject: str) -> dict:
+        with self.org_config.get_orginfo_cache_dir(__name__) as directory:
+            directory = (
+                Path(directory.getsyspath())
+                / self.org_config.org_id
+                / f"v{self.sf.sf_version}"
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            cache_file = directory / f"{sobject}.json"
+
+            cached = None
+            if cache_file.exists():
+                try:
+                    with cache_file.open("r", encoding="utf-8") as f:
+                        cached = json.load(f)
+                    assert cached["describe"]["name"]
+                except Exception as e:
+                    self.logger.warning(
+                        f"Cannot read describe cache `{cache_file}`. Reason `{e}`."
+                    )
+                    cached = None
+
+            headers = {}
+            if cached and cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+            sobject_type = getattr(self.sf, sobject)
+            try:
+                response = sobject_type._call_salesforce(
+                    "GET", sobject_type.base_url + "describe", headers=headers
+                )
+            except SalesforceGeneralError as e:
+                if cached and e.status == 304:
+                    self.hits += 1
+                    self.logger.debug(f"Describe cache hit: {sobject}")
+                    return cached["describe"]
+                raise
+
+            self.misses += 1
+            self.logger.debug(f"Describe cache miss: {sobject}")
+            describe = response.json()
+            with cache_file.open("w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "describe": describe,
+                    },
+                    f,
+                )
+            return describe
@@ -22,6 +22,7 @@ from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
 from cumulusci.core.exceptions import ApexTestException, CumulusCIException
+from cumulusci.core.polling import PollStats, get_polling_strategy
 from cumulusci.salesforce_api import soap_envelopes
 from cumulusci.salesforce_api.exceptions import (
     MetadataApiError,
@@ -58,6 +59,11 @@ class BaseMetadataApiCall(object):
         self.task = task
         self.status = None
         self.check_num = 1
+        # Use the task's polling strategy and report polls in its stats
+        self.poll_strategy = (
+            getattr(task, "poll_strategy", None) or get_polling_strategy()
+        )
+        self.poll_stats = getattr(task, "poll_stats", None) or PollStats()
         self.api_version = (
             api_version
             if api_version
@@ -128,7 +134,7 @@ class BaseMetadataApiCall(object):
             return result[0].firstChild.nodeValue
 
     def _get_check_interval(self):
-        return self.check_interval * ((self.check_num // 3) + 1)
+        return self.poll_strategy.get_interval(self.check_num, self.check_interval)
 
     def _get_response(self):
         if not self.soap_envelope_start:
@@ -150,13 +156,18 @@ class BaseMetadataApiCall(object):
                 envelope = self._build_envelope_status()
                 headers = self._build_headers(self.soap_action_status, envelope)
                 response = self._call_mdapi(headers, envelope)
+                self.poll_stats.record_poll()
                 response = self._process_response_status(response)
+                if self.status in ["Done", "Failed"]:
+                    self.poll_stats.record_complete()
+                    break
 
                 # start increasing the check interval progressively to handle long pending jobs
                 check_interval = self._get_check_interval()
                 self.check_num += 1
 
                 time.sleep(check_interval)
+                self.poll_stats.record_wait(check_interval)
             # Fetch the final result and return
             if self.soap_envelope_result:
                 envelope = self._build_envelope_result()
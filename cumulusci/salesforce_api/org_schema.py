@@ -1,15 +1,17 @@
-import gzip
+import os
 import re
+import sqlite3
+import threading
+import time
 import typing as T
 from collections import defaultdict
-from contextlib import ExitStack, contextmanager
+from contextlib import ExitStack, closing, contextmanager
 from enum import Enum
 from logging import getLogger
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Dict, Iterable, List, NamedTuple, Optional
 
-from sqlalchemy import MetaData, create_engine, not_
+from sqlalchemy import MetaData, create_engine, event, not_
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import create_session, exc, sessionmaker
 
@@ -20,7 +22,6 @@ from cumulusci.salesforce_api.org_schema_models import (
     FileMetadata,
     SObject,
 )
-from cumulusci.utils.fileutils import FSResource
 from cumulusci.utils.http.multi_request import (
     RECOVERABLE_ERRORS,
     CompositeParallelSalesforce,
@@ -30,20 +31,91 @@ from cumulusci.utils.salesforce.count_sobjects import count_sobjects
 y2k = "Sat, 1 Jan 2000 00:00:01 GMT"
 
 
-def zip_database(tempfile: Path, schema_path: T.Union[FSResource, Path]):
-    """Compress tempfile.db to schema_path.db.gz"""
-    with tempfile.open("rb") as db:
-        with schema_path.open("wb") as fileobj:
-            with gzip.GzipFile(fileobj=fileobj, mode="w") as gzipped:
-                gzipped.write(db.read())
+# Schemas were once cached as a gzipped copy of the database
+LEGACY_SCHEMA_FILENAME = "org_schema.db.gz"
+# and then as a single database, updated in place
+SCHEMA_FILENAME = "org_schema.db"
+# Each rebuild of the cache is now written to a new file, named for when it
+# was completed, so that a database other processes have open is never
+# replaced or deleted under them. Readers use the newest.
+SCHEMA_FILENAME_PATTERN = "org_schema.*.db"
+# Seconds to wait for another process writing to the same cache
+BUSY_TIMEOUT = 30
 
 
-def unzip_database(gzipfile, outfile):
-    """Decompress schema_path.db.gz to outfile.db"""
-    with gzipfile.open("rb") as fileobj:
-        with gzip.GzipFile(fileobj=fileobj) as gzipped:
-            with open(outfile, "wb") as db:
-                db.write(gzipped.read())
+def create_schema_engine(schema_path: Path) -> Engine:
+    """Open the SQLite schema cache in place, in write-ahead-log mode"""
+    engine = create_engine(
+        f"sqlite:///{schema_path}", connect_args={"timeout": BUSY_TIMEOUT}
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_wal_mode(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return engine
+
+
+def schema_files(directory: Path) -> List[Path]:
+    """The schema caches in a directory, oldest first"""
+    return sorted(directory.glob(SCHEMA_FILENAME_PATTERN))
+
+
+def delete_file(path: Path, logger):
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:  # e.g. still open in another process on Windows
+        logger.debug(f"Cannot delete `{path}`: {e}")
+
+
+def retire_database(schema_path: Path, logger):
+    """Delete a superseded schema cache, unless another process is using it.
+
+    SQLite only lets a connection leave write-ahead-log mode when no other
+    connection has the database open, which also removes its -wal and -shm
+    files. The exclusive lock keeps other processes out until it is gone."""
+    try:
+        with closing(
+            sqlite3.connect(
+                f"{schema_path.as_uri()}?mode=rw",
+                uri=True,
+                timeout=0,
+                isolation_level=None,
+            )
+        ) as connection:
+            connection.execute("PRAGMA journal_mode=DELETE")
+            connection.execute("BEGIN EXCLUSIVE")
+            schema_path.unlink()
+    except sqlite3.OperationalError as e:  # in use, or already gone
+        logger.debug(f"Not deleting `{schema_path}`: {e}")
+    except sqlite3.DatabaseError:  # not a database, so nobody can be using it
+        delete_file(schema_path, logger)
+    except OSError as e:  # e.g. still open in another process on Windows
+        logger.debug(f"Cannot delete `{schema_path}`: {e}")
+
+
+def retire_old_databases(directory: Path, logger):
+    """Delete the schema caches that a newer one has replaced, if possible"""
+    old_files = schema_files(directory)[:-1]
+    if (directory / SCHEMA_FILENAME).exists():
+        old_files.append(directory / SCHEMA_FILENAME)
+    for schema_path in old_files:
+        retire_database(schema_path, logger)
+
+
+def install_database(new_schema_path: Path, directory: Path, logger) -> Optional[Path]:
+    """Give a complete and closed schema cache the name readers look for"""
+    schema_path = directory / f"org_schema.{time.time_ns():020d}.db"
+    try:
+        # Nothing else has the new database open, so it is safe to move
+        os.rename(new_schema_path, schema_path)
+    except OSError as e:
+        logger.warning(f"Cannot save `{schema_path}`. Reason `{e}`.")
+        delete_file(new_schema_path, logger)
+        return None
+    return schema_path
 
 
 def ignore_based_on_name(objname, patterns: T.Sequence[re.Pattern]):
@@ -116,7 +188,9 @@ class Schema:
 
     def __init__(self, engine, schema_path, filters: T.Sequence[Filters] = ()):
         self.engine = engine
-        Session = sessionmaker(bind=self.engine)
+        # Counts are only kept on the objects in memory. Flushing them would
+        # hold a write transaction on the shared cache until it is closed.
+        Session = sessionmaker(bind=self.engine, autoflush=False)
         self.session = Session()
         self.path = schema_path
         self.filters = set(filters)
@@ -151,8 +225,9 @@ class Schema:
 
     def block_writing(self):
         """After this method is called, the database can't be updated again"""
-        # changes don't get saved back to the gzip
-        # so there is no point writing to the DB
+
+        # the cache is shared by later tasks, so filtering and counts
+        # applied for this one must not be saved to it
         def closed():
             raise IOError("Database is not open for writing")
 
@@ -161,6 +236,7 @@ class Schema:
 
     def close(self):
         self.session.close()
+        self.engine.dispose()
 
     def __repr__(self):
         return f"<Schema {self.path} : {self.engine}>"
@@ -225,7 +301,11 @@ class Schema:
         return results
 
     def _populate_cache_from_describe(self, describe_objs: List["DescribeUpdate"]):
-        """Populate a schema cache from a list of describe objects."""
+        """Populate a schema cache from a list of describe objects.
+
+        The database is only written to if there are changes."""
+        if not describe_objs:
+            return
         engine = self.engine
         metadata = Base.metadata
         metadata.bind = engine
@@ -247,15 +327,25 @@ class Schema:
         engine.execute("vacuum")
 
     FormatVersion = "FormatVersion"
-    CurrentFormatVersion = 2
+    CurrentFormatVersion = 3
+    ContentVersion = "ContentVersion"
+
+    def _get_metadata(self, name: str) -> Optional[str]:
+        rows = self.session.query(FileMetadata.value)
+        rows = rows.filter(FileMetadata.name == name)
+        first_row = rows.one_or_none()
+        return first_row[0] if first_row else None
 
     @property
     def version(self) -> int:
-        rows = self.session.query(FileMetadata.value)
-        rows = rows.filter(FileMetadata.name == self.FormatVersion)
-        first_row = rows.one()
-        assert first_row
-        return int(first_row[0])
+        version = self._get_metadata(self.FormatVersion)
+        assert version
+        return int(version)
+
+    @property
+    def content_version(self) -> int:
+        """Incremented every time describe changes are saved to the cache"""
+        return int(self._get_metadata(self.ContentVersion) or 0)
 
     def save_version(self, sess: "BufferedSession"):
         create_row(
@@ -263,6 +353,11 @@ class Schema:
             FileMetadata,
             {"name": self.FormatVersion, "value": self.CurrentFormatVersion},
         )
+        create_row(
+            sess,
+            FileMetadata,
+            {"name": self.ContentVersion, "value": self.content_version + 1},
+        )
         self.session.commit()
 
 
@@ -373,10 +468,10 @@ def get_org_schema(
     filters = set(filters)
     with org_config.get_orginfo_cache_dir(Schema.__module__) as directory:
         directory.mkdir(exist_ok=True, parents=True)
-        schema_path = directory / "org_schema.db.gz"
-
-        if force_recache and schema_path.exists():
-            schema_path.unlink()
+        legacy_schema_path = directory / LEGACY_SCHEMA_FILENAME
+        if legacy_schema_path.exists():
+            legacy_schema_path.unlink()
+        cache_dir = Path(directory.getsyspath())
 
         if Filters.populated in filters:
             filters.add(Filters.queryable)
@@ -392,38 +487,55 @@ def get_org_schema(
             patterns_to_ignore += NOT_EXTRACTABLE
 
         logger = logger or getLogger(__name__)
+        retire_old_databases(cache_dir, logger)
 
-        with ZippableTempDb() as tempdb, ExitStack() as closer:
+        with ExitStack() as closer:
             schema = None
-            engine = tempdb.create_engine()
-            if schema_path.exists():
+            existing_files = schema_files(cache_dir)
+            if existing_files and not force_recache:
+                schema_path = existing_files[-1]
                 try:
-                    cleanups_on_failure = []
-                    tempdb.unzip_database(schema_path)
-                    cleanups_on_failure.extend([schema_path.unlink, tempdb.clear])
-                    schema = Schema(engine, schema_path, filters)
-
-                    cleanups_on_failure.append(schema.close)
-                    closer.callback(schema.close)
+                    schema = Schema(
+                        create_schema_engine(schema_path), schema_path, filters
+                    )
                     if schema.version != schema.CurrentFormatVersion:
                         raise SilentMigration(
                             "was created with older CumulusCI version"
                         )
                     assert schema.sobjects.first().name
                     schema.from_cache = True
+                    closer.callback(schema.close)
                 except Exception as e:
                     if not isinstance(e, SilentMigration):
                         logger.warning(
                             f"Cannot read `{schema_path}`. Recreating it. Reason `{e}`."
                         )
+                    if schema:
+                        schema.close()
                     schema = None
-                    for cleanup_action in reversed(cleanups_on_failure):
-                        cleanup_action()
 
             if schema is None:
+                # Other processes may be using the existing cache, so build
+                # a new one and only name it once it is complete and closed.
+                new_schema_path = (
+                    cache_dir / f"org_schema.{os.getpid()}-{threading.get_ident()}.tmp"
+                )
+                delete_file(new_schema_path, logger)
+
+                def install_new_schema(exc_type, exc, tb):
+                    if exc_type is None:
+                        schema.path = install_database(
+                            new_schema_path, cache_dir, logger
+                        )
+                        retire_old_databases(cache_dir, logger)
+                    else:
+                        delete_file(new_schema_path, logger)
+
+                closer.push(install_new_schema)
+                engine = create_schema_engine(new_schema_path)
                 Base.metadata.bind = engine
                 Base.metadata.create_all()
-                schema = Schema(engine, schema_path, filters)
+                schema = Schema(engine, new_schema_path, filters)
                 closer.callback(schema.close)
                 schema.from_cache = False
 
@@ -446,38 +558,9 @@ def get_org_schema(
 
             schema.included_objects = objs_to_include
             schema.block_writing()
-            # save a gzipped copy for later
-            tempdb.zip_database(schema_path)
             yield schema
 
 
-class ZippableTempDb:
-    """A database that loads and saves from a tempdir to a zippped cache"""
-
-    def __enter__(self) -> "ZippableTempDb":
-        self.tempdir = TemporaryDirectory()
-        self.tempfile = Path(self.tempdir.name) / "temp_org_schema.db"
-        return self
-
-    def __exit__(self, *args, **kwargs):
-        self.clear()
-        self.tempdir.cleanup()
-
-    def zip_database(self, target_path: T.Union[FSResource, Path]):
-        "Save a gzipped copy for later"
-        zip_database(self.tempfile, target_path)
-
-    def unzip_database(self, zipped_db: T.Union[FSResource, Path]):
-        unzip_database(zipped_db, self.tempfile)
-
-    def clear(self):
-        if self.tempfile.exists():
-            self.tempfile.unlink()
-
-    def create_engine(self):
-        return create_engine(f"sqlite:///{str(self.tempfile)}")
-
-
 def populate_counts(sf, schema, objs_cached, logger) -> T.Dict[str, int]:
     objects_to_count = [objname for objname in objs_cached]
     counts, transports_errors, salesforce_errors = count_sobjects(sf, objects_to_count)
@@ -489,7 +572,6 @@ def populate_counts(sf, schema, objs_cached, logger) -> T.Dict[str, int]:
         logger.warning(f"{len(errors)} more counting errors suppressed")
 
     schema.add_counts(counts)
-    schema.session.flush()
     return counts
 
 
@@ -1,5 +1,8 @@
+import hashlib
 import html
 import io
+import itertools
+import json
 import logging
 import os
 import pathlib
@@ -8,6 +11,7 @@ import zipfile
 from base64 import b64encode
 from xml.sax.saxutils import escape
 
+import cumulusci
 from cumulusci.core.dependencies.utils import TaskContext
 from cumulusci.core.source_transforms.transforms import (
     BundleStaticResourcesOptions,
@@ -17,8 +21,10 @@ from cumulusci.core.source_transforms.transforms import (
     NamespaceInjectionTransform,
     RemoveFeatureParametersTransform,
     SourceTransform,
+    StreamingSourceTransform,
+    apply_streaming_transforms,
 )
-from cumulusci.utils.ziputils import hash_zipfile_contents
+from cumulusci.utils.ziputils import hash_directory_contents, hash_zipfile_contents
 
 INSTALLED_PACKAGE_PACKAGE_XML = """<?xml version="1.0" encoding="utf-8"?>
 <Package xmlns="http://soap.sforce.com/2006/04/metadata">
@@ -50,6 +56,9 @@ INSTALLED_PACKAGE = """<?xml version="1.0" encoding="UTF-8"?>
 
 DEFAULT_LOGGER = logging.getLogger(__name__)
 
+# Number of built packages kept in a package cache directory
+MAX_CACHED_PACKAGES = 20
+
 
 class BasePackageZipBuilder(object):
     def __init__(self):
@@ -100,21 +109,32 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
         name=None,
         transforms: T.Optional[T.List[SourceTransform]] = None,
         context: TaskContext,
+        cache_dir: T.Optional[pathlib.Path] = None,
     ):
         self.options = options or {}
         self.logger = logger or DEFAULT_LOGGER
         self.context = context
         self.zf = zf
+        if transforms:
+            self.transforms = transforms
+
+        # Only packages built from a folder can be cached
+        cache_key = None
+        if cache_dir is not None and path is not None and self.zf is None:
+            cache_key = self._get_cache_key(path)
+            if self._load_from_cache(cache_dir, cache_key):
+                return
 
         if self.zf is None:
             self._open_zip()
         if path is not None:
             self._add_files_to_package(path)
-        if transforms:
-            self.transforms = transforms
 
         self._process()
 
+        if cache_key is not None:
+            self._save_to_cache(cache_dir, cache_key)
+
     @classmethod
     def from_zipfile(
         cls,
@@ -174,8 +194,54 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
             return f.lower().endswith((".js", ".js-meta.xml", ".html", ".css", ".svg"))
         return True
 
-    def _process(self):
+    def _get_cache_key(self, path) -> str:
+        """Hash everything that affects the built package: the source files,
+        the builder options, the transforms, and the CumulusCI version."""
+        h = hashlib.blake2b()
+        h.update(cumulusci.__version__.encode("utf-8"))
+        h.update(
+            hash_directory_contents(path, self._find_files_to_package(path)).encode(
+                "utf-8"
+            )
+        )
+        h.update(json.dumps(self.options, sort_keys=True, default=str).encode("utf-8"))
+        for t in self._get_transforms():
+            h.update(t.cache_key(self.context).encode("utf-8"))
+        return h.hexdigest()
+
+    def _load_from_cache(self, cache_dir: pathlib.Path, cache_key: str) -> bool:
+        cache_file = cache_dir / f"{cache_key}.zip"
+        try:
+            content = cache_file.read_bytes()
+        except FileNotFoundError:
+            return False
+
+        # Mark this package as recently used
+        cache_file.touch()
+        self.logger.info(f"Using cached deployment package {cache_key[:12]}")
+        self.buffer = io.BytesIO(content)
+        self.zf = zipfile.ZipFile(self.buffer, "r")
+        return True
+
+    def _save_to_cache(self, cache_dir: pathlib.Path, cache_key: str):
+        fp = self.zf.fp
+        self.zf.close()
+        content = fp.getvalue()
+        self.zf = zipfile.ZipFile(fp, "r")
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_dir / f"{cache_key}.zip.tmp"
+        temp_file.write_bytes(content)
+        temp_file.replace(cache_dir / f"{cache_key}.zip")
+
+        # Discard the least recently used packages
+        cached = sorted(
+            cache_dir.glob("*.zip"), key=lambda f: f.stat().st_mtime, reverse=True
+        )
+        for stale_file in cached[MAX_CACHED_PACKAGES:]:
+            stale_file.unlink(missing_ok=True)
 
+    def _get_transforms(self) -> T.List[SourceTransform]:
         transforms = []
 
         # User-specified transforms
@@ -201,20 +267,44 @@ class MetadataPackageZipBuilder(BasePackageZipBuilder):
         if self.options.get("package_type") == "Unlocked":
             transforms.append(RemoveFeatureParametersTransform())
 
-        for t in transforms:
-            # We have to close the existing zipfile and reopen it before processing;
-            # otherwise we hit a bug in Windows where ZipInfo objects have the wrong path separators.
+        return transforms
+
+    def _process(self):
+        transforms = self._get_transforms()
+        for streaming, group in itertools.groupby(
+            transforms, key=lambda t: isinstance(t, StreamingSourceTransform)
+        ):
+            if streaming:
+                # Consecutive streaming transforms share a single pass over the package
+                streaming_transforms = list(group)
+                self._apply_transform(
+                    lambda zf, context: apply_streaming_transforms(
+                        zf, streaming_transforms, context
+                    )
+                )
+            else:
+                for t in group:
+                    self._apply_transform(t.process)
+
+    def _apply_transform(
+        self, process: T.Callable[[zipfile.ZipFile, TaskContext], zipfile.ZipFile]
+    ):
+        # We have to close the existing zipfile and reopen it before processing;
+        # otherwise we hit a bug in Windows where ZipInfo objects have the wrong path separators.
+        # A zipfile that is already open for reading may be a view of a subfolder
+        # (see zip_subfolder_view), which reopening would undo.
+        if self.zf.mode != "r":
             fp = self.zf.fp
             self.zf.close()
             self.zf = zipfile.ZipFile(fp, "r")
-            new_zipfile = t.process(self.zf, self.context)
-            if new_zipfile != self.zf:
-                # Ensure that zipfiles are closed (in case they're filesystem resources)
-                try:
-                    self.zf.close()
-                except ValueError:  # Attempt to close a closed ZF (on Windows)
-                    pass
-                self.zf = new_zipfile
+        new_zipfile = process(self.zf, self.context)
+        if new_zipfile != self.zf:
+            # Ensure that zipfiles are closed (in case they're filesystem resources)
+            try:
+                self.zf.close()
+            except ValueError:  # Attempt to close a closed ZF (on Windows)
+                pass
+            self.zf = new_zipfile
 
 
 class CreatePackageZipBuilder(BasePackageZipBuilder):
@@ -0,0 +1,150 @@
+import json
+import logging
+from unittest import mock
+
+import pytest
+import responses
+from simple_salesforce import Salesforce
+
+from cumulusci.core.config import OrgConfig
+from cumulusci.salesforce_api.describe_cache import DescribeCache
+from cumulusci.tests.util import CURRENT_SF_API_VERSION, DummyKeychain
+
+DESCRIBE_URL = f"https://example.com/services/data/v{CURRENT_SF_API_VERSION}/sobjects/Account/describe"
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+@pytest.fixture
+def sf():
+    return Salesforce(
+        instance="example.com", session_id="abc123", version=CURRENT_SF_API_VERSION
+    )
+
+
+@pytest.fixture
+def org_config(tmp_path):
+    org_config = OrgConfig(
+        {
+            "instance_url": "https://example.com",
+            "username": "test@example.com",
+            "org_id": "00D000000000001",
+        },
+        "test",
+        keychain=DummyKeychain(),
+    )
+    with mock.patch("cumulusci.tests.util.DummyKeychain.cache_dir", tmp_path):
+        yield org_config
+
+
+def describe_body(label="Account"):
+    return {"name": "Account", "label": label, "fields": []}
+
+
+class TestDescribeCache:
+    @responses.activate
+    def test_describe_sobject__memory_only(self, sf):
+        responses.add("GET", DESCRIBE_URL, json=describe_body())
+        cache = DescribeCache(sf)
+
+        assert cache.describe_sobject("Account") == describe_body()
+        assert cache.describe_sobject("Account") == describe_body()
+
+        assert len(responses.calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @responses.activate
+    def test_describe(self, sf):
+        responses.add(
+            "GET",
+            f"https://example.com/services/data/v{CURRENT_SF_API_VERSION}/sobjects",
+            json={"sobjects": []},
+        )
+        cache = DescribeCache(sf)
+
+        assert cache.describe() == cache.describe() == {"sobjects": []}
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_describe_sobject__disk_cache(self, sf, org_config, tmp_path):
+        responses.add(
+            "GET",
+            DESCRIBE_URL,
+            json=describe_body(),
+            headers={"Last-Modified": LAST_MODIFIED},
+        )
+        responses.add("GET", DESCRIBE_URL, status=304)
+
+        cache = DescribeCache(sf, org_config)
+        assert cache.describe_sobject("Account") == describe_body()
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert "If-Modified-Since" not in responses.calls[0].request.headers
+        (cache_file,) = tmp_path.glob(
+            f"orginfo/*/cumulusci.salesforce_api.describe_cache/00D000000000001/v{CURRENT_SF_API_VERSION}/Account.json"
+        )
+        assert json.loads(cache_file.read_text())["last_modified"] == LAST_MODIFIED
+
+        # A second task revalidates the describe instead of downloading it
+        cache = DescribeCache(sf, org_config)
+        assert cache.describe_sobject("Account") == describe_body()
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert responses.calls[1].request.headers["If-Modified-Since"] == LAST_MODIFIED
+
+    @responses.activate
+    def test_describe_sobject__disk_cache_modified(self, sf, org_config):
+        responses.add(
+            "GET",
+            DESCRIBE_URL,
+            json=describe_body(),
+            headers={"Last-Modified": LAST_MODIFIED},
+        )
+        responses.add("GET", DESCRIBE_URL, json=describe_body("Business Account"))
+
+        DescribeCache(sf, org_config).describe_sobject("Account")
+        cache = DescribeCache(sf, org_config)
+
+        assert cache.describe_sobject("Account") == describe_body("Business Account")
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    @responses.activate
+    def test_describe_sobject__unreadable_cache(self, sf, org_config, tmp_path, caplog):
+        responses.add("GET", DESCRIBE_URL, json=describe_body())
+        DescribeCache(sf, org_config).describe_sobject("Account")
+        (cache_file,) = tmp_path.glob("orginfo/**/Account.json")
+        cache_file.write_text("{")
+
+        cache = DescribeCache(sf, org_config)
+        assert cache.describe_sobject("Account") == describe_body()
+
+        assert "Cannot read describe cache" in caplog.text
+        assert "If-Modified-Since" not in responses.calls[1].request.headers
+
+    def test_describe_sobject__no_org_id(self, sf):
+        org_config = OrgConfig(
+            {"instance_url": "https://example.com", "username": "test@example.com"},
+            "test",
+            keychain=DummyKeychain(),
+        )
+        sf = mock.Mock()
+        sf.Account.describe.return_value = describe_body()
+
+        cache = DescribeCache(sf, org_config)
+
+        assert cache.describe_sobject("Account") == describe_body()
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    @responses.activate
+    def test_describe_sobject__error(self, sf, org_config):
+        responses.add("GET", DESCRIBE_URL, status=500, json=[{"message": "Oops"}])
+
+        with pytest.raises(Exception, match="Oops"):
+            DescribeCache(sf, org_config).describe_sobject("Account")
+
+    def test_log_stats(self, sf, caplog):
+        caplog.set_level(logging.DEBUG)
+        cache = DescribeCache(sf)
+        cache.hits = 3
+        cache.misses = 2
+
+        cache.log_stats()
+
+        assert "Describe cache: 3 hits, 2 misses." in caplog.text
@@ -10,6 +10,7 @@ from requests import Response
 
 from cumulusci.core.config import TaskConfig
 from cumulusci.core.exceptions import ApexTestException, CumulusCIException
+from cumulusci.core.polling import LinearPollingStrategy
 from cumulusci.core.tasks import BaseTask
 from cumulusci.salesforce_api.exceptions import (
     MetadataApiError,
@@ -273,11 +274,28 @@ class TestBaseTestMetadataApi:
     def test_get_check_interval(self):
         task = self._create_task()
         api = self._create_instance(task)
+        api.poll_strategy = LinearPollingStrategy()
         api.check_num = 1
         assert api._get_check_interval() == 1
         api.check_num = 10
         assert api._get_check_interval() == 4
 
+    def test_get_check_interval__task_polling_option(self):
+        task = self._create_task(
+            task_config={"options": {"polling": {"jitter": 0, "max_interval": 5}}}
+        )
+        api = self._create_instance(task)
+        assert [api.poll_strategy.get_interval(n, 1) for n in range(1, 9)] == [
+            1,
+            1,
+            1,
+            1.5,
+            2.25,
+            3.375,
+            5,
+            5,
+        ]
+
     @responses.activate
     def test_get_response_faultcode(self):
         org_config = {
@@ -462,7 +480,10 @@ class TestBaseTestMetadataApi:
 
         assert api.status == "Done"
 
-        assert api.check_num == 4
+        # No wait after the status check that found the job done
+        assert api.check_num == 3
+        assert task.poll_stats.polls == 3
+        assert task.poll_stats.as_dict()["poll_count"] == 3
 
     def test_process_response_status_no_done_element(self):
         task = self._create_task()
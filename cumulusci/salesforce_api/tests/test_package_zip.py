@@ -3,9 +3,14 @@ import io
 import os
 import pathlib
 import zipfile
+from unittest import mock
 
 import pytest
 
+from cumulusci.core.source_transforms.transforms import (
+    FindReplaceTransform,
+    FindReplaceTransformOptions,
+)
 from cumulusci.salesforce_api.package_zip import (
     BasePackageZipBuilder,
     CreatePackageZipBuilder,
@@ -15,6 +20,7 @@ from cumulusci.salesforce_api.package_zip import (
     UninstallPackageZipBuilder,
 )
 from cumulusci.utils import temporary_dir, touch
+from cumulusci.utils.ziputils import zip_subfolder_view
 
 
 class TestBasePackageZipBuilder:
@@ -341,6 +347,121 @@ class TestMetadataPackageZipBuilder:
             package_xml = builder.zf.read("package.xml")
             assert b"FeatureParameterInteger" not in package_xml
 
+    def test_from_zipfile__subfolder_view(self, task_context, tmp_path):
+        archive = tmp_path / "archive.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("repo-sha/src/package.xml", "<Package/>")
+            zf.writestr("repo-sha/src/classes/Foo.cls", "// %%%NAMESPACE%%%Foo")
+            zf.writestr("repo-sha/README.md", "readme")
+
+        builder = MetadataPackageZipBuilder.from_zipfile(
+            zip_subfolder_view(zipfile.ZipFile(archive), "repo-sha/src"),
+            options={"namespace_inject": "ns", "unmanaged": False},
+            context=task_context,
+        )
+
+        zf = zipfile.ZipFile(io.BytesIO(builder.as_bytes()))
+        assert sorted(zf.namelist()) == ["classes/Foo.cls", "package.xml"]
+        assert zf.read("classes/Foo.cls") == b"// ns__Foo"
+
+    def test_cache(self, task_context, tmp_path):
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "package.xml").write_text("<Package />")
+        (source / "classes").mkdir()
+        (source / "classes" / "Foo.cls").write_text("%%%NAMESPACE%%%Foo")
+        cache_dir = tmp_path / "cache"
+        options = {"namespace_inject": "ns", "unmanaged": False}
+
+        builder = MetadataPackageZipBuilder(
+            path=source, options=options, context=task_context, cache_dir=cache_dir
+        )
+        payload = builder.as_base64()
+        assert len(list(cache_dir.glob("*.zip"))) == 1
+
+        with mock.patch.object(
+            MetadataPackageZipBuilder, "_add_files_to_package"
+        ) as add_files:
+            builder = MetadataPackageZipBuilder(
+                path=source, options=options, context=task_context, cache_dir=cache_dir
+            )
+        add_files.assert_not_called()
+        assert builder.zf.read("classes/Foo.cls") == b"ns__Foo"
+        assert builder.as_base64() == payload
+
+        # Changes to the source, options, or transforms produce a new package
+        (source / "classes" / "Foo.cls").write_text("%%%NAMESPACE%%%Bar")
+        builder = MetadataPackageZipBuilder(
+            path=source, options=options, context=task_context, cache_dir=cache_dir
+        )
+        assert builder.zf.read("classes/Foo.cls") == b"ns__Bar"
+        builder = MetadataPackageZipBuilder(
+            path=source, options={}, context=task_context, cache_dir=cache_dir
+        )
+        assert builder.zf.read("classes/Foo.cls") == b"%%%NAMESPACE%%%Bar"
+        builder = MetadataPackageZipBuilder(
+            path=source,
+            options={},
+            context=task_context,
+            cache_dir=cache_dir,
+            transforms=[
+                FindReplaceTransform(
+                    FindReplaceTransformOptions.parse_obj(
+                        {"patterns": [{"find": "Bar", "replace": "Baz"}]}
+                    )
+                )
+            ],
+        )
+        assert builder.zf.read("classes/Foo.cls") == b"%%%NAMESPACE%%%Baz"
+        assert len(list(cache_dir.glob("*.zip"))) == 4
+
+    def test_cache__find_replace_env(self, task_context, tmp_path):
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "Foo.cls").write_text("foo")
+        transforms = [
+            FindReplaceTransform(
+                FindReplaceTransformOptions.parse_obj(
+                    {"patterns": [{"find": "foo", "replace_env": "FOO_VALUE"}]}
+                )
+            )
+        ]
+
+        def build():
+            return MetadataPackageZipBuilder(
+                path=source,
+                context=task_context,
+                transforms=transforms,
+                cache_dir=tmp_path / "cache",
+            )
+
+        with mock.patch.dict(os.environ, {"FOO_VALUE": "bar"}):
+            assert build().zf.read("Foo.cls") == b"bar"
+        with mock.patch.dict(os.environ, {"FOO_VALUE": "baz"}):
+            assert build().zf.read("Foo.cls") == b"baz"
+
+    def test_cache__evicts_least_recently_used(self, task_context, tmp_path):
+        cache_dir = tmp_path / "cache"
+        source = tmp_path / "src"
+        source.mkdir()
+
+        with mock.patch("cumulusci.salesforce_api.package_zip.MAX_CACHED_PACKAGES", 2):
+            for i in range(3):
+                (source / "Foo.cls").write_text(str(i))
+                MetadataPackageZipBuilder(
+                    path=source, context=task_context, cache_dir=cache_dir
+                )
+                for cache_file in cache_dir.glob("*.zip"):
+                    # Make sure modtimes are distinct
+                    mtime = cache_file.stat().st_mtime - 10
+                    os.utime(cache_file, (mtime, mtime))
+
+        cached = [
+            zipfile.ZipFile(cache_file).read("Foo.cls")
+            for cache_file in cache_dir.glob("*.zip")
+        ]
+        assert sorted(cached) == [b"1", b"2"]
+
 
 class TestCreatePackageZipBuilder:
     def test_init__missing_name(self):
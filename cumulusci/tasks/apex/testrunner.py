@@ -3,7 +3,9 @@
 import html
 import io
 import json
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from cumulusci.core.exceptions import (
     ApexTestException,
@@ -64,7 +66,7 @@ APEX_LIMITS = {
 }
 
 
-TEST_RESULT_QUERY = """
+TEST_RESULT_SELECT = """
 SELECT Id,ApexClassId,TestTimestamp,
        Message,MethodName,Outcome,
        RunTime,StackTrace,
@@ -74,8 +76,30 @@ SELECT Id,ApexClassId,TestTimestamp,
           QueryRows,Sosl,Cpu,Dml,Soql
         FROM ApexTestResults)
 FROM ApexTestResult
-WHERE AsyncApexJobId='{}'
 """
+TEST_RESULT_QUERY = TEST_RESULT_SELECT + "WHERE AsyncApexJobId='{}'\n"
+QUEUE_ITEM_RESULT_QUERY = TEST_RESULT_SELECT + "WHERE QueueItemId IN ({})\n"
+
+# Number of queue items whose results are fetched in one query
+QUEUE_ITEM_QUERY_CHUNK_SIZE = 200
+FINISHED_QUEUE_ITEM_STATUSES = ("Completed", "Failed", "Aborted")
+
+RETRY_MODES = ("individual", "batched")
+DEFAULT_RETRY_CONCURRENCY = 4
+
+# Per-class test runtimes from earlier runs, used to balance shards
+RUNTIMES_CACHE_FILE = "apex_test_runtimes.json"
+
+CODE_COVERAGE_LINES_QUERY = (
+    "SELECT ApexClassOrTrigger.Name, Coverage FROM ApexCodeCoverageAggregate"
+)
+
+
+class ShardLoggerAdapter(logging.LoggerAdapter):
+    """Prefixes log messages with the name of the org a shard runs in."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['org_name']}] {msg}", kwargs
 
 
 class RunApexTests(BaseSalesforceApiTask):
@@ -106,6 +130,32 @@ class RunApexTests(BaseSalesforceApiTask):
             - "connection was cancelled here"
         retry_always: True
 
+    By default each failed test is retried in its own job, and each job must
+    finish before the next one is queued. Set ``retry_mode`` to ``batched`` to
+    retry all of the failed tests at once, grouped into ``retry_concurrency``
+    jobs that run at the same time (4 by default). All the failed tests from
+    one class always go in the same job, and Salesforce runs the tests of one
+    class one after another. Set ``retry_concurrency`` to 1 to retry
+    everything in a single job, which avoids most lock contention between
+    the retries.
+
+    Set ``stream_results`` to True to fetch the results of each test class as
+    soon as it finishes, instead of all at once at the end of the run. Failures
+    are then logged while the remaining tests are still running, and the JUnit
+    and JSON output files are rewritten with the results so far after each
+    poll. Set ``fail_fast`` to a number of failures to abort the tests that
+    have not run yet once that many tests have failed. Failures that match
+    ``retry_failures`` do not count towards ``fail_fast``. ``fail_fast``
+    turns on ``stream_results``.
+
+    Set ``shard_orgs`` to a list of other orgs to split the test classes
+    between this task's org and those orgs, and run them in all the orgs at
+    the same time. Classes are balanced between the orgs using how long each
+    class took in earlier sharded runs, which are stored in the project's
+    ``.cci`` directory. The results of all the orgs are combined into one
+    report and one set of output files. Code coverage is combined line by
+    line before it is checked. Every org must have the same code deployed.
+
     Some projects' unit tests produce so many concurrency errors that
     it's faster to execute the entire run in serial mode than to use retries.
     Serial and parallel mode are configured in the scratch org definition file."""
@@ -159,6 +209,29 @@ class RunApexTests(BaseSalesforceApiTask):
             "description": "By default, all failures must match retry_failures to perform "
             "a retry. Set retry_always to True to retry all failed tests if any failure matches."
         },
+        "retry_mode": {
+            "description": "How to retry failed tests. 'individual' (the default) retries "
+            "each test in its own job, one job at a time. 'batched' retries all of the "
+            "tests at once, grouped by class into retry_concurrency jobs."
+        },
+        "retry_concurrency": {
+            "description": "In batched retry mode, the number of jobs to split the retried "
+            "tests into. These jobs run at the same time. Defaults to 4. Set to 1 to "
+            "retry all tests in a single job."
+        },
+        "stream_results": {
+            "description": "If True, fetch and report the results of each test class "
+            "as soon as it finishes, and update the output files as results arrive. "
+            "Defaults to False."
+        },
+        "fail_fast": {
+            "description": "Abort the remaining tests after this many tests fail. "
+            "Implies stream_results. Defaults to 0, which never aborts."
+        },
+        "shard_orgs": {
+            "description": "A list of other orgs to split the test classes across, "
+            "along with this task's org. The orgs run their tests at the same time."
+        },
         "required_org_code_coverage_percent": {
             "description": "Require at least X percent code coverage across the org following the test run.",
             "usage": "--required_org_code_coverage_percent PERCENTAGE",
@@ -223,10 +296,41 @@ class RunApexTests(BaseSalesforceApiTask):
         self.options["retry_always"] = process_bool_arg(
             self.options.get("retry_always") or False
         )
+        self.options["retry_mode"] = self.options.get("retry_mode") or "individual"
+        if self.options["retry_mode"] not in RETRY_MODES:
+            raise TaskOptionsError(
+                f"Invalid retry_mode {self.options['retry_mode']}. "
+                f"Valid values are {', '.join(RETRY_MODES)}."
+            )
+        try:
+            self.options["retry_concurrency"] = int(
+                self.options.get("retry_concurrency") or DEFAULT_RETRY_CONCURRENCY
+            )
+        except ValueError:
+            self.options["retry_concurrency"] = 0
+        if self.options["retry_concurrency"] < 1:
+            raise TaskOptionsError("retry_concurrency must be a positive integer")
 
         self.verbose = process_bool_arg(self.options.get("verbose") or False)
 
+        try:
+            self.options["fail_fast"] = int(self.options.get("fail_fast") or 0)
+        except ValueError:
+            self.options["fail_fast"] = -1
+        if self.options["fail_fast"] < 0:
+            raise TaskOptionsError("fail_fast must be a number of failures")
+        self.options["shard_orgs"] = process_list_arg(
+            self.options.get("shard_orgs") or []
+        )
+        self.options["stream_results"] = (
+            process_bool_arg(self.options.get("stream_results") or False)
+            or self.options["fail_fast"] > 0
+        )
+
         self.counts = {}
+        # Set when this task runs one shard of a sharded run
+        self.shard_class_names = None
+        self.shard_runners = []
 
         if "required_org_code_coverage_percent" in self.options:
             try:
@@ -260,6 +364,9 @@ class RunApexTests(BaseSalesforceApiTask):
         self.results_by_class_name = {}
         self.result = None
         self.retry_details = None
+        self.streamed_queue_item_ids = set()
+        self.streamed_failures = 0
+        self.aborted = False
 
     def _get_namespace_filter(self):
 
@@ -305,6 +412,17 @@ class RunApexTests(BaseSalesforceApiTask):
         return query
 
     def _get_test_classes(self):
+        result = self._query_test_classes()
+        if self.shard_class_names is not None:
+            records = [
+                record
+                for record in result["records"]
+                if record["Name"] in self.shard_class_names
+            ]
+            result = {**result, "records": records, "totalSize": len(records)}
+        return result
+
+    def _query_test_classes(self):
         # If test_suite_names is provided, execute only tests that are a part of the list of test suites provided.
         if self.options["test_suite_names"]:
             test_classes_from_test_suite_names = (
@@ -423,17 +541,14 @@ class RunApexTests(BaseSalesforceApiTask):
             for each_class in test_classes["records"]
         }
 
-        result = self.tooling.query_all(TEST_RESULT_QUERY.format(self.job_id))
-
         if allow_retries:
             self.retry_details = {}
 
-        for test_result in result["records"]:
-            class_name = self.classes_by_id[test_result["ApexClassId"]]
-            self.results_by_class_name[class_name][
-                test_result["MethodName"]
-            ] = test_result
-            self.counts[test_result["Outcome"]] += 1
+        # When streaming, the results were already collected while polling.
+        if not self.options["stream_results"]:
+            result = self.tooling.query_all(TEST_RESULT_QUERY.format(self.job_id))
+            for test_result in result["records"]:
+                self._record_test_result(test_result)
 
         # If we have class-level failures that did not come with line-level
         # failure details, report those as well.
@@ -489,6 +604,86 @@ class RunApexTests(BaseSalesforceApiTask):
                                 test_result["ApexClassId"], []
                             ).append(test_result["MethodName"])
 
+    def _record_test_result(self, test_result):
+        class_name = self.classes_by_id[test_result["ApexClassId"]]
+        self.results_by_class_name[class_name][test_result["MethodName"]] = test_result
+        self.counts[test_result["Outcome"]] += 1
+
+    def _stream_test_results(self, queue_items):
+        """Collect the results of queue items that finished since the last poll."""
+        finished_ids = [
+            item["Id"]
+            for item in queue_items
+            if item["Status"] in FINISHED_QUEUE_ITEM_STATUSES
+            and item["Id"] not in self.streamed_queue_item_ids
+        ]
+        if not finished_ids:
+            return
+        self.streamed_queue_item_ids.update(finished_ids)
+
+        for start in range(0, len(finished_ids), QUEUE_ITEM_QUERY_CHUNK_SIZE):
+            chunk = finished_ids[start : start + QUEUE_ITEM_QUERY_CHUNK_SIZE]
+            result = self.tooling.query_all(
+                QUEUE_ITEM_RESULT_QUERY.format(
+                    self._get_comma_separated_string_of_items(chunk)
+                )
+            )
+            for test_result in result["records"]:
+                self._record_test_result(test_result)
+                if test_result["Outcome"] in ("Fail", "CompileFail"):
+                    self.logger.error(
+                        "{}: {}.{} - {}".format(
+                            test_result["Outcome"],
+                            self.classes_by_id[test_result["ApexClassId"]],
+                            test_result["MethodName"],
+                            test_result["Message"],
+                        )
+                    )
+                    if not self._is_retriable_failure(test_result):
+                        self.streamed_failures += 1
+
+        self._write_output(
+            [
+                self._get_output_result(class_name, result)
+                for class_name in sorted(self.results_by_class_name)
+                for _, result in sorted(
+                    self.results_by_class_name[class_name].items(),
+                    key=lambda item: str(item[0]),
+                )
+            ]
+        )
+
+        fail_fast = self.options["fail_fast"]
+        if fail_fast and self.streamed_failures >= fail_fast and not self.aborted:
+            self._abort_remaining_tests(queue_items)
+
+    def _abort_remaining_tests(self, queue_items):
+        self.aborted = True
+        remaining = [
+            item["Id"]
+            for item in queue_items
+            if item["Status"] not in FINISHED_QUEUE_ITEM_STATUSES
+        ]
+        self.logger.error(
+            f"{self.streamed_failures} tests failed; aborting {len(remaining)} remaining test classes."
+        )
+        queue_item_object = self._get_tooling_object("ApexTestQueueItem")
+        for queue_item_id in remaining:
+            queue_item_object.update(queue_item_id, {"Status": "Aborted"})
+
+    def _get_output_result(self, class_name, result):
+        result["stats"] = self._get_stats_from_result(result)
+        return {
+            "Children": result.get("children", None),
+            "ClassName": decode_to_unicode(class_name),
+            "Method": decode_to_unicode(result["MethodName"]),
+            "Message": decode_to_unicode(result["Message"]),
+            "Outcome": decode_to_unicode(result["Outcome"]),
+            "StackTrace": decode_to_unicode(result["StackTrace"]),
+            "Stats": result.get("stats", None),
+            "TestTimestamp": result.get("TestTimestamp", None),
+        }
+
     def _process_test_results(self):
         test_results = []
         class_names = list(self.results_by_class_name.keys())
@@ -522,21 +717,9 @@ class RunApexTests(BaseSalesforceApiTask):
                 result = self.results_by_class_name[class_name][method_name]
                 message = f"\t{result['Outcome']}: {result['MethodName']}"
                 duration = result["RunTime"]
-                result["stats"] = self._get_stats_from_result(result)
                 if duration:
                     message += f" ({duration}ms)"
-                test_results.append(
-                    {
-                        "Children": result.get("children", None),
-                        "ClassName": decode_to_unicode(class_name),
-                        "Method": decode_to_unicode(result["MethodName"]),
-                        "Message": decode_to_unicode(result["Message"]),
-                        "Outcome": decode_to_unicode(result["Outcome"]),
-                        "StackTrace": decode_to_unicode(result["StackTrace"]),
-                        "Stats": result.get("stats", None),
-                        "TestTimestamp": result.get("TestTimestamp", None),
-                    }
-                )
+                test_results.append(self._get_output_result(class_name, result))
                 if result["Outcome"] in ["Fail", "CompileFail"]:
                     self.logger.info(message)
                     self.logger.info(f"\tMessage: {result['Message']}")
@@ -621,7 +804,36 @@ class RunApexTests(BaseSalesforceApiTask):
         result = self._get_test_classes()
         if result["totalSize"] == 0:
             return
-        for test_class in result["records"]:
+        if self.options["shard_orgs"]:
+            self._run_shards(result["records"])
+        else:
+            self._run_tests(result["records"])
+
+        test_results = self._process_test_results()
+        self._write_output(test_results)
+
+        if self.counts.get("Fail") or self.counts.get("CompileFail"):
+            raise ApexTestException(
+                "{} tests failed and {} tests failed compilation".format(
+                    self.counts.get("Fail"), self.counts.get("CompileFail")
+                )
+            )
+
+        if self.code_coverage_level or self.required_per_class_code_coverage_percent:
+            if self.options.get("namespace") not in self.org_config.installed_packages:
+                self._check_code_coverage()
+            else:
+                self.logger.info(
+                    "This org contains a managed installation; not checking code coverage."
+                )
+        else:
+            self.logger.info(
+                "No code coverage level specified; not checking code coverage."
+            )
+
+    def _run_tests(self, test_classes):
+        """Run the test classes and collect their results, including retries."""
+        for test_class in test_classes:
             self.classes_by_id[test_class["Id"]] = test_class["Name"]
             self.classes_by_name[test_class["Name"]] = test_class["Id"]
             self.results_by_class_name[test_class["Name"]] = {}
@@ -647,35 +859,139 @@ class RunApexTests(BaseSalesforceApiTask):
         able_to_retry = (self.counts["Retriable"] and self.options["retry_always"]) or (
             self.counts["Retriable"] and self.counts["Retriable"] == self.counts["Fail"]
         )
-        if not able_to_retry:
+        if not able_to_retry or self.aborted:
             self.counts["Retriable"] = 0
         else:
             self._attempt_retries()
 
-        test_results = self._process_test_results()
-        self._write_output(test_results)
+    def _run_shards(self, test_classes):
+        """Split the test classes between this org and the shard_orgs,
+        run each part in its own org at the same time, and merge the results."""
+        org_configs = [(self.org_config.name, self.org_config)] + [
+            (org_name, self.project_config.keychain.get_org(org_name))
+            for org_name in self.options["shard_orgs"]
+        ]
+        shards = self._get_shards(
+            [test_class["Name"] for test_class in test_classes], len(org_configs)
+        )
+        for (org_name, org_config), class_names in zip(org_configs, shards):
+            if not class_names:
+                continue
+            self.logger.info(
+                f"Running {len(class_names)} test classes in org {org_name}"
+            )
+            runner = RunApexTests(
+                self.project_config,
+                self.task_config,
+                org_config,
+                logger=ShardLoggerAdapter(self.logger, {"org_name": org_name}),
+            )
+            runner.options.update(shard_orgs=[], junit_output=None, json_output=None)
+            runner.shard_class_names = set(class_names)
+            self.shard_runners.append(runner)
 
-        if self.counts.get("Fail") or self.counts.get("CompileFail"):
-            raise ApexTestException(
-                "{} tests failed and {} tests failed compilation".format(
-                    self.counts.get("Fail"), self.counts.get("CompileFail")
+        with ThreadPoolExecutor(max_workers=len(self.shard_runners)) as executor:
+            for _ in executor.map(self._run_shard, self.shard_runners):
+                pass
+
+        # Report results with the Ids of this org, which is where any
+        # classes that need to be run again from _process_test_results go.
+        for test_class in test_classes:
+            self.classes_by_id[test_class["Id"]] = test_class["Name"]
+            self.classes_by_name[test_class["Name"]] = test_class["Id"]
+        self.counts = {}
+        for runner in self.shard_runners:
+            self.results_by_class_name.update(runner.results_by_class_name)
+            for outcome, count in runner.counts.items():
+                self.counts[outcome] = self.counts.get(outcome, 0) + count
+
+        self._save_class_runtimes()
+
+    @staticmethod
+    def _run_shard(runner):
+        runner._update_credentials()
+        runner._init_task()
+        runner._run_tests(runner._get_test_classes()["records"])
+
+    def _get_shards(self, class_names, count):
+        """Split class names into `count` lists with about the same total runtime.
+
+        Classes with no recorded runtime are assumed to take the average time."""
+        runtimes = self._load_class_runtimes()
+        known = [runtimes[name] for name in class_names if name in runtimes]
+        default_runtime = sum(known) / len(known) if known else 1
+
+        shards = [[] for _ in range(count)]
+        totals = [0] * count
+        for name in sorted(
+            class_names, key=lambda name: (-runtimes.get(name, default_runtime), name)
+        ):
+            shortest = totals.index(min(totals))
+            shards[shortest].append(name)
+            totals[shortest] += runtimes.get(name, default_runtime)
+        return shards
+
+    @property
+    def _runtimes_cache_path(self):
+        return self.project_config.cache_dir / RUNTIMES_CACHE_FILE
+
+    def _load_class_runtimes(self):
+        try:
+            return json.loads(self._runtimes_cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            self.logger.warning(f"Cannot read Apex test runtimes: {e}")
+            return {}
+
+    def _save_class_runtimes(self):
+        runtimes = self._load_class_runtimes()
+        for class_name, results in self.results_by_class_name.items():
+            if results:
+                runtimes[class_name] = sum(
+                    result["RunTime"] or 0 for result in results.values()
                 )
-            )
+        self._runtimes_cache_path.write_text(
+            json.dumps(runtimes, indent=2, sort_keys=True), encoding="utf-8"
+        )
 
-        if self.code_coverage_level or self.required_per_class_code_coverage_percent:
-            if self.options.get("namespace") not in self.org_config.installed_packages:
-                self._check_code_coverage()
-            else:
-                self.logger.info(
-                    "This org contains a managed installation; not checking code coverage."
+    def _get_sharded_code_coverage(self):
+        """Combine the lines covered in each shard's org.
+
+        Returns the classes below the required per-class coverage
+        and the overall coverage."""
+        covered_lines = {}
+        uncovered_lines = {}
+        for runner in self.shard_runners:
+            for record in runner.tooling.query_all(CODE_COVERAGE_LINES_QUERY)[
+                "records"
+            ]:
+                name = record["ApexClassOrTrigger"]["Name"]
+                covered_lines.setdefault(name, set()).update(
+                    record["Coverage"]["coveredLines"]
+                )
+                uncovered_lines.setdefault(name, set()).update(
+                    record["Coverage"]["uncoveredLines"]
                 )
-        else:
-            self.logger.info(
-                "No code coverage level specified; not checking code coverage."
-            )
 
-    def _check_code_coverage(self):
-        self.logger.info("Checking code coverage.")
+        class_level_coverage_failures = {}
+        total_covered = total_lines = 0
+        for name in sorted(covered_lines):
+            covered = len(covered_lines[name])
+            lines = len(covered_lines[name] | uncovered_lines[name])
+            total_covered += covered
+            total_lines += lines
+            if lines:
+                coverage_percentage = round(covered / lines * 100, 2)
+                if coverage_percentage < self.required_per_class_code_coverage_percent:
+                    class_level_coverage_failures[name] = coverage_percentage
+
+        coverage = round(total_covered / total_lines * 100, 2) if total_lines else 0
+        return class_level_coverage_failures, coverage
+
+    def _get_code_coverage(self):
+        """Returns the classes below the required per-class coverage
+        and the org-wide coverage."""
         class_level_coverage_failures = {}
 
         # Query for Class level code coverage using the aggregate
@@ -705,6 +1021,15 @@ class RunApexTests(BaseSalesforceApiTask):
         # Query for OrgWide coverage
         result = self.tooling.query("SELECT PercentCovered FROM ApexOrgWideCoverage")
         coverage = result["records"][0]["PercentCovered"]
+        return class_level_coverage_failures, coverage
+
+    def _check_code_coverage(self):
+        self.logger.info("Checking code coverage.")
+
+        if self.shard_runners:
+            class_level_coverage_failures, coverage = self._get_sharded_code_coverage()
+        else:
+            class_level_coverage_failures, coverage = self._get_code_coverage()
 
         errors = []
         if self.required_per_class_code_coverage_percent:
@@ -743,30 +1068,75 @@ class RunApexTests(BaseSalesforceApiTask):
         )
         self.counts["Fail"] = 0
 
-        for class_id, test_list in self.retry_details.items():
-            for each_test in test_list:
-                self.logger.warning(
-                    "Retrying {}.{}".format(self.classes_by_id[class_id], each_test)
-                )
-                self.job_id = self._enqueue_test_run({class_id: [each_test]})
-                self._wait_for_tests()
-                self._get_test_results(allow_retries=False)
+        if self.options["retry_mode"] == "batched":
+            self._attempt_batched_retries()
+        else:
+            for class_id, test_list in self.retry_details.items():
+                for each_test in test_list:
+                    self.logger.warning(
+                        "Retrying {}.{}".format(self.classes_by_id[class_id], each_test)
+                    )
+                    self.job_id = self._enqueue_test_run({class_id: [each_test]})
+                    self._wait_for_tests()
+                    self._get_test_results(allow_retries=False)
 
         # If the retry failed, report the remaining failures.
         if self.counts["Fail"]:
             self.logger.error("Test retry failed.")
 
-    def _wait_for_tests(self):
+    def _get_retry_batches(self):
+        """Split the tests to retry into at most retry_concurrency jobs
+        with about the same number of tests in each, keeping classes whole."""
+        batches = [{} for _ in range(self.options["retry_concurrency"])]
+        sizes = [0] * len(batches)
+        for class_id, test_list in sorted(
+            self.retry_details.items(), key=lambda item: -len(item[1])
+        ):
+            smallest = sizes.index(min(sizes))
+            batches[smallest][class_id] = test_list
+            sizes[smallest] += len(test_list)
+        return [batch for batch in batches if batch]
+
+    def _attempt_batched_retries(self):
+        job_ids = []
+        for batch in self._get_retry_batches():
+            job_id = self._enqueue_test_run(batch)
+            self.logger.warning(
+                "Retrying {} in job {}".format(
+                    ", ".join(
+                        f"{self.classes_by_id[class_id]}.{each_test}"
+                        for class_id, test_list in batch.items()
+                        for each_test in test_list
+                    ),
+                    job_id,
+                )
+            )
+            job_ids.append(job_id)
+
+        self._wait_for_tests(job_ids)
+        for job_id in job_ids:
+            self.job_id = job_id
+            self._get_test_results(allow_retries=False)
+
+    def _wait_for_tests(self, job_ids=None):
+        self.poll_job_ids = job_ids or [self.job_id]
         self.poll_complete = False
         self.poll_interval_s = int(self.options.get("poll_interval", 1))
         self.poll_count = 0
         self._poll()
 
     def _poll_action(self):
+        if len(self.poll_job_ids) == 1:
+            job_filter = "ParentJobId = '{}'".format(self.poll_job_ids[0])
+        else:
+            job_filter = "ParentJobId IN ({})".format(
+                self._get_comma_separated_string_of_items(self.poll_job_ids)
+            )
         self.result = self.tooling.query_all(
-            "SELECT Id, Status, ApexClassId FROM ApexTestQueueItem "
-            + "WHERE ParentJobId = '{}'".format(self.job_id)
+            "SELECT Id, Status, ApexClassId FROM ApexTestQueueItem WHERE " + job_filter
         )
+        if self.options["stream_results"]:
+            self._stream_test_results(self.result["records"])
         counts = {
             "Aborted": 0,
             "Completed": 0,
@@ -1,10 +1,12 @@
 import http.client
+import json
 import logging
 import os
 import shutil
 import tempfile
 from copy import deepcopy
 from unittest.mock import MagicMock, Mock, patch
+from urllib.parse import urlencode
 
 import pytest
 import responses
@@ -30,7 +32,12 @@ from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.core.tests.utils import MockLoggerMixin
 from cumulusci.tasks.apex.anon import AnonymousApexTask
 from cumulusci.tasks.apex.batch import BatchApexWait
-from cumulusci.tasks.apex.testrunner import RunApexTests
+from cumulusci.tasks.apex.testrunner import (
+    CODE_COVERAGE_LINES_QUERY,
+    QUEUE_ITEM_RESULT_QUERY,
+    RunApexTests,
+)
+from cumulusci.utils import temporary_dir
 from cumulusci.utils.version_strings import StrictVersion
 
 
@@ -513,6 +520,391 @@ class TestRunApexTests(MockLoggerMixin):
         with pytest.raises(ApexTestException):
             task()
 
+    @responses.activate
+    def test_run_task__retry_tests_batched(self):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[
+                query_string_matcher(
+                    "q=SELECT+Id%2C+Name+FROM+ApexClass+WHERE+NamespacePrefix+%3D+null"
+                    + "+AND+%28Name+LIKE+%27%25_TEST%27%29"
+                )
+            ],
+            json={
+                "done": True,
+                "records": [
+                    {"Id": 1, "Name": "TestClass_TEST"},
+                    {"Id": 2, "Name": "OtherClass_TEST"},
+                ],
+                "totalSize": 2,
+            },
+        )
+        self._mock_run_tests()
+        self._mock_run_tests(body="JOBID_A")
+        self._mock_run_tests(body="JOBID_B")
+        self._mock_tests_complete()
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[
+                query_string_matcher(
+                    "q=SELECT+Id%2C+Status%2C+ApexClassId+FROM+ApexTestQueueItem+"
+                    + "WHERE+ParentJobId+IN+%28%27JOBID_A%27%2C%27JOBID_B%27%29"
+                )
+            ],
+            json={
+                "done": True,
+                "totalSize": 2,
+                "records": [{"Status": "Completed"}, {"Status": "Completed"}],
+            },
+        )
+        results = self._get_mock_test_query_results(
+            ["TestOne", "TestTwo", "TestThree"],
+            ["Fail", "Fail", "Fail"],
+            ["UNABLE_TO_LOCK_ROW"] * 3,
+        )
+        results["records"][2]["ApexClassId"] = 2
+        url, query_string = self._get_mock_test_query_url("JOB_ID1234567")
+        responses.add(
+            responses.GET, url, match=[query_string_matcher(query_string)], json=results
+        )
+        self._mock_get_test_results_multiple(
+            ["TestOne", "TestTwo"], ["Pass", "Pass"], ["", ""], job_id="JOBID_A"
+        )
+        results = self._get_mock_test_query_results(["TestThree"], ["Pass"], [""])
+        results["records"][0]["ApexClassId"] = 2
+        url, query_string = self._get_mock_test_query_url("JOBID_B")
+        responses.add(
+            responses.GET, url, match=[query_string_matcher(query_string)], json=results
+        )
+        for job_id in ("JOB_ID1234567", "JOBID_A", "JOBID_B"):
+            self._mock_get_failed_test_classes(job_id=job_id)
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "retry_failures": ["UNABLE_TO_LOCK_ROW"],
+            "retry_mode": "batched",
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        task()
+
+        run_bodies = [
+            json.loads(call.request.body)
+            for call in responses.calls
+            if call.request.url.endswith("runTestsAsynchronous")
+        ]
+        assert run_bodies[1:] == [
+            {"tests": [{"classId": 1, "testMethods": ["TestOne", "TestTwo"]}]},
+            {"tests": [{"classId": 2, "testMethods": ["TestThree"]}]},
+        ]
+        assert task.counts["Fail"] == 0
+        result = task.results_by_class_name["OtherClass_TEST"]["TestThree"]
+        assert result["Outcome"] == "Pass"
+
+    def _mock_queue_items(self, *statuses, job_id="JOB_ID1234567"):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[
+                query_string_matcher(
+                    "q=SELECT+Id%2C+Status%2C+ApexClassId+FROM+ApexTestQueueItem+"
+                    + f"WHERE+ParentJobId+%3D+%27{job_id}%27"
+                )
+            ],
+            json={
+                "done": True,
+                "totalSize": len(statuses),
+                "records": [
+                    {"Id": f"QI{i}", "Status": status, "ApexClassId": 1}
+                    for i, status in enumerate(statuses)
+                ],
+            },
+        )
+
+    def _mock_queue_item_results(self, queue_item_ids, *args):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[
+                query_string_matcher(
+                    urlencode(
+                        {
+                            "q": QUEUE_ITEM_RESULT_QUERY.format(
+                                ",".join(f"'{id}'" for id in queue_item_ids)
+                            )
+                        }
+                    )
+                )
+            ],
+            json=self._get_mock_test_query_results(*args),
+        )
+
+    @responses.activate
+    def test_run_task__stream_results(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_queue_items("Completed", "Completed")
+        self._mock_queue_item_results(
+            ["QI0", "QI1"], ["TestOne", "TestTwo"], ["Pass", "Fail"], ["", "Boom"]
+        )
+        self._mock_get_failed_test_classes()
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "json_output": "results.json",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "stream_results": True,
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        with temporary_dir():
+            with pytest.raises(ApexTestException):
+                task()
+            with open("results.json") as f:
+                output = json.load(f)
+
+        assert [(r["Method"], r["Outcome"]) for r in output] == [
+            ("TestOne", "Pass"),
+            ("TestTwo", "Fail"),
+        ]
+        assert task.counts["Pass"] == task.counts["Fail"] == 1
+        assert "Fail: TestClass_TEST.TestTwo - Boom" in self.task_log["error"]
+        # Results are not queried again for the whole job
+        assert not any("AsyncApexJobId" in call.request.url for call in responses.calls)
+
+    @responses.activate
+    def test_run_task__fail_fast(self):
+        self._mock_apex_class_query()
+        self._mock_run_tests()
+        self._mock_queue_items("Completed", "Queued", "Processing")
+        self._mock_queue_items("Completed", "Aborted", "Aborted")
+        self._mock_queue_item_results(["QI0"], ["TestOne"], ["Fail"], ["Boom"])
+        self._mock_queue_item_results(["QI1", "QI2"], [], [], [])
+        self._mock_get_failed_test_classes()
+        for queue_item_id in ("QI1", "QI2"):
+            responses.add(
+                responses.PATCH,
+                self.base_tooling_url + f"sobjects/ApexTestQueueItem/{queue_item_id}",
+                status=204,
+                match=[responses.matchers.json_params_matcher({"Status": "Aborted"})],
+            )
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "retry_failures": ["UNABLE_TO_LOCK_ROW"],
+            "fail_fast": 1,
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        with patch("cumulusci.core.tasks.time.sleep"):
+            with pytest.raises(ApexTestException):
+                task()
+
+        assert task.aborted
+        assert task.options["stream_results"]
+        assert "1 tests failed; aborting 2 remaining test classes." in (
+            self.task_log["error"]
+        )
+
+    @pytest.mark.parametrize("fail_fast", ["-1", "some"])
+    def test_init_options__bad_fail_fast(self, fail_fast):
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "test_name_match": "%_TEST",
+            "fail_fast": fail_fast,
+        }
+        with pytest.raises(TaskOptionsError, match="fail_fast"):
+            RunApexTests(self.project_config, task_config, self.org_config)
+
+    def _mock_test_classes(self, *classes):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[
+                query_string_matcher(
+                    "q=SELECT+Id%2C+Name+FROM+ApexClass+WHERE+NamespacePrefix+%3D+null"
+                    + "+AND+%28Name+LIKE+%27%25_TEST%27%29"
+                )
+            ],
+            json={
+                "done": True,
+                "records": [{"Id": id, "Name": name} for id, name in classes],
+                "totalSize": len(classes),
+            },
+        )
+
+    def _mock_coverage_lines(self, covered, uncovered):
+        responses.add(
+            responses.GET,
+            self.base_tooling_url + "query/",
+            match=[query_string_matcher(urlencode({"q": CODE_COVERAGE_LINES_QUERY}))],
+            json={
+                "done": True,
+                "totalSize": 1,
+                "records": [
+                    {
+                        "ApexClassOrTrigger": {"Name": "Foo"},
+                        "Coverage": {
+                            "coveredLines": covered,
+                            "uncoveredLines": uncovered,
+                        },
+                    }
+                ],
+            },
+        )
+
+    @responses.activate
+    def test_run_task__sharded(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        (tmp_path / "apex_test_runtimes.json").write_text(
+            json.dumps({"TestClass_TEST": 100, "OtherClass_TEST": 50})
+        )
+        shard_org_config = OrgConfig(
+            {
+                "id": "foo/2",
+                "instance_url": "https://shard.example.com",
+                "access_token": "abc123",
+            },
+            "shard",
+        )
+        self.project_config.keychain.get_org = Mock(return_value=shard_org_config)
+
+        # The task's org runs TestClass_TEST
+        self._mock_test_classes((1, "TestClass_TEST"), (2, "OtherClass_TEST"))
+        self._mock_run_tests()
+        self._mock_tests_complete()
+        self._mock_get_failed_test_classes()
+        self._mock_get_test_results(methodname=["TestOne"])
+        self._mock_coverage_lines([1, 2], [3, 4])
+
+        # The shard org runs OtherClass_TEST, which has a different Id there
+        self.base_tooling_url = self.base_tooling_url.replace(
+            "example.com", "shard.example.com"
+        )
+        self._mock_test_classes((10, "TestClass_TEST"), (20, "OtherClass_TEST"))
+        self._mock_run_tests(body="JOB_SHARD")
+        self._mock_tests_complete(job_id="JOB_SHARD")
+        self._mock_get_failed_test_classes(job_id="JOB_SHARD")
+        results = self._get_mock_test_query_results(["TestTwo"], ["Pass"], [""])
+        results["records"][0]["ApexClassId"] = 20
+        results["records"][0]["RunTime"] = 80
+        url, query_string = self._get_mock_test_query_url("JOB_SHARD")
+        responses.add(
+            responses.GET, url, match=[query_string_matcher(query_string)], json=results
+        )
+        self._mock_coverage_lines([3], [1, 2, 4])
+
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "junit_output": "results_junit.xml",
+            "json_output": "results.json",
+            "poll_interval": 1,
+            "test_name_match": "%_TEST",
+            "shard_orgs": "shard",
+            "required_org_code_coverage_percent": "75",
+        }
+        self.org_config._installed_packages = {}
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        with temporary_dir():
+            task()
+            with open("results.json") as f:
+                output = json.load(f)
+
+        self.project_config.keychain.get_org.assert_called_once_with("shard")
+        run_bodies = [
+            (call.request.url, json.loads(call.request.body))
+            for call in responses.calls
+            if call.request.url.endswith("runTestsAsynchronous")
+        ]
+        assert sorted(run_bodies) == [
+            (
+                "https://example.com/services/data/v38.0/tooling/runTestsAsynchronous",
+                {"classids": "1"},
+            ),
+            (
+                "https://shard.example.com/services/data/v38.0/tooling/runTestsAsynchronous",
+                {"classids": "20"},
+            ),
+        ]
+        assert [(r["ClassName"], r["Method"]) for r in output] == [
+            ("OtherClass_TEST", "TestTwo"),
+            ("TestClass_TEST", "TestOne"),
+        ]
+        assert task.counts["Pass"] == 2
+        assert "Organization-wide code coverage of 75.0% meets expectations." in (
+            self.task_log["info"]
+        )
+        assert json.loads((tmp_path / "apex_test_runtimes.json").read_text()) == {
+            "TestClass_TEST": 1707,
+            "OtherClass_TEST": 80,
+        }
+
+    def test_get_shards(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        (tmp_path / "apex_test_runtimes.json").write_text(
+            json.dumps({"A": 100, "B": 60, "C": 50, "D": 10})
+        )
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+
+        # E has no history, so it is assumed to take the average time (55)
+        assert task._get_shards(["A", "B", "C", "D", "E"], 2) == [
+            ["A", "C"],
+            ["B", "E", "D"],
+        ]
+        assert task._get_shards(["A"], 3) == [["A"], [], []]
+
+    def test_load_class_runtimes__invalid(self, tmp_path):
+        self.project_config._cache_dir = tmp_path
+        (tmp_path / "apex_test_runtimes.json").write_text("{")
+        task = RunApexTests(self.project_config, self.task_config, self.org_config)
+
+        assert task._load_class_runtimes() == {}
+        assert "Cannot read Apex test runtimes" in self.task_log["warning"][0]
+
+    def test_get_retry_batches(self):
+        task_config = TaskConfig()
+        task_config.config["options"] = {
+            "test_name_match": "%_TEST",
+            "retry_mode": "batched",
+            "retry_concurrency": "2",
+        }
+        task = RunApexTests(self.project_config, task_config, self.org_config)
+        task.retry_details = {
+            "A": ["a1"],
+            "B": ["b1", "b2", "b3"],
+            "C": ["c1", "c2"],
+            "D": ["d1"],
+        }
+
+        assert task._get_retry_batches() == [
+            {"B": ["b1", "b2", "b3"], "D": ["d1"]},
+            {"C": ["c1", "c2"], "A": ["a1"]},
+        ]
+
+        task.options["retry_concurrency"] = 1
+        assert task._get_retry_batches() == [task.retry_details]
+
+    @pytest.mark.parametrize(
+        "options,error",
+        [
+            ({"retry_mode": "parallel"}, "Invalid retry_mode"),
+            ({"retry_concurrency": "0"}, "retry_concurrency"),
+            ({"retry_concurrency": "many"}, "retry_concurrency"),
+        ],
+    )
+    def test_init_options__bad_retry_options(self, options, error):
+        task_config = TaskConfig()
+        task_config.config["options"] = {"test_name_match": "%_TEST", **options}
+        with pytest.raises(TaskOptionsError, match=error):
+            RunApexTests(self.project_config, task_config, self.org_config)
+
     @responses.activate
     def test_run_task__processing(self):
         self._mock_apex_class_query()
@@ -35,7 +35,7 @@ class DeleteData(BaseSalesforceApiTask):
             "and fields based on the name used in the org. Defaults to True."
         },
         "api": {
-            "description": "The desired Salesforce API to use, which may be 'rest', 'bulk', or "
+            "description": "The desired Salesforce API to use, which may be 'rest', 'bulk', 'bulk2', or "
             "'smart' to auto-select based on record volume. The default is 'smart'."
         },
     }
@@ -67,12 +67,13 @@ class DeleteData(BaseSalesforceApiTask):
         try:
             self.options["api"] = {
                 "bulk": DataApi.BULK,
+                "bulk2": DataApi.BULK2,
                 "rest": DataApi.REST,
                 "smart": DataApi.SMART,
             }[self.options.get("api", "smart").lower()]
         except KeyError:
             raise TaskOptionsError(
-                f"{self.options['api']} is not a valid value for API (valid: bulk, rest, smart)"
+                f"{self.options['api']} is not a valid value for API (valid: bulk, bulk2, rest, smart)"
             )
 
         if self.options["hardDelete"] and self.options["api"] is DataApi.REST:
@@ -12,6 +12,7 @@ from cumulusci.core.exceptions import (
     TaskOptionsError,
 )
 from cumulusci.core.utils import process_bool_arg
+from cumulusci.salesforce_api.describe_cache import DescribeCache
 from cumulusci.tasks.bulkdata.dates import adjust_relative_dates
 from cumulusci.tasks.bulkdata.mapping_parser import (
     parse_from_yaml,
@@ -128,6 +129,7 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
             inject_namespaces=self.options["inject_namespaces"],
             drop_missing=self.options["drop_missing_schema"],
             org_has_person_accounts_enabled=self.org_config.is_person_accounts_enabled,
+            describe_cache=DescribeCache(self.sf, self.org_config, self.logger),
         )
 
     def _soql_for_mapping(self, mapping):
@@ -518,47 +518,30 @@ def _fake_get_org_schema(
     object_counts: T.Dict[str, int],
     **kwargs,
 ):
-    with mock.patch(
-        "cumulusci.salesforce_api.org_schema.count_sobjects",
-        lambda *args: (
-            object_counts,
-            [],
-            [],
+    with (
+        mock.patch(
+            "cumulusci.salesforce_api.org_schema.count_sobjects",
+            lambda *args: (
+                object_counts,
+                [],
+                [],
+            ),
+        ),
+        mock.patch(
+            "cumulusci.salesforce_api.org_schema.create_schema_engine",
+            lambda schema_path: create_engine("sqlite:///"),
+        ),
+        mock.patch(
+            "cumulusci.salesforce_api.org_schema.deep_describe",
+            return_value=(
+                (desc, "Sat, 1 Jan 2000 00:00:01 GMT") for desc in org_describes
+            ),
         ),
-    ), mock.patch(
-        "cumulusci.salesforce_api.org_schema.ZippableTempDb", FakeZippableTempDb
-    ), mock.patch(
-        "cumulusci.salesforce_api.org_schema.deep_describe",
-        return_value=((desc, "Sat, 1 Jan 2000 00:00:01 GMT") for desc in org_describes),
-    ), get_org_schema(
-        FakeSF(), org_config, **kwargs
-    ) as schema:
+        get_org_schema(FakeSF(), org_config, **kwargs) as schema,
+    ):
         yield schema
 
 
-class FakeZippableTempDb:
-    "Fast no-IO database for testing"
-
-    def __enter__(self, *args, **kwargs):
-        return self
-
-    def __exit__(self, *args, **kwargs):
-        return ""
-
-    def zip_database(self, target_path):
-        pass
-
-    def unzip_database(self, zipped_db):
-        pass
-
-    def clear(self):
-        pass
-
-    def create_engine(self):
-        self.engine = create_engine("sqlite:///")
-        return self.engine
-
-
 @contextmanager
 def faketempdb():
     yield Path("")
@@ -1,7 +1,9 @@
+import pickle
 import tempfile
 import typing as T
 from collections import defaultdict
-from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -12,6 +14,7 @@ from sqlalchemy.orm import Session
 from cumulusci.core.enums import StrEnum
 from cumulusci.core.exceptions import BulkDataException, TaskOptionsError
 from cumulusci.core.utils import process_bool_arg
+from cumulusci.salesforce_api.describe_cache import DescribeCache
 from cumulusci.salesforce_api.org_schema import get_org_schema
 from cumulusci.tasks.bulkdata.dates import adjust_relative_dates
 from cumulusci.tasks.bulkdata.mapping_parser import (
@@ -31,6 +34,7 @@ from cumulusci.tasks.bulkdata.query_transformers import (
 )
 from cumulusci.tasks.bulkdata.step import (
     DEFAULT_BULK_BATCH_SIZE,
+    BulkApi2DmlOperation,
     DataApi,
     DataOperationJobResult,
     DataOperationStatus,
@@ -46,9 +50,13 @@ from cumulusci.tasks.bulkdata.upsert_utils import (
 from cumulusci.tasks.bulkdata.utils import (
     RowErrorChecker,
     SqlAlchemyMixin,
+    consume,
     sql_bulk_insert_from_records,
 )
 from cumulusci.tasks.salesforce import BaseSalesforceApiTask
+from cumulusci.utils.iterators import iterate_in_chunks
+
+ROLLBACK_SPILL_CHUNK_SIZE = 10_000
 
 
 class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
@@ -79,6 +87,16 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         "bulk_mode": {
             "description": "Set to Serial to force serial mode on all jobs. Parallel is the default."
         },
+        "batch_workers": {
+            "description": "Number of Bulk API batches to upload, and result files to download, "
+            "concurrently for each step. Defaults to 1 (one batch at a time)."
+        },
+        "concurrent_steps": {
+            "description": "Maximum number of mapping steps to run at the same time. "
+            "A step starts once every earlier step that loads a table it looks up, "
+            "or loads the same sObject or table, has finished. "
+            "Defaults to 1 (run steps one at a time, in mapping order)."
+        },
         "inject_namespaces": {
             "description": "If True, the package namespace prefix will be "
             "automatically added to (or removed from) objects "
@@ -96,6 +114,11 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         "enable_rollback": {
             "description": "When True, performs rollback operation incase of error. Defaults to False"
         },
+        "stream_results": {
+            "description": "When True, Salesforce Ids are written to the local database and row errors "
+            "are checked in chunks as job results arrive, instead of after all results have been "
+            "collected in memory. Recommended for very large steps. Defaults to False."
+        },
     }
     row_warning_limit = 10
 
@@ -112,6 +135,18 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         )
         if self.bulk_mode and self.bulk_mode not in ["Serial", "Parallel"]:
             raise TaskOptionsError("bulk_mode must be either Serial or Parallel")
+        try:
+            self.batch_workers = int(self.options.get("batch_workers") or 1)
+        except ValueError:
+            raise TaskOptionsError("batch_workers must be a positive integer")
+        if self.batch_workers < 1:
+            raise TaskOptionsError("batch_workers must be a positive integer")
+        try:
+            self.concurrent_steps = int(self.options.get("concurrent_steps") or 1)
+        except ValueError:
+            raise TaskOptionsError("concurrent_steps must be a positive integer")
+        if self.concurrent_steps < 1:
+            raise TaskOptionsError("concurrent_steps must be a positive integer")
 
         inject_namespaces = self.options.get("inject_namespaces")
         self.options["inject_namespaces"] = process_bool_arg(
@@ -126,6 +161,9 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         self.options["enable_rollback"] = process_bool_arg(
             self.options.get("enable_rollback", False)
         )
+        self.options["stream_results"] = process_bool_arg(
+            self.options.get("stream_results", False)
+        )
         self._id_generators = {}
         self._old_format = False
         self.ID_TABLE_NAME = ID_TABLE_NAME
@@ -214,35 +252,18 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         with self._init_db():
             self._expand_mapping()
             self._initialize_id_table(self.reset_oids)
-            start_step = self.options.get("start_step")
-            started = False
-            results = {}
-            for name, mapping in self.mapping.items():
-                # Skip steps until start_step
-                if not started and start_step and name != start_step:
-                    self.logger.info(f"Skipping step: {name}")
-                    continue
-
-                started = True
-
-                self.logger.info(f"Running step: {name}")
-                result = self._execute_step(mapping)
-                if result.status is DataOperationStatus.JOB_FAILURE:
-                    raise BulkDataException(
-                        f"Step {name} did not complete successfully: {','.join(result.job_errors)}"
-                    )
-
-                if name in self.after_steps:
-                    for after_name, after_step in self.after_steps[name].items():
-                        self.logger.info(f"Running post-load step: {after_name}")
-                        result = self._execute_step(after_step)
-                        if result.status is DataOperationStatus.JOB_FAILURE:
-                            raise BulkDataException(
-                                f"Step {after_name} did not complete successfully: {','.join(result.job_errors)}"
-                            )
-                results[name] = StepResultInfo(
-                    mapping.sf_object, result, mapping.record_type
+            steps = self._get_steps_to_run()
+            if self.concurrent_steps > 1:
+                step_results = self._run_steps_concurrently(steps)
+            else:
+                step_results = self._run_steps_sequentially(steps)
+            results = {
+                name: StepResultInfo(
+                    mapping.sf_object, step_results[name], mapping.record_type
                 )
+                for name, mapping, parent in steps
+                if name == parent
+            }
         if self.options["set_recently_viewed"]:
             try:
                 self.logger.info("Setting records to 'recently viewed'.")
@@ -262,53 +283,195 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         if set_recently_viewed is not False:
             self.return_values["set_recently_viewed"] = set_recently_viewed
 
+    def _get_steps_to_run(self) -> T.List[T.Tuple[str, MappingStep, str]]:
+        """List the steps to run, in order, as (name, mapping, parent) tuples.
+        Post-load steps follow the step they depend on, which is their parent;
+        other steps are their own parent."""
+        start_step = self.options.get("start_step")
+        started = False
+        steps = []
+        for name, mapping in self.mapping.items():
+            # Skip steps until start_step
+            if not started and start_step and name != start_step:
+                self.logger.info(f"Skipping step: {name}")
+                continue
+
+            started = True
+            steps.append((name, mapping, name))
+            if name in self.after_steps:
+                for after_name, after_step in self.after_steps[name].items():
+                    steps.append((after_name, after_step, name))
+        return steps
+
+    def _run_steps_sequentially(self, steps):
+        """Run each step in turn. Returns the last job result for each parent step."""
+        results = {}
+        for name, mapping, parent in steps:
+            if name == parent:
+                self.logger.info(f"Running step: {name}")
+            else:
+                self.logger.info(f"Running post-load step: {name}")
+            results[parent] = self._check_step_result(name, self._execute_step(mapping))
+        return results
+
+    def _run_steps_concurrently(self, steps):
+        """Run up to `concurrent_steps` steps at the same time, starting each
+        step once all of the steps it depends on have finished.
+
+        Only the Salesforce operation runs on the thread pool. Records are read
+        from the local database, and results written back to it, on this thread,
+        so the database connection is never shared between threads.
+        Returns the last job result for each parent step."""
+        dependencies = self._get_step_dependencies(steps)
+        pending = list(steps)
+        running = {}
+        finished = set()
+        results = {}
+        # The executor is entered last so that it waits for running steps
+        # before their temporary files are closed.
+        with (
+            ExitStack() as files,
+            ThreadPoolExecutor(max_workers=self.concurrent_steps) as executor,
+        ):
+            while pending or running:
+                for name, mapping, parent in list(pending):
+                    if len(running) >= self.concurrent_steps:
+                        break
+                    if not dependencies[name] <= finished:
+                        continue
+                    pending.remove((name, mapping, parent))
+                    if name == parent:
+                        self.logger.info(f"Running step: {name}")
+                    else:
+                        self.logger.info(f"Running post-load step: {name}")
+                    step, query = self._prepare_step(mapping)
+                    local_ids = files.enter_context(tempfile.TemporaryFile(mode="w+t"))
+                    records = files.enter_context(tempfile.TemporaryFile())
+                    self._spool_records(
+                        self._get_step_records(mapping, step, query, local_ids),
+                        records,
+                    )
+                    future = executor.submit(
+                        self._run_step_operation,
+                        mapping,
+                        step,
+                        self._read_spooled_records(records),
+                    )
+                    running[future] = (name, mapping, parent, step, local_ids)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, mapping, parent, step, local_ids = running.pop(future)
+                    future.result()
+                    result = self._finish_step(mapping, step, local_ids)
+                    self.logger.info(f"Finished step: {name}")
+                    results[parent] = self._check_step_result(name, result)
+                    finished.add(name)
+        return results
+
+    @staticmethod
+    def _get_step_dependencies(steps) -> T.Dict[str, T.Set[str]]:
+        """Find the earlier steps that each step must wait for: steps that load
+        a table it looks up, steps that load the same sObject or table,
+        and its parent step."""
+        dependencies = {}
+        for index, (name, mapping, parent) in enumerate(steps):
+            lookup_tables = set()
+            for lookup in mapping.lookups.values():
+                if isinstance(lookup.table, list):
+                    lookup_tables.update(lookup.table)
+                else:
+                    lookup_tables.add(lookup.table)
+            dependencies[name] = {
+                earlier_name
+                for earlier_name, earlier_mapping, _ in steps[:index]
+                if earlier_name == parent
+                or earlier_mapping.table in lookup_tables
+                or earlier_mapping.table == mapping.table
+                or earlier_mapping.sf_object == mapping.sf_object
+            }
+        return dependencies
+
+    def _spool_records(self, records, f):
+        """Write records to a temporary file in chunks, so they can be
+        uploaded from another thread without touching the database."""
+        for chunk in iterate_in_chunks(DEFAULT_BULK_BATCH_SIZE, records):
+            pickle.dump(chunk, f)
+        f.seek(0)
+
+    def _read_spooled_records(self, f):
+        while True:
+            try:
+                chunk = pickle.load(f)
+            except EOFError:
+                return
+            yield from chunk
+
+    def _check_step_result(self, name, result):
+        if result.status is DataOperationStatus.JOB_FAILURE:
+            raise BulkDataException(
+                f"Step {name} did not complete successfully: {','.join(result.job_errors)}"
+            )
+        return result
+
     def _execute_step(
         self, mapping: MappingStep
     ) -> T.Union[DataOperationJobResult, MagicMock]:
         """Load data for a single step."""
+        step, query = self._prepare_step(mapping)
 
+        with tempfile.TemporaryFile(mode="w+t") as local_ids:
+            records = self._get_step_records(mapping, step, query, local_ids)
+            self._run_step_operation(mapping, step, records)
+            return self._finish_step(mapping, step, local_ids)
+
+    def _prepare_step(self, mapping: MappingStep):
+        """Load record types if needed and configure the step and its query."""
         if "RecordTypeId" in mapping.fields:
             conn = self.session.connection()
             self._load_record_types([mapping.sf_object], conn)
             self.session.commit()
 
-        step, query = self.configure_step(mapping)
+        return self.configure_step(mapping)
 
-        with tempfile.TemporaryFile(mode="w+t") as local_ids:
-            # Store the previous values of the records before upsert
-            # This is so that we can perform rollback
-            if (
-                mapping.action
-                in [
-                    DataOperationType.ETL_UPSERT,
-                    DataOperationType.UPSERT,
-                    DataOperationType.UPDATE,
-                ]
-                and self.options["enable_rollback"]
-            ):
-                UpdateRollback.prepare_for_rollback(
-                    self, step, self._stream_queried_data(mapping, local_ids, query)
-                )
-            step.start()
-            if mapping.action == DataOperationType.SELECT:
-                step.select_records(
-                    self._stream_queried_data(mapping, local_ids, query)
-                )
-            else:
-                step.load_records(self._stream_queried_data(mapping, local_ids, query))
-            step.end()
+    def _get_step_records(self, mapping: MappingStep, step, query, local_ids):
+        # Store the previous values of the records before upsert
+        # This is so that we can perform rollback
+        if (
+            mapping.action
+            in [
+                DataOperationType.ETL_UPSERT,
+                DataOperationType.UPSERT,
+                DataOperationType.UPDATE,
+            ]
+            and self.options["enable_rollback"]
+        ):
+            UpdateRollback.prepare_for_rollback(
+                self, step, self._stream_queried_data(mapping, local_ids, query)
+            )
+        return self._stream_queried_data(mapping, local_ids, query)
 
-            # Process Job Results
-            if step.job_result.status is not DataOperationStatus.JOB_FAILURE:
-                local_ids.seek(0)
-                self._process_job_results(mapping, step, local_ids)
-            elif (
-                step.job_result.status is DataOperationStatus.JOB_FAILURE
-                and self.options["enable_rollback"]
-            ):
-                Rollback._perform_rollback(self)
+    def _run_step_operation(self, mapping: MappingStep, step, records):
+        """Run the Salesforce side of a step."""
+        step.start()
+        if mapping.action == DataOperationType.SELECT:
+            step.select_records(records)
+        else:
+            step.load_records(records)
+        step.end()
+
+    def _finish_step(self, mapping: MappingStep, step, local_ids):
+        # Process Job Results
+        if step.job_result.status is not DataOperationStatus.JOB_FAILURE:
+            local_ids.seek(0)
+            self._process_job_results(mapping, step, local_ids)
+        elif (
+            step.job_result.status is DataOperationStatus.JOB_FAILURE
+            and self.options["enable_rollback"]
+        ):
+            Rollback._perform_rollback(self)
 
-            return step.job_result
+        return step.job_result
 
     def process_lookup_fields(self, mapping, fields, polymorphic_fields):
         """Modify fields and priority fields based on lookup and polymorphic checks."""
@@ -409,7 +572,11 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
     def configure_step(self, mapping):
         """Create a step appropriate to the action"""
         bulk_mode = mapping.bulk_mode or self.bulk_mode or "Parallel"
-        api_options = {"batch_size": mapping.batch_size, "bulk_mode": bulk_mode}
+        api_options = {
+            "batch_size": mapping.batch_size,
+            "bulk_mode": bulk_mode,
+            "batch_workers": self.batch_workers,
+        }
         num_records_in_target = None
         content_type = None
 
@@ -643,16 +810,19 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         )
 
         conn = self.session.connection()
-        sf_id_results = self._generate_results_id_map(step, local_ids)
-
-        for i in range(len(sf_id_results)):
-            # Check for old_format of load sql files
-            if str(sf_id_results[i][0]).isnumeric():
-                self._old_format = True
-                # Set id column with new naming format (<sobject> - <counter>)
-                sf_id_results[i][0] = mapping.table + "-" + str(sf_id_results[i][0])
-            else:
-                break
+        if self.options["stream_results"]:
+            sf_id_results = self._stream_results_id_map(mapping, step, local_ids)
+        else:
+            sf_id_results = self._generate_results_id_map(step, local_ids)
+
+            for i in range(len(sf_id_results)):
+                # Check for old_format of load sql files
+                if str(sf_id_results[i][0]).isnumeric():
+                    self._old_format = True
+                    # Set id column with new naming format (<sobject> - <counter>)
+                    sf_id_results[i][0] = mapping.table + "-" + str(sf_id_results[i][0])
+                else:
+                    break
         # If we know we have no successful inserts, don't attempt to persist Ids.
         # Do, however, drain the generator to get error-checking behavior.
         if is_insert_upsert_or_select and (
@@ -665,6 +835,8 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
                 columns=("id", "sf_id"),
                 record_iterable=sf_id_results,
             )
+        else:
+            consume(sf_id_results)
 
         # Contact records for Person Accounts are inserted during an Account
         # sf_object step.  Insert records into the Contact ID table for
@@ -723,6 +895,59 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             CreateRollback.prepare_for_rollback(self, step, created_results)
         return sf_id_results
 
+    def _stream_results_id_map(self, mapping, step, local_ids):
+        """Generator version of _generate_results_id_map, which yields rows
+        for the id table as results arrive instead of materializing them.
+
+        Row errors are checked as they are encountered and created records
+        are spilled to the insert_rollback table in chunks. If a row error
+        stops the load and rollback is enabled, the remaining results are
+        drained so that every created record is rolled back."""
+        error_checker = RowErrorChecker(
+            self.logger, self.options["ignore_row_errors"], self.row_warning_limit
+        )
+        enable_rollback = self.options["enable_rollback"]
+        local_ids = (lid.strip("\n") for lid in local_ids)
+        results = zip(step.get_results(), local_ids)
+        created_results = []
+        check_old_format = True
+
+        def spill_created_results(force=False):
+            if created_results and (
+                force or len(created_results) >= ROLLBACK_SPILL_CHUNK_SIZE
+            ):
+                CreateRollback.prepare_for_rollback(self, step, created_results)
+                created_results.clear()
+
+        try:
+            for result, local_id in results:
+                if result.success:
+                    # Check for old_format of load sql files
+                    if check_old_format and local_id.isnumeric():
+                        self._old_format = True
+                        # Set id column with new naming format (<sobject> - <counter>)
+                        local_id = mapping.table + "-" + local_id
+                    else:
+                        check_old_format = False
+                    yield [local_id, result.id]
+                    if enable_rollback and result.created:
+                        created_results.append([result.id])
+                        spill_created_results()
+                else:
+                    error_checker.check_for_row_error(result, local_id)
+        except BulkDataException:
+            if enable_rollback:
+                for result, _ in results:
+                    if result.success and result.created:
+                        created_results.append([result.id])
+                        spill_created_results()
+                spill_created_results(force=True)
+                Rollback._perform_rollback(self)
+            raise
+
+        if enable_rollback:
+            spill_created_results(force=True)
+
     def _initialize_id_table(self, should_reset_table):
         """initalize or find table to hold the inserted SF Ids
 
@@ -820,6 +1045,7 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
             data_operation=DataOperationType.INSERT,
             inject_namespaces=self.options["inject_namespaces"],
             drop_missing=self.options["drop_missing_schema"],
+            describe_cache=DescribeCache(self.sf, self.org_config, self.logger),
         )
 
     def _expand_mapping(self):
@@ -1073,6 +1299,8 @@ class Rollback:
             # Store the API in the initialized tables dictionary
             if isinstance(step, RestApiDmlOperation):
                 Rollback._initialized_rollback_tables_api[table_name] = DataApi.REST
+            elif isinstance(step, BulkApi2DmlOperation):
+                Rollback._initialized_rollback_tables_api[table_name] = DataApi.BULK2
             else:
                 Rollback._initialized_rollback_tables_api[table_name] = DataApi.BULK
 
@@ -13,6 +13,7 @@ from typing_extensions import Literal
 
 from cumulusci.core.enums import StrEnum
 from cumulusci.core.exceptions import BulkDataException
+from cumulusci.salesforce_api.describe_cache import DescribeCache
 from cumulusci.tasks.bulkdata.dates import iso_to_date
 from cumulusci.tasks.bulkdata.select_utils import SelectOptions, SelectStrategy
 from cumulusci.tasks.bulkdata.step import DataApi, DataOperationType
@@ -241,6 +242,8 @@ class MappingStep(CCIDictModel):
             assert 0 < v <= 200, "Max 200 batch_size for REST loads"
         elif values["api"] == DataApi.BULK:
             assert 0 < v <= 10_000, "Max 10,000 batch_size for bulk or smart loads"
+        elif values["api"] == DataApi.BULK2:
+            assert 0 < v, "batch_size must be a positive number"
         elif values["api"] == DataApi.SMART and v is not None:
             assert 0 < v < 200, "Max 200 batch_size for Smart loads"
             logger.warning(
@@ -523,6 +526,7 @@ class MappingStep(CCIDictModel):
         inject_namespaces: bool = False,
         drop_missing: bool = False,
         is_load: bool = False,
+        describe_cache: Optional[DescribeCache] = None,
     ):
         """Process the schema elements in this step.
 
@@ -551,8 +555,9 @@ class MappingStep(CCIDictModel):
         else:
             inject = strip = None
 
+        describe_cache = describe_cache or DescribeCache(sf)
         global_describe = CaseInsensitiveDict(
-            {entry["name"]: entry for entry in sf.describe()["sobjects"]}
+            {entry["name"]: entry for entry in describe_cache.describe()["sobjects"]}
         )
         if not self._validate_sobject(global_describe, inject, strip, operation):
             # Don't attempt to validate field permissions if the object doesn't exist.
@@ -560,7 +565,7 @@ class MappingStep(CCIDictModel):
 
         # Validate, inject, and drop (if configured) fields.
         # By this point, we know the attribute is valid.
-        describe = self.describe_data(sf)
+        describe = self.describe_data(sf, describe_cache)
         fields_correct = self._validate_field_dict(
             describe, self.fields, inject, strip, drop_missing, operation
         )
@@ -593,8 +598,10 @@ class MappingStep(CCIDictModel):
 
         return True
 
-    def describe_data(self, sf: Salesforce):
-        return describe_data(self.sf_object, sf)
+    def describe_data(
+        self, sf: Salesforce, describe_cache: Optional[DescribeCache] = None
+    ):
+        return describe_data(self.sf_object, sf, describe_cache)
 
     def dict(self, by_alias=True, exclude_defaults=True, **kwargs):
         out = super().dict(
@@ -638,7 +645,9 @@ def parse_from_yaml(source: Union[str, Path, IO]) -> Dict:
     return MappingSteps.parse_from_yaml(source)
 
 
-def _infer_and_validate_lookups(mapping: Dict, sf: Salesforce):
+def _infer_and_validate_lookups(
+    mapping: Dict, sf: Salesforce, describe_cache: Optional[DescribeCache] = None
+):
     """Validate that all the lookup tables mentioned are valid references
     to the lookup. Also verify that the mapping for the tables are mentioned
     before they are mentioned in the lookups"""
@@ -648,9 +657,7 @@ def _infer_and_validate_lookups(mapping: Dict, sf: Salesforce):
     fail = False
 
     for idx, m in enumerate(mapping.values()):
-        describe = CaseInsensitiveDict(
-            {f["name"]: f for f in getattr(sf, m.sf_object).describe()["fields"]}
-        )
+        describe = describe_data(m.sf_object, sf, describe_cache)
 
         for lookup_name, lookup in m.lookups.items():
             if lookup.after:
@@ -723,13 +730,22 @@ def validate_and_inject_mapping(
     inject_namespaces: bool,
     drop_missing: bool,
     org_has_person_accounts_enabled: bool = False,
+    describe_cache: Optional[DescribeCache] = None,
 ):
     # Check if operation is load or extract
     is_load = True if data_operation == DataOperationType.INSERT else False
+    # Each sObject is described once, however many steps use it.
+    describe_cache = describe_cache or DescribeCache(sf)
 
     should_continue = [
         m.validate_and_inject_namespace(
-            sf, namespace, data_operation, inject_namespaces, drop_missing, is_load
+            sf,
+            namespace,
+            data_operation,
+            inject_namespaces,
+            drop_missing,
+            is_load,
+            describe_cache=describe_cache,
         )
         for m in mapping.values()
     ]
@@ -749,8 +765,7 @@ def validate_and_inject_mapping(
 
         # Remove any remaining lookups to dropped objects.
         for m in mapping.values():
-            describe = getattr(sf, m.sf_object).describe()
-            describe = {entry["name"]: entry for entry in describe["fields"]}
+            describe = describe_data(m.sf_object, sf, describe_cache)
 
             for field in list(m.lookups.keys()):
                 lookup = m.lookups[field]
@@ -775,7 +790,9 @@ def validate_and_inject_mapping(
 
     # Infer/validate lookups
     if is_load:
-        _infer_and_validate_lookups(mapping, sf)
+        _infer_and_validate_lookups(mapping, sf, describe_cache)
+
+    describe_cache.log_stats()
 
     # If the org has person accounts enable, add a field mapping to track "IsPersonAccount".
     # IsPersonAccount field values are used to properly load person account records.
@@ -806,6 +823,11 @@ def _inject_or_strip_name(name, transform, global_describe):
 
 
 @lru_cache(maxsize=50)
-def describe_data(obj: str, sf: Salesforce):
-    describe = getattr(sf, obj).describe()
+def describe_data(
+    obj: str, sf: Salesforce, describe_cache: Optional[DescribeCache] = None
+):
+    if describe_cache:
+        describe = describe_cache.describe_sobject(obj)
+    else:
+        describe = getattr(sf, obj).describe()
     return CaseInsensitiveDict({entry["name"]: entry for entry in describe["fields"]})
@@ -55,8 +55,9 @@ ERROR_THRESHOLD = (
     0  # TODO v2.1: Allow this to be a percentage of recent records instead
 )
 
-# time between "ticks" where the task re-evaluates its progress
-# relatively arbitrary trade-off between busy-waiting and adding latency.
+# The task re-evaluates its progress as soon as a worker finishes a job.
+# When no worker finishes for this many seconds, it re-evaluates anyway
+# so that it can report its progress.
 WAIT_TIME = 3
 
 
@@ -140,6 +141,11 @@ class Snowfakery(BaseSalesforceApiTask):
             "description": "Boolean: should we continue loading even after running into row errors? "
             "Defaults to False."
         },
+        "max_jobs_per_worker": {
+            "description": "Number of portions each data generating or loading worker handles "
+            "before it is replaced. Workers that handle more than one portion keep their "
+            "Salesforce connection, which speeds up runs with many small portions. Defaults to 1."
+        },
     }
 
     def _validate_options(self):
@@ -160,6 +166,10 @@ class Snowfakery(BaseSalesforceApiTask):
         self.drop_missing_schema = process_bool_arg(
             self.options.get("drop_missing_schema", False)
         )
+        max_jobs_per_worker = str(self.options.get("max_jobs_per_worker", 1))
+        if not max_jobs_per_worker.isdigit() or int(max_jobs_per_worker) < 1:
+            raise TaskOptionsError("max_jobs_per_worker must be a positive integer")
+        self.max_jobs_per_worker = int(max_jobs_per_worker)
 
         loading_rules = process_list_arg(self.options.get("loading_rules")) or []
         self.loading_rules = [Path(path) for path in loading_rules if path]
@@ -257,13 +267,16 @@ class Snowfakery(BaseSalesforceApiTask):
             # Retrieve OrgRecordCounts code from
             # https://github.com/SFDO-Tooling/CumulusCI/commit/7d703c44b94e8b21f165e5538c2249a65da0a9eb#diff-54676811961455410c30d9c9405a8f3b9d12a6222a58db9d55580a2da3cfb870R147
 
-            self._loop(
-                template_path,
-                working_directory,
-                None,
-                portions,
-            )
-            self.finish()
+            try:
+                self._loop(
+                    template_path,
+                    working_directory,
+                    None,
+                    portions,
+                )
+                self.finish()
+            finally:
+                self.queue_manager.shutdown()
 
     def _setup_channels_and_queues(self, working_directory):
         """Set up all of the channels and queues.
@@ -284,6 +297,7 @@ class Snowfakery(BaseSalesforceApiTask):
             project_config=self.project_config,
             logger=self.logger,
             subtask_configurator=subtask_configurator,
+            max_jobs_per_worker=self.max_jobs_per_worker,
         )
         if len(self.channel_configs) == 1:
             channel = self.channel_configs[0]
@@ -347,6 +361,7 @@ class Snowfakery(BaseSalesforceApiTask):
         upload_status = self.get_upload_status(
             portions.next_batch_size,
         )
+        next_report_time = 0
 
         while not portions.done(upload_status.total_sets_working_on_or_uploaded):
             if self.debug_mode:
@@ -360,14 +375,18 @@ class Snowfakery(BaseSalesforceApiTask):
                 self.get_upload_status,
             )
             self.update_running_totals()
-            self.print_running_totals()
+            report_progress = time.time() >= next_report_time
+            if report_progress:
+                self.print_running_totals()
+                next_report_time = time.time() + WAIT_TIME
 
-            time.sleep(WAIT_TIME)
+            self.queue_manager.wait_for_workers(WAIT_TIME)
 
             upload_status = self._report_status(
                 portions.batch_size,
                 org_record_counts_thread,
                 template_path,
+                report_progress,
             )
 
         return upload_status
@@ -377,17 +396,18 @@ class Snowfakery(BaseSalesforceApiTask):
         batch_size,
         org_record_counts_thread,
         template_path,
+        report_progress=True,
     ):
         """Let the user know what is going on."""
-        self.logger.info(
-            "\n********** PROGRESS *********",
-        )
-
         upload_status = self.get_upload_status(
             batch_size or 0,
         )
 
-        self.logger.info(upload_status._display(detailed=self.debug_mode))
+        if report_progress:
+            self.logger.info(
+                "\n********** PROGRESS *********",
+            )
+            self.logger.info(upload_status._display(detailed=self.debug_mode))
 
         if upload_status.sets_failed:
             # TODO: this is not sufficiently tested.
@@ -458,7 +478,7 @@ class Snowfakery(BaseSalesforceApiTask):
                 cooldown = 5
             else:
                 cooldown -= 1
-            time.sleep(WAIT_TIME)
+            self.queue_manager.wait_for_workers(WAIT_TIME)
 
         self.log_failures()
 
@@ -45,6 +45,7 @@ class SnowfakeryChannelManager:
         *,
         project_config,
         logger,
+        max_jobs_per_worker: int = 1,
     ):
         # Look at the docstring on get_results_report to understand
         # what this queue is for.
@@ -59,10 +60,18 @@ class SnowfakeryChannelManager:
         # and work across processes, (PR #3080) but it's dramatically
         # slower. See attachment to PR #3076
         self.results_reporter = queue.Queue()
+
+        # Every worker, whether a thread or a process, sends its working
+        # directory down this pipe when it finishes, so the controller can
+        # hand out the next portion without waiting for the next tick.
+        self.worker_events, self.worker_finished = WorkerQueue.context.Pipe(
+            duplex=False
+        )
         self.channels = []
         self.project_config = project_config
         self.logger = logger
         self.subtask_configurator = subtask_configurator
+        self.max_jobs_per_worker = max_jobs_per_worker
         self.start_time = time.time()
 
     def add_channel(
@@ -86,6 +95,8 @@ class SnowfakeryChannelManager:
                 subtask_configurator=self.subtask_configurator,
                 logger=self.logger,
                 results_reporter=self.results_reporter,
+                worker_finished=self.worker_finished,
+                max_jobs_per_worker=self.max_jobs_per_worker,
                 recipe_options=recipe_options,
             )
         )
@@ -158,6 +169,19 @@ class SnowfakeryChannelManager:
             **summed_statuses,
         )
 
+    def wait_for_workers(self, timeout: float) -> bool:
+        """Wait until a worker finishes its job or `timeout` seconds pass.
+
+        Returns whether any worker finished."""
+        if not self.worker_events.poll(timeout):
+            return False
+        while self.worker_events.poll():
+            working_dir = self.worker_events.recv()
+            for channel in self.channels:
+                if channel.reap_worker(working_dir):
+                    break
+        return True
+
     def elapsed_seconds(self):
         return time.time() - self.start_time
 
@@ -173,6 +197,11 @@ class SnowfakeryChannelManager:
             channel.tick()
         return all([channel.check_finished() for channel in self.channels])
 
+    def shutdown(self):
+        """Let pooled workers exit once they have finished their jobs"""
+        for channel in self.channels:
+            channel.shutdown()
+
     def get_results_report(self, block=False):
         """
         This is a realtime reporting channel which could, in theory, be updated
@@ -199,6 +228,8 @@ class Channel:
         logger,
         recipe_options=None,
         results_reporter=None,
+        worker_finished=None,
+        max_jobs_per_worker: int = 1,
     ):
         self.project_config = project_config
         self.org_config = org_config
@@ -209,6 +240,8 @@ class Channel:
         self.run_until = subtask_configurator.run_until
         self.logger = logger
         self.results_reporter = results_reporter
+        self.worker_finished = worker_finished
+        self.max_jobs_per_worker = max_jobs_per_worker
         self.filesystem_lock = Lock()
         self.job_counter = 0
         recipe_options = recipe_options or {}
@@ -242,6 +275,7 @@ class Channel:
             make_task_options=data_generator_opts_callback,
             queue_size=0,
             num_workers=self.num_generator_workers,
+            max_jobs_per_worker=self.max_jobs_per_worker,
         )
         # datagen queues do not get a result reporter because
         # a) we are less curious about how many records have
@@ -249,7 +283,11 @@ class Channel:
         # b) finding a queue type which is not prone to race conditions
         #    or perf slowdowns with "Process" task types (sub-processes)
         # is a challenge.
-        self.data_gen_q = WorkerQueue(data_gen_q_config, self.filesystem_lock)
+        self.data_gen_q = WorkerQueue(
+            data_gen_q_config,
+            self.filesystem_lock,
+            worker_finished=self.worker_finished,
+        )
 
         load_data_q_config = WorkerQueueConfig(
             project_config=self.project_config,
@@ -264,9 +302,13 @@ class Channel:
             queue_size=LOAD_QUEUE_SIZE,
             num_workers=self.num_loader_workers,
             rename_directory=self.data_loader_new_directory_name,
+            max_jobs_per_worker=self.max_jobs_per_worker,
         )
         self.load_data_q = WorkerQueue(
-            load_data_q_config, self.filesystem_lock, self.results_reporter
+            load_data_q_config,
+            self.filesystem_lock,
+            self.results_reporter,
+            worker_finished=self.worker_finished,
         )
 
         self.data_gen_q.feeds_data_to(self.load_data_q)
@@ -281,6 +323,15 @@ class Channel:
         """Called every few seconds, to make new data generators if needed."""
         self.data_gen_q.tick()
 
+    def reap_worker(self, working_dir: str) -> bool:
+        return self.data_gen_q.reap_worker(working_dir) or self.load_data_q.reap_worker(
+            working_dir
+        )
+
+    def shutdown(self):
+        self.data_gen_q.shutdown()
+        self.load_data_q.shutdown()
+
     @property
     def full(self):
         return self.data_gen_q.full
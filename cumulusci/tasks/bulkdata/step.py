@@ -6,7 +6,10 @@ import pathlib
 import tempfile
 import time
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from decimal import Decimal, InvalidOperation
 from itertools import tee
 from typing import Any, Dict, List, NamedTuple, Optional, Union
 from urllib.parse import quote
@@ -30,6 +33,8 @@ from cumulusci.utils.xml import lxml_parse_string
 DEFAULT_BULK_BATCH_SIZE = 10_000
 DEFAULT_REST_BATCH_SIZE = 200
 MAX_REST_BATCH_SIZE = 200
+BULK2_MAX_UPLOAD_SIZE = 100_000_000  # bytes of raw CSV per Bulk API 2.0 job
+BULK2_QUERY_API_VERSION = 47.0
 HIGH_PRIORITY_VALUE = 3
 LOW_PRIORITY_VALUE = 0.5
 csv.field_size_limit(2**27)  # 128 MB
@@ -76,20 +81,31 @@ class DataOperationJobResult(NamedTuple):
         return namedtuple_as_simple_dict(self)
 
 
+def download_to_tempfile(uri, bulk_api, *, chunk_size=8192) -> str:
+    """Download the Bulk API result file for a single batch into a
+    temporary file and return its path. The caller must remove the file."""
+    (handle, path) = tempfile.mkstemp(text=False)
+    try:
+        with os.fdopen(handle, "wb") as f:
+            resp = requests.get(uri, headers=bulk_api.headers(), stream=True)
+            resp.raise_for_status()
+            # VCR needs a chunk_size
+            for chunk in resp.iter_content(chunk_size=chunk_size):
+                # specific chunk_size seems to make no measurable perf difference
+                f.write(chunk)
+    except BaseException:
+        pathlib.Path(path).unlink()
+        raise
+
+    return path
+
+
 @contextmanager
 def download_file(uri, bulk_api, *, chunk_size=8192):
     """Download the Bulk API result file for a single batch,
     and remove it when the context manager exits."""
+    path = download_to_tempfile(uri, bulk_api, chunk_size=chunk_size)
     try:
-        (handle, path) = tempfile.mkstemp(text=False)
-        resp = requests.get(uri, headers=bulk_api.headers(), stream=True)
-        resp.raise_for_status()
-        f = os.fdopen(handle, "wb")
-        for chunk in resp.iter_content(chunk_size=chunk_size):  # VCR needs a chunk_size
-            # specific chunk_size seems to make no measurable perf difference
-            f.write(chunk)
-
-        f.close()
         with open(path, "r", newline="", encoding="utf-8") as f:
             yield f
     finally:
@@ -192,6 +208,127 @@ class BulkJobMixin:
         return result
 
 
+class CsvBatchMixin:
+    """Provides CSV serialization of record batches for operations that upload CSV data."""
+
+    def _batch(self, records, n, char_limit=10000000):
+        """Given an iterator of records, yields batches of
+        records serialized in .csv format. Each batch is a single
+        bytes object, including the header row, ready to be posted.
+
+        Batches adhere to the following, in order of precedence:
+        (1) They do not exceed the given character limit
+        (2) They do not contain more than n records per batch
+        """
+        # Rows are encoded straight into one buffer per batch. write_through
+        # makes every row land in `buffer` as soon as it is written, so
+        # buffer.tell() is the encoded size of the batch so far.
+        buffer = io.BytesIO()
+        stream = io.TextIOWrapper(
+            buffer, encoding="utf-8", newline="", write_through=True
+        )
+        csv_writer = csv.writer(stream, quoting=csv.QUOTE_ALL)
+        csv_writer.writerow(self.fields)
+        header = buffer.getvalue()
+
+        def start_batch(first_row=b""):
+            buffer.seek(0)
+            buffer.truncate()
+            buffer.write(header)
+            buffer.write(first_row)
+
+        batch_count = 0
+        for record in records:
+            record_start = buffer.tell()
+            csv_writer.writerow(record)
+
+            # Does this record put us over the character limit?
+            if buffer.tell() > char_limit and batch_count:
+                buffer.seek(record_start)
+                serialized_record = buffer.read()
+                buffer.truncate(record_start)
+                yield buffer.getvalue()
+                start_batch(serialized_record)
+                batch_count = 0
+
+            batch_count += 1
+
+            # yield batch if we're at desired size
+            if batch_count == n:
+                yield buffer.getvalue()
+                start_batch()
+                batch_count = 0
+
+        # give back anything leftover
+        if batch_count:
+            yield buffer.getvalue()
+
+
+class BulkApi2JobMixin:
+    """Provides mixin utilities for classes that manage Bulk API 2.0 jobs."""
+
+    def _bulk2_request(self, method, path, **kwargs):
+        """Make a request to a path relative to the REST API base url."""
+        return self.sf._call_salesforce(
+            method, self.sf.base_url + path, name=path, **kwargs
+        )
+
+    @contextmanager
+    def _bulk2_download(self, path, params=None, *, chunk_size=8192):
+        """Download a Bulk API 2.0 result file, yielding the open file and
+        the response headers. The file is removed when the context manager exits."""
+        (handle, local_path) = tempfile.mkstemp(text=False)
+        try:
+            with os.fdopen(handle, "wb") as f:
+                resp = self._bulk2_request("GET", path, params=params, stream=True)
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+            with open(local_path, "r", newline="", encoding="utf-8") as f:
+                yield f, resp.headers
+        finally:
+            pathlib.Path(local_path).unlink()
+
+    def _wait_for_bulk2_job(self, job_type, job_id):
+        """Wait for the given ingest or query job to reach a final state
+        and return the job info."""
+        while True:
+            job_info = self._bulk2_request("GET", f"jobs/{job_type}/{job_id}").json()
+            self.logger.info(
+                f"Waiting for job {job_id} ({job_info.get('numberRecordsProcessed', 0)} records processed)"
+            )
+            if job_info["state"] in ("JobComplete", "Failed", "Aborted"):
+                break
+
+            time.sleep(10)
+
+        result = self._bulk2_job_result(job_info)
+        self.logger.info(f"Job {job_id} finished with result: {result.status.value}")
+        if result.status is DataOperationStatus.JOB_FAILURE:
+            for error in result.job_errors:
+                self.logger.error(f"Job failure message: {error}")
+        return job_info
+
+    def _bulk2_job_result(self, job_info):
+        """Generate a summary status record from Bulk API 2.0 job info."""
+        records_processed = job_info.get("numberRecordsProcessed", 0)
+        records_failed = job_info.get("numberRecordsFailed", 0)
+        if job_info["state"] == "Aborted":
+            status = DataOperationStatus.ABORTED
+        elif job_info["state"] == "Failed":
+            return DataOperationJobResult(
+                DataOperationStatus.JOB_FAILURE,
+                [job_info.get("errorMessage") or "Unknown error"],
+                records_processed,
+                records_failed,
+            )
+        elif records_failed:
+            status = DataOperationStatus.ROW_FAILURE
+        else:
+            status = DataOperationStatus.SUCCESS
+
+        return DataOperationJobResult(status, [], records_processed, records_failed)
+
+
 class BaseDataOperation(metaclass=ABCMeta):
     """Abstract base class for all data operations (queries and DML)."""
 
@@ -295,6 +432,50 @@ class RestApiQueryOperation(BaseQueryOperation):
                 return
 
 
+class BulkApi2QueryOperation(BaseQueryOperation, BulkApi2JobMixin):
+    """Operation class for Bulk API 2.0 query jobs."""
+
+    def query(self):
+        job = self._bulk2_request(
+            "POST",
+            "jobs/query",
+            json={
+                "operation": "query",
+                "query": self.soql,
+                "contentType": "CSV",
+                "columnDelimiter": "COMMA",
+                "lineEnding": "LF",
+            },
+        ).json()
+        self.job_id = job["id"]
+        self.logger.info(f"Created Bulk API 2.0 query job {self.job_id}")
+
+        job_info = self._wait_for_bulk2_job("query", self.job_id)
+        self.job_result = self._bulk2_job_result(job_info)
+
+    def get_results(self):
+        """Stream result rows one page at a time, following the Sforce-Locator
+        header until the last page."""
+        params = {}
+        if self.api_options.get("batch_size"):
+            params["maxRecords"] = self.api_options["batch_size"]
+
+        while True:
+            with self._bulk2_download(f"jobs/query/{self.job_id}/results", params) as (
+                f,
+                headers,
+            ):
+                reader = csv.reader(f)
+                self.headers = next(reader, None)
+                if self.headers:
+                    yield from reader
+
+            locator = headers.get("Sforce-Locator")
+            if not locator or locator == "null":
+                return
+            params["locator"] = locator
+
+
 class BaseDmlOperation(BaseDataOperation, metaclass=ABCMeta):
     """Abstract base class for DML operations in all APIs."""
 
@@ -343,7 +524,7 @@ class BaseDmlOperation(BaseDataOperation, metaclass=ABCMeta):
         pass
 
 
-class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
+class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin, CsvBatchMixin):
     """Operation class for all DML operations run using the Bulk API."""
 
     def __init__(
@@ -371,8 +552,9 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         self.api_options["batch_size"] = (
             self.api_options.get("batch_size") or DEFAULT_BULK_BATCH_SIZE
         )
-        self.csv_buff = io.StringIO(newline="")
-        self.csv_writer = csv.writer(self.csv_buff, quoting=csv.QUOTE_ALL)
+        self.api_options["batch_workers"] = max(
+            int(self.api_options.get("batch_workers") or 1), 1
+        )
 
         self.select_operation_executor = SelectOperationExecutor(selection_strategy)
         self.selection_filter = selection_filter
@@ -421,7 +603,7 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
             # Extract update key values from the batch
             update_key_values = [
                 rec[update_key]
-                for rec in csv.DictReader([line.decode("utf-8") for line in batch])
+                for rec in csv.DictReader(io.StringIO(batch.decode("utf-8")))
             ]
 
             # Construct the SOQL query
@@ -450,9 +632,27 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         self.batch_ids = []
 
         batch_size = self.api_options["batch_size"]
-        for count, csv_batch in enumerate(self._batch(records, batch_size)):
-            self.context.logger.info(f"Uploading batch {count + 1}")
-            self.batch_ids.append(self.bulk.post_batch(self.job_id, iter(csv_batch)))
+        batch_workers = self.api_options["batch_workers"]
+        if batch_workers == 1:
+            for count, csv_batch in enumerate(self._batch(records, batch_size)):
+                self.context.logger.info(f"Uploading batch {count + 1}")
+                self.batch_ids.append(self.bulk.post_batch(self.job_id, csv_batch))
+            return
+
+        # Serialize the next batch while up to `batch_workers` batches are
+        # being uploaded. Batch ids are collected in submission order so that
+        # results line up with the local ids of the records we sent.
+        with ThreadPoolExecutor(max_workers=batch_workers) as executor:
+            in_flight = deque()
+            for count, csv_batch in enumerate(self._batch(records, batch_size)):
+                if len(in_flight) >= batch_workers:
+                    self.batch_ids.append(in_flight.popleft().result())
+                self.context.logger.info(f"Uploading batch {count + 1}")
+                in_flight.append(
+                    executor.submit(self.bulk.post_batch, self.job_id, csv_batch)
+                )
+            while in_flight:
+                self.batch_ids.append(in_flight.popleft().result())
 
     def select_records(self, records):
         """Executes a SOQL query to select records and adds them to results"""
@@ -623,53 +823,6 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
 
         return select_query_records
 
-    def _batch(self, records, n, char_limit=10000000):
-        """Given an iterator of records, yields batches of
-        records serialized in .csv format.
-
-        Batches adhere to the following, in order of precedence:
-        (1) They do not exceed the given character limit
-        (2) They do not contain more than n records per batch
-        """
-        serialized_csv_fields = self._serialize_csv_record(self.fields)
-        len_csv_fields = len(serialized_csv_fields)
-
-        # append fields to first row
-        batch = [serialized_csv_fields]
-        current_chars = len_csv_fields
-        for record in records:
-            serialized_record = self._serialize_csv_record(record)
-            # Does the next record put us over the character limit?
-            if len(serialized_record) + current_chars > char_limit:
-                yield batch
-                batch = [serialized_csv_fields]
-                current_chars = len_csv_fields
-
-            batch.append(serialized_record)
-            current_chars += len(serialized_record)
-
-            # yield batch if we're at desired size
-            # -1 due to first row being field names
-            if len(batch) - 1 == n:
-                yield batch
-                batch = [serialized_csv_fields]
-                current_chars = len_csv_fields
-
-        # give back anything leftover
-        if len(batch) > 1:
-            yield batch
-
-    def _serialize_csv_record(self, record):
-        """Given a list of strings (record) return
-        the corresponding record serialized in .csv format"""
-        self.csv_writer.writerow(record)
-        serialized = self.csv_buff.getvalue().encode("utf-8")
-        # flush buffer
-        self.csv_buff.truncate(0)
-        self.csv_buff.seek(0)
-
-        return serialized
-
     def get_results(self):
         """
         Retrieves and processes the results of a Bulk API operation.
@@ -694,6 +847,10 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
 
     def _get_batch_results(self):
         """Handles results for other DataOperationTypes (insert, update, etc.)"""
+        if self.api_options["batch_workers"] > 1:
+            yield from self._get_batch_results_concurrently()
+            return
+
         for batch_id in self.batch_ids:
             try:
                 results_url = (
@@ -710,6 +867,53 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
                     f"Failed to download results for batch {batch_id} ({str(e)})"
                 )
 
+    def _get_batch_results_concurrently(self):
+        """Download batch result files on a thread pool, keeping up to
+        `batch_workers` downloads ahead of the parser, and yield the
+        results in batch order."""
+        batch_workers = self.api_options["batch_workers"]
+
+        def download(batch_id):
+            results_url = (
+                f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result"
+            )
+            return download_to_tempfile(results_url, self.bulk)
+
+        with ThreadPoolExecutor(max_workers=batch_workers) as executor:
+            batch_ids = iter(self.batch_ids)
+            in_flight = deque(
+                (batch_id, executor.submit(download, batch_id))
+                for _, batch_id in zip(range(batch_workers), batch_ids)
+            )
+            try:
+                while in_flight:
+                    batch_id, future = in_flight.popleft()
+                    next_batch_id = next(batch_ids, None)
+                    if next_batch_id is not None:
+                        in_flight.append(
+                            (next_batch_id, executor.submit(download, next_batch_id))
+                        )
+                    try:
+                        path = future.result()
+                        try:
+                            with open(path, "r", newline="", encoding="utf-8") as f:
+                                self.logger.info(
+                                    f"Downloaded results for batch {batch_id}"
+                                )
+                                yield from self._parse_batch_results(f)
+                        finally:
+                            pathlib.Path(path).unlink()
+                    except Exception as e:
+                        raise BulkDataException(
+                            f"Failed to download results for batch {batch_id} ({str(e)})"
+                        )
+            finally:
+                # Don't leave downloaded files behind if the consumer stops early
+                for _, future in in_flight:
+                    future.cancel()
+                    if not future.cancelled() and not future.exception():
+                        pathlib.Path(future.result()).unlink()
+
     def _parse_batch_results(self, f):
         """Parses batch results from the downloaded file"""
         reader = csv.reader(f)
@@ -726,6 +930,253 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
             )
 
 
+class BulkApi2DmlOperation(BaseDmlOperation, BulkApi2JobMixin, CsvBatchMixin):
+    """Operation class for all DML operations run using Bulk API 2.0.
+
+    Records are uploaded in as few jobs as possible, each holding up to
+    BULK2_MAX_UPLOAD_SIZE bytes (or `batch_size` records, if set) of CSV.
+    Bulk API 2.0 returns successful, failed and unprocessed records in
+    separate files, in no particular order, so results are matched back
+    to the submitted records by their field values."""
+
+    def __init__(
+        self,
+        *,
+        sobject,
+        operation,
+        api_options,
+        context,
+        fields,
+        selection_strategy=SelectStrategy.STANDARD,
+        selection_filter=None,
+        selection_priority_fields=None,
+        content_type=None,
+        threshold=None,
+    ):
+        super().__init__(
+            sobject=sobject,
+            operation=operation,
+            api_options=api_options,
+            context=context,
+            fields=fields,
+        )
+        self.api_options = api_options.copy()
+        self.job_ids = []
+        self.records_submitted = 0
+        # Maps the values of each record, as they appear in the CSV, to the
+        # position(s) of the records with those values. Records with
+        # identical values are interchangeable.
+        self._record_positions = {}
+
+    def end(self):
+        if not self.job_result:
+            self.job_result = self._combine_job_results(
+                [
+                    self._bulk2_job_result(self._wait_for_bulk2_job("ingest", job_id))
+                    for job_id in self.job_ids
+                ]
+            )
+
+    def _combine_job_results(self, results):
+        job_errors = [error for result in results for error in result.job_errors]
+        records_processed = sum(result.records_processed for result in results)
+        total_row_errors = sum(result.total_row_errors for result in results)
+        statuses = [result.status for result in results]
+        if DataOperationStatus.JOB_FAILURE in statuses:
+            status = DataOperationStatus.JOB_FAILURE
+        elif DataOperationStatus.ABORTED in statuses:
+            status = DataOperationStatus.ABORTED
+        elif total_row_errors:
+            status = DataOperationStatus.ROW_FAILURE
+        else:
+            status = DataOperationStatus.SUCCESS
+
+        return DataOperationJobResult(
+            status, job_errors, records_processed, total_row_errors
+        )
+
+    def get_prev_record_values(self, records):
+        """Get the previous values of the records based on the update key
+        to ensure rollback can be performed"""
+        # Function to be called only for UPSERT and UPDATE
+        assert self.operation in [DataOperationType.UPSERT, DataOperationType.UPDATE]
+
+        self.logger.info(f"Retrieving Previous Record Values of {self.sobject}")
+        prev_record_values = []
+        relevant_fields = tuple(set(self.fields + ["Id"]))
+
+        # Set update key
+        update_key = (
+            self.api_options.get("update_key")
+            if self.operation == DataOperationType.UPSERT
+            else "Id"
+        )
+        update_key_index = self.fields.index(update_key)
+
+        for chunk in iterate_in_chunks(DEFAULT_BULK_BATCH_SIZE, records):
+            update_key_values = [rec[update_key_index] for rec in chunk]
+            query_fields = ", ".join(relevant_fields)
+            query_values = ", ".join(f"'{value}'" for value in update_key_values)
+            query = f"SELECT {query_fields} FROM {self.sobject} WHERE {update_key} IN ({query_values})"
+
+            query_op = BulkApi2QueryOperation(
+                sobject=self.sobject,
+                api_options={},
+                context=self.context,
+                query=query,
+            )
+            query_op.query()
+            prev_record_values.extend(query_op.get_results())
+
+        self.logger.info("Done")
+        return prev_record_values, relevant_fields
+
+    def _track_positions(self, records):
+        """Remember where each record was submitted so results can be put
+        back in order."""
+        for record in records:
+            key = tuple("" if value is None else str(value) for value in record)
+            position = self.records_submitted
+            existing = self._record_positions.get(key)
+            if existing is None:
+                self._record_positions[key] = position
+            elif isinstance(existing, deque):
+                existing.append(position)
+            else:
+                self._record_positions[key] = deque((existing, position))
+            self.records_submitted += 1
+            yield record
+
+    @staticmethod
+    def _pop_position(positions, key):
+        position = positions.get(key)
+        if isinstance(position, deque):
+            if len(position) > 1:
+                return position.popleft()
+            position = position[0]
+        positions.pop(key, None)
+        return position
+
+    @staticmethod
+    def _normalized_values(values):
+        """Normalize CSV values the way Salesforce may when echoing them back
+        in Bulk API 2.0 results: case, surrounding whitespace and the
+        formatting of numbers."""
+        normalized = []
+        for value in values:
+            value = value.strip().lower()
+            try:
+                number = Decimal(value)
+            except InvalidOperation:
+                pass
+            else:
+                if number.is_finite():
+                    value = str(number.normalize())
+            normalized.append(value)
+        return tuple(normalized)
+
+    def load_records(self, records):
+        job_spec = {
+            "object": self.sobject,
+            "operation": self.operation.value,
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "CRLF",
+        }
+        if self.api_options.get("update_key"):
+            job_spec["externalIdFieldName"] = self.api_options["update_key"]
+
+        for count, csv_data in enumerate(
+            self._batch(
+                self._track_positions(records),
+                self.api_options.get("batch_size"),
+                char_limit=BULK2_MAX_UPLOAD_SIZE,
+            )
+        ):
+            job = self._bulk2_request("POST", "jobs/ingest", json=job_spec).json()
+            self.job_ids.append(job["id"])
+            self.logger.info(
+                f"Uploading data for Bulk API 2.0 job {job['id']} ({count + 1})"
+            )
+            self._bulk2_request(
+                "PUT",
+                f"jobs/ingest/{job['id']}/batches",
+                data=csv_data,
+                headers={"Content-Type": "text/csv"},
+            )
+            self._bulk2_request(
+                "PATCH", f"jobs/ingest/{job['id']}", json={"state": "UploadComplete"}
+            )
+
+    def select_records(self, records):
+        raise BulkDataException(
+            "The select action is not supported with Bulk API 2.0. Use `api: bulk` or `api: rest`."
+        )
+
+    def get_results(self):
+        """Return a generator of DataOperationResult objects, in the order
+        the records were submitted."""
+        results = [None] * self.records_submitted
+        positions = {
+            key: deque(value) if isinstance(value, deque) else value
+            for key, value in self._record_positions.items()
+        }
+        unmatched = []
+        for job_id in self.job_ids:
+            for kind in ("successfulResults", "failedResults", "unprocessedrecords"):
+                with self._bulk2_download(f"jobs/ingest/{job_id}/{kind}/") as (f, _):
+                    for key, result in self._parse_results(kind, f):
+                        position = self._pop_position(positions, key)
+                        if position is None:
+                            unmatched.append((key, result))
+                        else:
+                            results[position] = result
+
+        if unmatched:
+            # The org can echo a value back in a normalized form, such as
+            # "TRUE" as "true". Match what is left on normalized values.
+            normalized_positions = {}
+            for key, value in positions.items():
+                normalized_positions.setdefault(
+                    self._normalized_values(key), deque()
+                ).extend(value if isinstance(value, deque) else (value,))
+            for key, result in unmatched:
+                remaining = normalized_positions.get(self._normalized_values(key))
+                if remaining:
+                    results[remaining.popleft()] = result
+
+        for result in results:
+            yield result or DataOperationResult(
+                None, False, "No result was returned for this record", False
+            )
+
+    def _parse_results(self, kind, f):
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if not headers:
+            return
+        field_indexes = [headers.index(field) for field in self.fields]
+        if kind == "successfulResults":
+            id_index = headers.index("sf__Id")
+            created_index = headers.index("sf__Created")
+        elif kind == "failedResults":
+            error_index = headers.index("sf__Error")
+
+        for row in reader:
+            key = tuple(row[index] for index in field_indexes)
+            if kind == "successfulResults":
+                result = DataOperationResult(
+                    row[id_index], True, None, process_bool_arg(row[created_index])
+                )
+            elif kind == "failedResults":
+                result = DataOperationResult(None, False, row[error_index], False)
+            else:
+                result = DataOperationResult(
+                    None, False, "Record was not processed", False
+                )
+            yield key, result
+
+
 class RestApiDmlOperation(BaseDmlOperation):
     """Operation class for all DML operations run using the REST API."""
 
@@ -1067,9 +1518,12 @@ def get_query_operation(
     is provided."""
 
     # The Record Count endpoint requires API 40.0. REST Collections requires 42.0.
+    # Bulk API 2.0 queries require 47.0.
     api_version = float(context.sf.sf_version)
     if api_version < 42.0 and api is not DataApi.BULK:
         api = DataApi.BULK
+    elif api_version < BULK2_QUERY_API_VERSION and api is DataApi.BULK2:
+        api = DataApi.BULK
 
     if api in (DataApi.SMART, None):
         record_count_response = context.sf.restful(
@@ -1088,6 +1542,10 @@ def get_query_operation(
         return BulkApiQueryOperation(
             sobject=sobject, api_options=api_options, context=context, query=query
         )
+    elif api is DataApi.BULK2:
+        return BulkApi2QueryOperation(
+            sobject=sobject, api_options=api_options, context=context, query=query
+        )
     elif api is DataApi.REST:
         return RestApiQueryOperation(
             sobject=sobject,
@@ -1136,6 +1594,8 @@ def get_dml_operation(
 
     if api is DataApi.BULK:
         api_class = BulkApiDmlOperation
+    elif api is DataApi.BULK2:
+        api_class = BulkApi2DmlOperation
     elif api is DataApi.REST:
         api_class = RestApiDmlOperation
     else:
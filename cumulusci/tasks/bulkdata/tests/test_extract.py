@@ -999,6 +999,7 @@ class TestExtractData:
             inject_namespaces=True,
             drop_missing=True,
             org_has_person_accounts_enabled=t.org_config._is_person_accounts_enabled,
+            describe_cache=mock.ANY,
         )
 
     def test_soql_for_mapping(self):
@@ -6,6 +6,7 @@ import random
 import shutil
 import string
 import tempfile
+import threading
 from collections import namedtuple
 from contextlib import nullcontext
 from datetime import date, timedelta
@@ -131,6 +132,70 @@ class TestLoadData:
                 hh_ids = next(c.execute("SELECT * from cumulusci_id_table"))
                 assert hh_ids == ("households-1", "001000000000000")
 
+    @responses.activate
+    @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
+    def test_run__concurrent_steps(self, dml_mock):
+        responses.add(
+            method="GET",
+            url=f"https://example.com/services/data/v{CURRENT_SF_API_VERSION}/query/?q=SELECT+Id+FROM+RecordType+WHERE+SObjectType%3D%27Account%27AND+DeveloperName+%3D+%27HH_Account%27+LIMIT+1",
+            body=json.dumps({"records": [{"Id": "1"}]}),
+            status=200,
+        )
+
+        base_path = os.path.dirname(__file__)
+        db_path = os.path.join(base_path, "testdata.db")
+        mapping_path = os.path.join(base_path, self.mapping_file)
+
+        with temporary_dir() as d:
+            tmp_db_path = os.path.join(d, "testdata.db")
+            shutil.copyfile(db_path, tmp_db_path)
+
+            task = _make_task(
+                LoadData,
+                {
+                    "options": {
+                        "database_url": f"sqlite:///{tmp_db_path}",
+                        "mapping": mapping_path,
+                        "set_recently_viewed": False,
+                        "concurrent_steps": 2,
+                    }
+                },
+            )
+
+            task.bulk = mock.Mock()
+            task.sf = mock.Mock()
+
+            step = FakeBulkAPIDmlOperation(
+                sobject="Contact",
+                operation=DataOperationType.INSERT,
+                api_options={},
+                context=task,
+                fields=[],
+            )
+            dml_mock.return_value = step
+
+            step.results = [
+                DataOperationResult("001000000000000", True, None),
+                DataOperationResult("003000000000000", True, None),
+                DataOperationResult("003000000000001", True, None),
+            ]
+
+            mock_describe_calls()
+            task()
+            # Contacts look up Households, so the steps still run in order.
+            assert step.records == [
+                ["TestHousehold", "TestHousehold", "1"],
+                ["Test", "User", "test@example.com", "001000000000000"],
+                ["Error", "User", "error@example.com", "001000000000000"],
+            ]
+            with create_engine(task.options["database_url"]).connect() as c:
+                hh_ids = next(c.execute("SELECT * from cumulusci_id_table"))
+                assert hh_ids == ("households-1", "001000000000000")
+            assert list(task.return_values["step_results"]) == [
+                "Insert Households",
+                "Insert Contacts",
+            ]
+
     @responses.activate
     @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
     def test__insert_rollback(self, dml_mock):
@@ -345,6 +410,135 @@ class TestLoadData:
         with pytest.raises(BulkDataException):
             task()
 
+    def test_run_task__concurrent_steps(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "set_recently_viewed": False,
+                    "concurrent_steps": 2,
+                }
+            },
+        )
+        task._init_db = mock.Mock(return_value=nullcontext())
+        task._init_mapping = mock.Mock()
+        task._expand_mapping = mock.Mock()
+        task._initialize_id_table = mock.Mock()
+        task.mapping = {
+            "Insert Accounts": MappingStep(sf_object="Account", table="accounts"),
+            "Insert Products": MappingStep(sf_object="Product2", table="products"),
+            "Insert Contacts": MappingStep(
+                sf_object="Contact",
+                table="contacts",
+                lookups={"AccountId": MappingLookup(table="accounts")},
+            ),
+        }
+        task.after_steps = {}
+        task._prepare_step = mock.Mock(side_effect=lambda mapping: (mapping, None))
+        task._get_step_records = mock.Mock(
+            side_effect=lambda *args: iter([["a"], ["b"]])
+        )
+        task._finish_step = mock.Mock(
+            return_value=DataOperationJobResult(DataOperationStatus.SUCCESS, [], 2, 0)
+        )
+        products_started = threading.Event()
+        events = []
+
+        def run_step_operation(mapping, step, records):
+            assert list(records) == [["a"], ["b"]]
+            if mapping.sf_object == "Account":
+                # Only returns if Products are loaded at the same time
+                assert products_started.wait(5)
+            events.append(mapping.sf_object)
+            if mapping.sf_object == "Product2":
+                products_started.set()
+
+        task._run_step_operation = mock.Mock(side_effect=run_step_operation)
+        task()
+
+        assert events == ["Product2", "Account", "Contact"]
+        assert list(task.return_values["step_results"]) == list(task.mapping)
+
+    def test_run_task__concurrent_steps_failure(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "concurrent_steps": 2,
+                }
+            },
+        )
+        task._init_db = mock.Mock(return_value=nullcontext())
+        task._init_mapping = mock.Mock()
+        task._expand_mapping = mock.Mock()
+        task._initialize_id_table = mock.Mock()
+        task.mapping = {
+            "Insert Accounts": MappingStep(sf_object="Account", table="accounts"),
+            "Insert Contacts": MappingStep(
+                sf_object="Contact",
+                table="contacts",
+                lookups={"AccountId": MappingLookup(table="accounts")},
+            ),
+        }
+        task.after_steps = {}
+        task._prepare_step = mock.Mock(side_effect=lambda mapping: (mapping, None))
+        task._get_step_records = mock.Mock(return_value=iter([]))
+        task._run_step_operation = mock.Mock()
+        task._finish_step = mock.Mock(
+            return_value=DataOperationJobResult(
+                DataOperationStatus.JOB_FAILURE, ["Bad"], 0, 0
+            )
+        )
+
+        with pytest.raises(BulkDataException, match="Step Insert Accounts"):
+            task()
+        task._run_step_operation.assert_called_once()
+
+    def test_get_step_dependencies(self):
+        accounts = MappingStep(sf_object="Account", table="accounts")
+        products = MappingStep(sf_object="Product2", table="products")
+        contacts = MappingStep(
+            sf_object="Contact",
+            table="contacts",
+            lookups={
+                "AccountId": MappingLookup(table="accounts"),
+                "ReportsToId": MappingLookup(table="contacts", after="Insert Contacts"),
+            },
+        )
+        business_accounts = MappingStep(sf_object="Account", table="business_accounts")
+        events = MappingStep(
+            sf_object="Event",
+            table="events",
+            lookups={"WhoId": MappingLookup(table=["contacts", "leads"])},
+        )
+        contacts_after = MappingStep(
+            sf_object="Contact",
+            table="contacts",
+            action="update",
+            lookups={"ReportsToId": MappingLookup(table="contacts")},
+        )
+        steps = [
+            ("Insert Accounts", accounts, "Insert Accounts"),
+            ("Insert Products", products, "Insert Products"),
+            ("Insert Contacts", contacts, "Insert Contacts"),
+            ("Update Contacts", contacts_after, "Insert Contacts"),
+            ("Insert Business Accounts", business_accounts, "Insert Business Accounts"),
+            ("Insert Events", events, "Insert Events"),
+        ]
+
+        assert LoadData._get_step_dependencies(steps) == {
+            "Insert Accounts": set(),
+            "Insert Products": set(),
+            "Insert Contacts": {"Insert Accounts"},
+            "Update Contacts": {"Insert Contacts"},
+            "Insert Business Accounts": {"Insert Accounts"},
+            "Insert Events": {"Insert Contacts", "Update Contacts"},
+        }
+
     @responses.activate
     @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
     def test_run__sql(self, dml_mock):
@@ -423,6 +617,51 @@ class TestLoadData:
         with pytest.raises(TaskOptionsError):
             _make_task(LoadData, {"options": {"bulk_mode": "Test"}})
 
+    def test_init_options__batch_workers(self):
+        t = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "file:///test.db",
+                    "mapping": "mapping.yml",
+                    "batch_workers": "4",
+                }
+            },
+        )
+
+        assert t.batch_workers == 4
+
+        t = _make_task(
+            LoadData,
+            {"options": {"database_url": "file:///test.db", "mapping": "mapping.yml"}},
+        )
+
+        assert t.batch_workers == 1
+
+    @pytest.mark.parametrize("batch_workers", ["0", "many"])
+    def test_init_options__batch_workers_wrong(self, batch_workers):
+        with pytest.raises(TaskOptionsError):
+            _make_task(LoadData, {"options": {"batch_workers": batch_workers}})
+
+    def test_init_options__concurrent_steps(self):
+        t = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "file:///test.db",
+                    "mapping": "mapping.yml",
+                    "concurrent_steps": "4",
+                }
+            },
+        )
+
+        assert t.concurrent_steps == 4
+
+    @pytest.mark.parametrize("concurrent_steps", ["0", "many"])
+    def test_init_options__concurrent_steps_wrong(self, concurrent_steps):
+        with pytest.raises(TaskOptionsError):
+            _make_task(LoadData, {"options": {"concurrent_steps": concurrent_steps}})
+
     def test_init_options__database_url(self):
         t = _make_task(
             LoadData,
@@ -686,6 +925,7 @@ class TestLoadData:
             data_operation=DataOperationType.INSERT,
             inject_namespaces=True,
             drop_missing=True,
+            describe_cache=mock.ANY,
         )
 
     @responses.activate
@@ -1916,6 +2156,220 @@ class TestLoadData:
             ["001000000000011", "001000000000002"],
         ]
 
+    def test_stream_results_id_map__success(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                }
+            },
+        )
+        step = mock.Mock()
+        step.get_results.return_value = iter(
+            [
+                DataOperationResult("001000000000000", True, None, True),
+                DataOperationResult("001000000000001", True, None, True),
+            ]
+        )
+        mapping = MappingStep(sf_object="Account", table="Account")
+
+        sf_id_results = task._stream_results_id_map(mapping, step, ["1\n", "2\n"])
+
+        assert list(sf_id_results) == [
+            ["Account-1", "001000000000000"],
+            ["Account-2", "001000000000001"],
+        ]
+        assert task._old_format
+
+    def test_stream_results_id_map__exception_failure_without_rollback(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                }
+            },
+        )
+        step = mock.Mock()
+        step.get_results.return_value = iter(
+            [
+                DataOperationResult("001000000000000", True, None, True),
+                DataOperationResult(None, False, "error", False),
+                DataOperationResult("001000000000002", True, None, True),
+            ]
+        )
+        mapping = MappingStep(sf_object="Account", table="Account")
+
+        sf_id_results = task._stream_results_id_map(
+            mapping, step, ["Account-1", "Account-2", "Account-3"]
+        )
+
+        assert next(sf_id_results) == ["Account-1", "001000000000000"]
+        with pytest.raises(BulkDataException) as e:
+            next(sf_id_results)
+
+        assert "Account-2" in str(e.value)
+
+    def test_stream_results_id_map__exception_failure_with_rollback(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                    "enable_rollback": True,
+                }
+            },
+        )
+        step = mock.Mock()
+        step.get_results.return_value = iter(
+            [
+                DataOperationResult("001000000000000", True, None, True),
+                DataOperationResult(None, False, "error", False),
+                DataOperationResult("001000000000002", True, None, True),
+                DataOperationResult("001000000000003", True, None, False),
+            ]
+        )
+        mapping = MappingStep(sf_object="Account", table="Account")
+        spilled = []
+
+        with (
+            mock.patch(
+                "cumulusci.tasks.bulkdata.load.CreateRollback.prepare_for_rollback",
+                side_effect=lambda context, step, records: spilled.extend(records),
+            ),
+            mock.patch(
+                "cumulusci.tasks.bulkdata.load.Rollback._perform_rollback"
+            ) as mock_rollback,
+            pytest.raises(BulkDataException),
+        ):
+            list(
+                task._stream_results_id_map(
+                    mapping,
+                    step,
+                    ["Account-1", "Account-2", "Account-3", "Account-4"],
+                )
+            )
+
+        mock_rollback.assert_called_once_with(task)
+        # Records created after the failing row are rolled back too.
+        assert spilled == [["001000000000000"], ["001000000000002"]]
+
+    @mock.patch("cumulusci.tasks.bulkdata.load.ROLLBACK_SPILL_CHUNK_SIZE", 2)
+    def test_stream_results_id_map__spills_created_records_in_chunks(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                    "enable_rollback": True,
+                }
+            },
+        )
+        step = mock.Mock()
+        step.get_results.return_value = iter(
+            [
+                DataOperationResult(f"00100000000000{i}", True, None, True)
+                for i in range(5)
+            ]
+        )
+        mapping = MappingStep(sf_object="Account", table="Account")
+        spilled = []
+
+        with mock.patch(
+            "cumulusci.tasks.bulkdata.load.CreateRollback.prepare_for_rollback",
+            side_effect=lambda context, step, records: spilled.append(list(records)),
+        ):
+            list(
+                task._stream_results_id_map(
+                    mapping, step, [f"Account-{i}" for i in range(5)]
+                )
+            )
+
+        assert [len(chunk) for chunk in spilled] == [2, 2, 1]
+
+    def test_process_job_results__stream_results(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                }
+            },
+        )
+        task.session = mock.MagicMock()
+        task.metadata = mock.MagicMock()
+        task.bulk = mock.Mock()
+        task.sf = mock.Mock()
+
+        step = FakeBulkAPIDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=task,
+            fields=[],
+        )
+        step.results = [
+            DataOperationResult("001111111111111", True, None),
+            DataOperationResult("001111111111112", True, None),
+        ]
+
+        mapping = MappingStep(sf_object="Account", table="Account")
+        inserted = []
+        with mock.patch(
+            "cumulusci.tasks.bulkdata.load.sql_bulk_insert_from_records",
+            side_effect=lambda **kwargs: inserted.extend(kwargs["record_iterable"]),
+        ):
+            task._process_job_results(mapping, step, ["Account-1", "Account-2"])
+
+        assert inserted == [
+            ["Account-1", "001111111111111"],
+            ["Account-2", "001111111111112"],
+        ]
+        task.session.commit.assert_called_once()
+
+    def test_process_job_results__stream_results__row_errors_checked(self):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "stream_results": True,
+                }
+            },
+        )
+        task.session = mock.MagicMock()
+        task.metadata = mock.MagicMock()
+        task.bulk = mock.Mock()
+        task.sf = mock.Mock()
+
+        step = FakeBulkAPIDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=task,
+            fields=[],
+        )
+        step.results = [DataOperationResult(None, False, "error")]
+        step.job_result = DataOperationJobResult(
+            DataOperationStatus.ROW_FAILURE, [], 1, 1
+        )
+
+        mapping = MappingStep(sf_object="Account", table="Account")
+        with pytest.raises(BulkDataException):
+            task._process_job_results(mapping, step, ["Account-1"])
+
     @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
     def test__execute_step__prev_record_values(self, mock_dml):
         task = _make_task(
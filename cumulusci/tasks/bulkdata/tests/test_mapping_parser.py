@@ -1023,6 +1023,37 @@ class TestMappingParser:
                 drop_missing=False,
             )
 
+    @responses.activate
+    def test_validate_and_inject_mapping_describes_each_sobject_once(self):
+        mock_describe_calls()
+        mapping = parse_from_yaml(
+            StringIO(
+                (
+                    "Insert Accounts:\n  sf_object: Account\n  table: Account\n  fields:\n    - Name\n"
+                    "Insert Contacts:\n  sf_object: Contact\n  table: Contact\n  fields:\n    - LastName\n"
+                    "  lookups:\n    AccountId:\n      table: Account\n"
+                    "Insert Other Accounts:\n  sf_object: Account\n  table: OtherAccount\n  fields:\n    - Name"
+                )
+            )
+        )
+        org_config = DummyOrgConfig(
+            {"instance_url": "https://example.com", "access_token": "abc123"}, "test"
+        )
+
+        validate_and_inject_mapping(
+            mapping=mapping,
+            sf=org_config.salesforce_client,
+            namespace=None,
+            data_operation=DataOperationType.INSERT,
+            inject_namespaces=False,
+            drop_missing=False,
+        )
+
+        urls = [call.request.url for call in responses.calls]
+        assert len([url for url in urls if url.endswith("/sobjects")]) == 1
+        assert len([url for url in urls if url.endswith("/Account/describe")]) == 1
+        assert len([url for url in urls if url.endswith("/Contact/describe")]) == 1
+
     @responses.activate
     def test_validate_and_inject_mapping_removes_steps_with_drop_missing(self):
         mock_describe_calls()
@@ -1409,6 +1440,23 @@ class TestMappingLookup:
         assert mapping["Insert Accounts"].bulk_mode == "Serial"
         assert mapping["Insert Accounts"].batch_size == 50
 
+    def test_bulk2_attributes(self):
+        mapping = parse_from_yaml(
+            StringIO(
+                (
+                    """Insert Accounts:
+                        sf_object: account
+                        table: account
+                        api: bulk2
+                        batch_size: 50000
+                        fields:
+                            - name"""
+                )
+            )
+        )
+        assert mapping["Insert Accounts"].api == DataApi.BULK2
+        assert mapping["Insert Accounts"].batch_size == 50000
+
     def test_case_conversions(self):
         mapping = parse_from_yaml(
             StringIO(
@@ -19,6 +19,9 @@ from cumulusci.tasks.bulkdata.snowfakery import (
     Snowfakery,
     SnowfakeryWorkingDirectory,
 )
+from cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager import (
+    SnowfakeryChannelManager,
+)
 from cumulusci.tasks.bulkdata.tests.integration_test_utils import ensure_accounts
 from cumulusci.tasks.bulkdata.tests.utils import _make_task
 from cumulusci.tasks.salesforce.BaseSalesforceApiTask import BaseSalesforceApiTask
@@ -153,11 +156,14 @@ def mock_load_data(
 ):
 
     fake_load_data = FakeLoadData
-    with mock.patch(
-        "cumulusci.tasks.bulkdata.generate_and_load_data.LoadData", fake_load_data
-    ), mock.patch(
-        "cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager.LoadData",
-        fake_load_data,
+    with (
+        mock.patch(
+            "cumulusci.tasks.bulkdata.generate_and_load_data.LoadData", fake_load_data
+        ),
+        mock.patch(
+            "cumulusci.tasks.bulkdata.snowfakery_utils.queue_manager.LoadData",
+            fake_load_data,
+        ),
     ):
         fake_load_data.reset()
 
@@ -352,6 +358,65 @@ class TestSnowfakery:
         for call in mock_load_data.mock_calls:
             assert call.task_config.config["options"]["drop_missing_schema"] is True
 
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_loop_waits_for_workers(
+        self, mock_load_data, threads_instead_of_processes, create_task_fixture
+    ):
+        task = create_task_fixture(
+            Snowfakery,
+            {"recipe": sample_yaml, "run_until_recipe_repeated": 15},
+        )
+        wait_for_workers = SnowfakeryChannelManager.wait_for_workers
+        waits = []
+
+        def record_wait(queue_manager, timeout):
+            waits.append(wait_for_workers(queue_manager, timeout))
+            return waits[-1]
+
+        with (
+            mock.patch.object(
+                SnowfakeryChannelManager, "wait_for_workers", record_wait
+            ),
+            mock.patch("time.sleep") as sleep,
+        ):
+            task()
+
+        sleep.assert_not_called()
+        # every wait ended because a worker finished, not because it timed out
+        assert waits and all(waits)
+
+    def test_wait_for_workers(self):
+        queue_manager = SnowfakeryChannelManager(None, project_config=None, logger=None)
+        assert not queue_manager.wait_for_workers(0.01)
+
+        queue_manager.worker_finished.send("/tmp/1_3")
+        queue_manager.worker_finished.send("/tmp/2_3")
+        assert queue_manager.wait_for_workers(0.01)
+        assert not queue_manager.worker_events.poll()
+
+    @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
+    def test_max_jobs_per_worker(
+        self, threads_instead_of_processes, mock_load_data, create_task_fixture
+    ):
+        task = create_task_fixture(
+            Snowfakery,
+            {
+                "recipe": sample_yaml,
+                "run_until_recipe_repeated": 15,
+                "max_jobs_per_worker": 10,
+                "num_processes": 1,
+            },
+        )
+        task()
+        portions = len(mock_load_data.mock_calls) - 1
+        assert portions > 1
+        # one pooled data generator process handled every portion
+        assert len(threads_instead_of_processes.mock_calls) == 1
+
+    def test_max_jobs_per_worker__invalid(self, snowfakery):
+        with pytest.raises(exc.TaskOptionsError, match="max_jobs_per_worker"):
+            snowfakery(recipe=sample_yaml, max_jobs_per_worker="0")
+
     @mock.patch("cumulusci.tasks.bulkdata.snowfakery.MIN_PORTION_SIZE", 3)
     def test_multi_part(
         self, threads_instead_of_processes, mock_load_data, create_task_fixture
@@ -1,10 +1,15 @@
+import csv
 import io
 import json
+import os
+import time
 from itertools import tee
 from unittest import mock
 
 import pytest
+import requests
 import responses
+from simple_salesforce import Salesforce
 
 from cumulusci.core.exceptions import BulkDataException
 from cumulusci.tasks.bulkdata.load import LoadData
@@ -12,6 +17,8 @@ from cumulusci.tasks.bulkdata.select_utils import SelectStrategy
 from cumulusci.tasks.bulkdata.step import (
     HIGH_PRIORITY_VALUE,
     LOW_PRIORITY_VALUE,
+    BulkApi2DmlOperation,
+    BulkApi2QueryOperation,
     BulkApiDmlOperation,
     BulkApiQueryOperation,
     BulkJobMixin,
@@ -24,12 +31,13 @@ from cumulusci.tasks.bulkdata.step import (
     RestApiQueryOperation,
     assign_weights,
     download_file,
+    download_to_tempfile,
     extract_flattened_headers,
     flatten_record,
     get_dml_operation,
     get_query_operation,
 )
-from cumulusci.tasks.bulkdata.tests.utils import _make_task
+from cumulusci.tasks.bulkdata.tests.utils import FakeBulkApi2Server, _make_task
 from cumulusci.tests.util import CURRENT_SF_API_VERSION, mock_describe_calls
 
 BULK_BATCH_RESPONSE = """<root xmlns="http://ns">
@@ -56,6 +64,37 @@ class TestDownloadFile:
             # make sure it was decoded as utf-8
             assert f.read() == "TEST\u2014"
 
+    @responses.activate
+    def test_download_to_tempfile(self, tmp_path):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+
+        responses.add(method="GET", url=url, body=b"TEST")
+        path = download_to_tempfile(url, bulk_mock)
+        try:
+            with open(path, "rb") as f:
+                assert f.read() == b"TEST"
+        finally:
+            os.unlink(path)
+
+    @responses.activate
+    def test_download_to_tempfile__error_removes_file(self, tmp_path):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+        path = tmp_path / "results.csv"
+
+        responses.add(method="GET", url=url, status=500)
+        with mock.patch(
+            "cumulusci.tasks.bulkdata.step.tempfile.mkstemp",
+            return_value=(os.open(path, os.O_CREAT | os.O_WRONLY), str(path)),
+        ):
+            with pytest.raises(requests.exceptions.HTTPError):
+                download_to_tempfile(url, bulk_mock)
+
+        assert not path.exists()
+
 
 class TestBulkDataJobTaskMixin:
     @responses.activate
@@ -484,7 +523,7 @@ class TestBulkApiDmlOperation:
         step._wait_for_job.assert_called_once_with("JOB")
         assert step.job_result.status is DataOperationStatus.SUCCESS
 
-    def test_serialize_csv_record(self):
+    def test_batch__serialization(self):
         context = mock.Mock()
         step = BulkApiDmlOperation(
             sobject="Contact",
@@ -494,16 +533,14 @@ class TestBulkApiDmlOperation:
             fields=["Id", "FirstName", "LastName"],
         )
 
-        serialized = step._serialize_csv_record(step.fields)
-        assert serialized == b'"Id","FirstName","LastName"\r\n'
+        records = iter([["1", "Bob", "Ross"], ["2", "multiline\nname", "Ca\u00f1a"]])
+        (batch,) = step._batch(records, n=2)
 
-        record = ["1", "Bob", "Ross"]
-        serialized = step._serialize_csv_record(record)
-        assert serialized == b'"1","Bob","Ross"\r\n'
-
-        record = ["col1", "multiline\ncol2"]
-        serialized = step._serialize_csv_record(record)
-        assert serialized == b'"col1","multiline\ncol2"\r\n'
+        assert batch == (
+            b'"Id","FirstName","LastName"\r\n'
+            b'"1","Bob","Ross"\r\n'
+            b'"2","multiline\nname","Ca\xc3\xb1a"\r\n'
+        )
 
     def test_get_prev_record_values(self):
         context = mock.Mock()
@@ -1572,15 +1609,9 @@ class TestBulkApiDmlOperation:
         records = iter([["Test"], ["Test2"], ["Test3"]])
         results = list(step._batch(records, n=2))
 
-        assert len(results) == 2
-        assert list(results[0]) == [
-            '"LastName"\r\n'.encode("utf-8"),
-            '"Test"\r\n'.encode("utf-8"),
-            '"Test2"\r\n'.encode("utf-8"),
-        ]
-        assert list(results[1]) == [
-            '"LastName"\r\n'.encode("utf-8"),
-            '"Test3"\r\n'.encode("utf-8"),
+        assert results == [
+            b'"LastName"\r\n"Test"\r\n"Test2"\r\n',
+            b'"LastName"\r\n"Test3"\r\n',
         ]
 
     def test_batch__character_limit(self):
@@ -1595,28 +1626,103 @@ class TestBulkApiDmlOperation:
         )
 
         records = [["Test"], ["Test2"], ["Test3"]]
-
-        csv_rows = [step._serialize_csv_record(step.fields)]
-        for r in records:
-            csv_rows.append(step._serialize_csv_record(r))
-
-        char_limit = sum([len(r) for r in csv_rows]) - 1
+        char_limit = len(b'"LastName"\r\n"Test"\r\n"Test2"\r\n"Test3"\r\n') - 1
 
         # Ask for batches of three, but we
         # should get batches of 2 back
         results = list(step._batch(iter(records), n=3, char_limit=char_limit))
 
-        assert len(results) == 2
-        assert list(results[0]) == [
-            '"LastName"\r\n'.encode("utf-8"),
-            '"Test"\r\n'.encode("utf-8"),
-            '"Test2"\r\n'.encode("utf-8"),
+        assert results == [
+            b'"LastName"\r\n"Test"\r\n"Test2"\r\n',
+            b'"LastName"\r\n"Test3"\r\n',
         ]
-        assert list(results[1]) == [
-            '"LastName"\r\n'.encode("utf-8"),
-            '"Test3"\r\n'.encode("utf-8"),
+
+    def test_batch__character_limit_counts_bytes(self):
+        context = mock.Mock()
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 10},
+            context=context,
+            fields=["LastName"],
+        )
+
+        records = [["\u00f1"], ["\u00f1"]]
+        # Each multi-byte record is 5 characters but 6 bytes long.
+        char_limit = len(b'"LastName"\r\n') + 11
+
+        results = list(step._batch(iter(records), n=10, char_limit=char_limit))
+
+        assert results == [
+            b'"LastName"\r\n"\xc3\xb1"\r\n',
+            b'"LastName"\r\n"\xc3\xb1"\r\n',
         ]
 
+    def test_batch__oversized_record(self):
+        context = mock.Mock()
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 10},
+            context=context,
+            fields=["LastName"],
+        )
+
+        records = [["Test" * 10], ["Test2"]]
+        results = list(step._batch(iter(records), n=10, char_limit=20))
+
+        # A record that can never fit is sent on its own rather than
+        # producing a batch with no records.
+        assert results == [
+            b'"LastName"\r\n"' + b"Test" * 10 + b'"\r\n',
+            b'"LastName"\r\n"Test2"\r\n',
+        ]
+
+    def test_batch__matches_per_record_serialization(self):
+        fields = ["FirstName", "LastName", "Email", "Phone", "AccountId"]
+        records = [
+            [f"First{i}", f"Last{i}", f"user{i}@example.com", "555-0100", ""]
+            for i in range(1_050)
+        ]
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=mock.Mock(),
+            fields=fields,
+        )
+
+        def per_record_batches(records, n):
+            # The previous implementation: one writerow, getvalue() and
+            # encode() per record, collected into a list per batch.
+            csv_buff = io.StringIO(newline="")
+            csv_writer = csv.writer(csv_buff, quoting=csv.QUOTE_ALL)
+
+            def serialize(record):
+                csv_writer.writerow(record)
+                serialized = csv_buff.getvalue().encode("utf-8")
+                csv_buff.truncate(0)
+                csv_buff.seek(0)
+                return serialized
+
+            header = serialize(fields)
+            batch = [header]
+            for record in records:
+                batch.append(serialize(record))
+                if len(batch) - 1 == n:
+                    yield batch
+                    batch = [header]
+            if len(batch) > 1:
+                yield batch
+
+        old_batches = list(per_record_batches(iter(records), 100))
+        new_batches = list(step._batch(iter(records), 100))
+
+        assert len(new_batches) == 11
+        assert new_batches == [b"".join(batch) for batch in old_batches]
+
     @mock.patch("cumulusci.tasks.bulkdata.step.download_file")
     def test_get_results(self, download_mock):
         context = mock.Mock()
@@ -1714,6 +1820,131 @@ class TestBulkApiDmlOperation:
             DataOperationResult(None, False, "error", False),
         ]
 
+    def test_load_records__batch_workers(self):
+        context = mock.Mock()
+        context.bulk.post_batch.side_effect = ["BATCH1", "BATCH2", "BATCH3"]
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 1, "batch_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.load_records(iter([["Test"], ["Test2"], ["Test3"]]))
+
+        assert step.batch_ids == ["BATCH1", "BATCH2", "BATCH3"]
+        assert context.bulk.post_batch.call_count == 3
+
+    def test_load_records__batch_workers_keeps_order(self):
+        context = mock.Mock()
+
+        def post_batch(job_id, batch):
+            record = batch.decode("utf-8").split("\r\n")[1].strip('"')
+            # Finish the first batch last.
+            if record == "Test":
+                time.sleep(0.1)
+            return record
+
+        context.bulk.post_batch.side_effect = post_batch
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 1, "batch_workers": 3},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.load_records(iter([["Test"], ["Test2"], ["Test3"]]))
+
+        assert step.batch_ids == ["Test", "Test2", "Test3"]
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_to_tempfile")
+    def test_get_results__batch_workers(self, download_mock, tmp_path):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        results = {
+            "BATCH1": "id,success,created,error\n003000000000001,true,true,\n",
+            "BATCH2": "id,success,created,error\n003000000000002,true,true,\n",
+            "BATCH3": "id,success,created,error\n003000000000003,false,false,error\n",
+        }
+
+        def download(uri, bulk):
+            batch_id = uri.split("/")[-2]
+            if batch_id == "BATCH1":
+                time.sleep(0.1)
+            path = tmp_path / batch_id
+            path.write_text(results[batch_id])
+            return str(path)
+
+        download_mock.side_effect = download
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3"]
+
+        assert list(step.get_results()) == [
+            DataOperationResult("003000000000001", True, None, True),
+            DataOperationResult("003000000000002", True, None, True),
+            DataOperationResult(None, False, "error", False),
+        ]
+        assert list(tmp_path.iterdir()) == []
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_to_tempfile")
+    def test_get_results__batch_workers__failure(self, download_mock):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        download_mock.side_effect = Exception("Boom")
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3"]
+
+        with pytest.raises(BulkDataException, match="BATCH1"):
+            list(step.get_results())
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_to_tempfile")
+    def test_get_results__batch_workers__stopped_early(self, download_mock, tmp_path):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+
+        def download(uri, bulk):
+            path = tmp_path / uri.split("/")[-2]
+            path.write_text("id,success,created,error\n003000000000001,true,true,\n")
+            return str(path)
+
+        download_mock.side_effect = download
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3"]
+
+        results = step.get_results()
+        next(results)
+        results.close()
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestRestApiQueryOperation:
     def test_query(self):
@@ -3489,6 +3720,323 @@ class TestRestApiDmlOperation:
         ]
 
 
+@pytest.fixture
+def bulk2_context():
+    context = mock.Mock()
+    context.sf = Salesforce(
+        instance="example.my.salesforce.com",
+        session_id="abc123",
+        version=CURRENT_SF_API_VERSION,
+    )
+    return context
+
+
+@pytest.fixture
+def bulk2_server(bulk2_context):
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield lambda **kwargs: FakeBulkApi2Server(
+            rsps, bulk2_context.sf.base_url, **kwargs
+        )
+
+
+class TestBulkApi2QueryOperation:
+    def test_query(self, bulk2_context, bulk2_server):
+        server = bulk2_server(
+            query_headers=["Id", "LastName"],
+            query_records=[["003000000000001", "Narvaez"], ["003000000000002", ""]],
+        )
+        query_op = BulkApi2QueryOperation(
+            sobject="Contact",
+            api_options={},
+            context=bulk2_context,
+            query="SELECT Id, LastName FROM Contact",
+        )
+
+        query_op.query()
+
+        assert query_op.job_result == DataOperationJobResult(
+            DataOperationStatus.SUCCESS, [], 2, 0
+        )
+        (spec,) = server.query_jobs.values()
+        assert spec["query"] == "SELECT Id, LastName FROM Contact"
+        assert list(query_op.get_results()) == [
+            ["003000000000001", "Narvaez"],
+            ["003000000000002", ""],
+        ]
+        assert query_op.headers == ["Id", "LastName"]
+
+    def test_get_results__locator_pagination(self, bulk2_context, bulk2_server):
+        records = [[f"003{i:012d}", f"Name {i}"] for i in range(7)]
+        bulk2_server(query_headers=["Id", "Name"], query_records=records)
+        query_op = BulkApi2QueryOperation(
+            sobject="Contact",
+            api_options={"batch_size": 3},
+            context=bulk2_context,
+            query="SELECT Id, Name FROM Contact",
+        )
+
+        query_op.query()
+        results = query_op.get_results()
+
+        assert next(results) == records[0]
+        assert list(results) == records[1:]
+
+    def test_get_results__no_results(self, bulk2_context, bulk2_server):
+        bulk2_server(query_headers=["Id"])
+        query_op = BulkApi2QueryOperation(
+            sobject="Contact",
+            api_options={},
+            context=bulk2_context,
+            query="SELECT Id FROM Contact",
+        )
+
+        query_op.query()
+
+        assert list(query_op.get_results()) == []
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.time.sleep")
+    def test_query__failure(self, sleep, bulk2_context):
+        base_url = bulk2_context.sf.base_url
+        with responses.RequestsMock() as rsps:
+            rsps.add("POST", f"{base_url}jobs/query", json={"id": "750000000000001"})
+            rsps.add(
+                "GET",
+                f"{base_url}jobs/query/750000000000001",
+                json={"id": "750000000000001", "state": "InProgress"},
+            )
+            rsps.add(
+                "GET",
+                f"{base_url}jobs/query/750000000000001",
+                json={
+                    "id": "750000000000001",
+                    "state": "Failed",
+                    "errorMessage": "INVALID_FIELD",
+                },
+            )
+            query_op = BulkApi2QueryOperation(
+                sobject="Contact",
+                api_options={},
+                context=bulk2_context,
+                query="SELECT Foo FROM Contact",
+            )
+            query_op.query()
+
+        assert query_op.job_result == DataOperationJobResult(
+            DataOperationStatus.JOB_FAILURE, ["INVALID_FIELD"], 0, 0
+        )
+        sleep.assert_called_once()
+
+
+class TestBulkApi2DmlOperation:
+    def test_insert(self, bulk2_context, bulk2_server):
+        server = bulk2_server()
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName", "Email"],
+        )
+
+        with step:
+            step.load_records(
+                iter([["Test", "test@example.com"], ["Test2", None], ["Test3", ""]])
+            )
+
+        assert step.job_result == DataOperationJobResult(
+            DataOperationStatus.SUCCESS, [], 3, 0
+        )
+        (job,) = server.ingest_jobs.values()
+        assert job["spec"] == {
+            "object": "Contact",
+            "operation": "insert",
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "CRLF",
+        }
+        # The stand-in returns results in reverse order; they come back
+        # in submission order.
+        assert [result.id for result in step.get_results()] == [
+            row[0] for row in reversed(job["successful"])
+        ]
+        assert all(result.success for result in step.get_results())
+
+    def test_insert__row_errors(self, bulk2_context, bulk2_server):
+        bulk2_server(
+            fail_record=lambda record: (
+                "REQUIRED_FIELD_MISSING" if not record["LastName"] else None
+            )
+        )
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName"],
+        )
+
+        with step:
+            step.load_records(iter([["Test"], [""], ["Test3"], ["Test"]]))
+
+        assert step.job_result == DataOperationJobResult(
+            DataOperationStatus.ROW_FAILURE, [], 4, 1
+        )
+        results = list(step.get_results())
+        assert [result.success for result in results] == [True, False, True, True]
+        assert results[1] == DataOperationResult(
+            None, False, "REQUIRED_FIELD_MISSING", False
+        )
+        # Identical records each get their own Id.
+        assert results[0].id != results[3].id
+
+    def test_upsert__multiple_jobs(self, bulk2_context, bulk2_server):
+        server = bulk2_server()
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPSERT,
+            api_options={"update_key": "Email", "batch_size": 2},
+            context=bulk2_context,
+            fields=["LastName", "Email"],
+        )
+
+        with step:
+            step.load_records(
+                iter(
+                    [
+                        ["Test", "a@example.com"],
+                        ["Test", "b@example.com"],
+                        ["Test", "c@example.com"],
+                    ]
+                )
+            )
+
+        assert len(server.ingest_jobs) == 2
+        assert all(
+            job["spec"]["externalIdFieldName"] == "Email"
+            and job["spec"]["operation"] == "upsert"
+            for job in server.ingest_jobs.values()
+        )
+        assert step.job_result.records_processed == 3
+        assert len(list(step.get_results())) == 3
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.BULK2_MAX_UPLOAD_SIZE", 40)
+    def test_insert__upload_size_limit(self, bulk2_context, bulk2_server):
+        server = bulk2_server()
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName"],
+        )
+
+        with step:
+            step.load_records(iter([["Test1"], ["Test2"], ["Test3"], ["Test4"]]))
+
+        assert [job["data"] for job in server.ingest_jobs.values()] == [
+            '"LastName"\r\n"Test1"\r\n"Test2"\r\n"Test3"\r\n',
+            '"LastName"\r\n"Test4"\r\n',
+        ]
+        assert step.job_result.records_processed == 4
+
+    def test_no_records(self, bulk2_context, bulk2_server):
+        server = bulk2_server()
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName"],
+        )
+
+        with step:
+            step.load_records(iter([]))
+
+        assert server.ingest_jobs == {}
+        assert step.job_result == DataOperationJobResult(
+            DataOperationStatus.SUCCESS, [], 0, 0
+        )
+        assert list(step.get_results()) == []
+
+    def test_insert__normalized_echo(self, bulk2_context, bulk2_server):
+        # Checkbox values come back as "true" or "false"
+        server = bulk2_server(
+            echo_value=lambda value: (
+                value.lower() if value.lower() in ("true", "false") else value
+            )
+        )
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName", "DoNotCall"],
+        )
+
+        with step:
+            step.load_records(
+                iter([["Test", "TRUE"], ["Test", "true"], ["Other", "False"]])
+            )
+
+        (job,) = server.ingest_jobs.values()
+        results = list(step.get_results())
+        assert all(result.success for result in results)
+        # The two Test records differ only in a value the org treats as
+        # equal, so either may get either Id, but each gets its own.
+        assert {results[0].id, results[1].id} == {
+            row[0] for row in job["successful"] if row[2] == "Test"
+        }
+        assert results[2].id == job["successful"][0][0]
+
+    def test_get_results__missing_result(self, bulk2_context):
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName"],
+        )
+        list(step._track_positions([["Test"]]))
+
+        assert list(step.get_results()) == [
+            DataOperationResult(
+                None, False, "No result was returned for this record", False
+            )
+        ]
+
+    def test_get_prev_record_values(self, bulk2_context, bulk2_server):
+        server = bulk2_server(
+            query_headers=["Id"],
+            query_records=[["003000000000001"]],
+        )
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPDATE,
+            api_options={},
+            context=bulk2_context,
+            fields=["Id"],
+        )
+
+        values, fields = step.get_prev_record_values(iter([["003000000000001"]]))
+
+        assert values == [["003000000000001"]]
+        assert fields == ("Id",)
+        (spec,) = server.query_jobs.values()
+        assert spec["query"] == "SELECT Id FROM Contact WHERE Id IN ('003000000000001')"
+
+    def test_select_records(self, bulk2_context):
+        step = BulkApi2DmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.QUERY,
+            api_options={},
+            context=bulk2_context,
+            fields=["LastName"],
+        )
+
+        with pytest.raises(BulkDataException, match="not supported"):
+            step.select_records(iter([["Test"]]))
+
+
 class TestGetOperationFunctions:
     @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiQueryOperation")
     @mock.patch("cumulusci.tasks.bulkdata.step.RestApiQueryOperation")
@@ -3528,6 +4076,42 @@ class TestGetOperationFunctions:
             query="SELECT Id FROM Test",
         )
 
+    @mock.patch("cumulusci.tasks.bulkdata.step.BulkApi2QueryOperation")
+    def test_get_query_operation__bulk2(self, bulk2_query):
+        context = mock.Mock()
+        context.sf.sf_version = "47.0"
+        op = get_query_operation(
+            sobject="Test",
+            fields=["Id"],
+            api_options={},
+            context=context,
+            query="SELECT Id FROM Test",
+            api=DataApi.BULK2,
+        )
+        assert op == bulk2_query.return_value
+        bulk2_query.assert_called_once_with(
+            sobject="Test",
+            api_options={},
+            context=context,
+            query="SELECT Id FROM Test",
+        )
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiQueryOperation")
+    @mock.patch("cumulusci.tasks.bulkdata.step.BulkApi2QueryOperation")
+    def test_get_query_operation__bulk2_old_api_version(self, bulk2_query, bulk_query):
+        context = mock.Mock()
+        context.sf.sf_version = "46.0"
+        op = get_query_operation(
+            sobject="Test",
+            fields=["Id"],
+            api_options={},
+            context=context,
+            query="SELECT Id FROM Test",
+            api=DataApi.BULK2,
+        )
+        assert op == bulk_query.return_value
+        bulk2_query.assert_not_called()
+
     @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiQueryOperation")
     @mock.patch("cumulusci.tasks.bulkdata.step.RestApiQueryOperation")
     def test_get_query_operation__smart_to_rest(self, rest_query, bulk_query):
@@ -3676,6 +4260,34 @@ class TestGetOperationFunctions:
             threshold=None,
         )
 
+    @mock.patch("cumulusci.tasks.bulkdata.step.BulkApi2DmlOperation")
+    def test_get_dml_operation__bulk2(self, bulk2_dml):
+        context = mock.Mock()
+        context.sf.sf_version = "47.0"
+        op = get_dml_operation(
+            sobject="Test",
+            operation=DataOperationType.INSERT,
+            fields=["Name"],
+            api_options={},
+            context=context,
+            api=DataApi.BULK2,
+            volume=1,
+        )
+
+        assert op == bulk2_dml.return_value
+        bulk2_dml.assert_called_once_with(
+            sobject="Test",
+            operation=DataOperationType.INSERT,
+            fields=["Name"],
+            api_options={},
+            context=context,
+            selection_strategy=SelectStrategy.STANDARD,
+            selection_filter=None,
+            selection_priority_fields=None,
+            content_type=None,
+            threshold=None,
+        )
+
     @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiDmlOperation")
     @mock.patch("cumulusci.tasks.bulkdata.step.RestApiDmlOperation")
     def test_get_dml_operation__smart(self, rest_dml, bulk_dml):
@@ -1,3 +1,9 @@
+import csv
+import io
+import json
+import re
+from urllib.parse import parse_qs, urlparse
+
 from cumulusci.core.config import BaseProjectConfig, TaskConfig, UniversalConfig
 from cumulusci.core.keychain import BaseProjectKeychain
 from cumulusci.tasks.bulkdata.step import (
@@ -69,6 +75,169 @@ class FakeBulkAPI:
         return range(0, 10)
 
 
+class FakeBulkApi2Server:
+    """Stateful stand-in for the Bulk API 2.0 ingest and query endpoints,
+    served through a `responses` mock.
+
+    Ingest results are returned in reverse order of submission, since
+    Bulk API 2.0 does not guarantee result order. Records for which
+    `fail_record(record)` returns a message are reported as failures.
+    Values are echoed back in results as `echo_value(value)`."""
+
+    def __init__(
+        self,
+        rsps,
+        base_url,
+        *,
+        fail_record=None,
+        echo_value=None,
+        query_headers=(),
+        query_records=(),
+        query_page_size=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.fail_record = fail_record or (lambda record: None)
+        self.echo_value = echo_value or (lambda value: value)
+        self.query_headers = list(query_headers)
+        self.query_records = list(query_records)
+        self.query_page_size = query_page_size
+        self.ingest_jobs = {}
+        self.query_jobs = {}
+        self.next_id = 0
+
+        routes = [
+            ("POST", r"jobs/ingest", self.create_ingest_job),
+            ("PUT", r"jobs/ingest/(\w+)/batches", self.upload),
+            ("PATCH", r"jobs/ingest/(\w+)", self.close_ingest_job),
+            ("GET", r"jobs/ingest/(\w+)", self.ingest_job_info),
+            (
+                "GET",
+                r"jobs/ingest/(\w+)/(successfulResults|failedResults|unprocessedrecords)/",
+                self.ingest_results,
+            ),
+            ("POST", r"jobs/query", self.create_query_job),
+            ("GET", r"jobs/query/(\w+)", self.query_job_info),
+            ("GET", r"jobs/query/(\w+)/results", self.query_results),
+        ]
+        for method, path, handler in routes:
+            rsps.add_callback(
+                method,
+                re.compile(re.escape(self.base_url) + "/" + path + r"(\?.*)?$"),
+                callback=self._route(handler, path),
+            )
+
+    def _route(self, handler, path):
+        def callback(request):
+            request_path = urlparse(request.url).path
+            match = re.search(path + "$", request_path)
+            return handler(request, *match.groups())
+
+        return callback
+
+    def _new_id(self, prefix):
+        self.next_id += 1
+        return f"{prefix}{self.next_id:015d}"
+
+    def _json(self, body):
+        return (200, {"Content-Type": "application/json"}, json.dumps(body))
+
+    def _csv(self, headers, rows, response_headers=None):
+        buff = io.StringIO()
+        writer = csv.writer(buff, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(rows)
+        return (
+            200,
+            {"Content-Type": "text/csv", **(response_headers or {})},
+            buff.getvalue(),
+        )
+
+    def create_ingest_job(self, request):
+        spec = json.loads(request.body)
+        job_id = self._new_id("750")
+        self.ingest_jobs[job_id] = {"spec": spec, "state": "Open", "data": None}
+        return self._json({"id": job_id, "state": "Open", **spec})
+
+    def upload(self, request, job_id):
+        job = self.ingest_jobs[job_id]
+        if job["data"] is not None:
+            return (400, {}, json.dumps([{"errorCode": "INVALIDJOBSTATE"}]))
+        body = request.body
+        job["data"] = body.decode("utf-8") if isinstance(body, bytes) else body
+        return (201, {}, "")
+
+    def close_ingest_job(self, request, job_id):
+        job = self.ingest_jobs[job_id]
+        job["state"] = "JobComplete"
+        reader = csv.reader(io.StringIO(job["data"], newline=""))
+        job["fields"] = next(reader)
+        job["successful"] = []
+        job["failed"] = []
+        for row in reader:
+            error = self.fail_record(dict(zip(job["fields"], row)))
+            row = [self.echo_value(value) for value in row]
+            if error:
+                job["failed"].append(["", error] + row)
+            else:
+                job["successful"].append([self._new_id("001"), "true"] + row)
+        job["successful"].reverse()
+        job["failed"].reverse()
+        return self._json({"id": job_id, "state": "UploadComplete"})
+
+    def ingest_job_info(self, request, job_id):
+        job = self.ingest_jobs[job_id]
+        failed = len(job.get("failed", []))
+        return self._json(
+            {
+                "id": job_id,
+                "state": job["state"],
+                "numberRecordsProcessed": len(job.get("successful", [])) + failed,
+                "numberRecordsFailed": failed,
+            }
+        )
+
+    def ingest_results(self, request, job_id, kind):
+        job = self.ingest_jobs[job_id]
+        if kind == "successfulResults":
+            return self._csv(
+                ["sf__Id", "sf__Created"] + job["fields"], job["successful"]
+            )
+        elif kind == "failedResults":
+            return self._csv(["sf__Id", "sf__Error"] + job["fields"], job["failed"])
+        return self._csv(job["fields"], [])
+
+    def create_query_job(self, request):
+        spec = json.loads(request.body)
+        job_id = self._new_id("750")
+        self.query_jobs[job_id] = spec
+        return self._json({"id": job_id, "state": "UploadComplete", **spec})
+
+    def query_job_info(self, request, job_id):
+        return self._json(
+            {
+                "id": job_id,
+                "state": "JobComplete",
+                "numberRecordsProcessed": len(self.query_records),
+            }
+        )
+
+    def query_results(self, request, job_id):
+        params = parse_qs(urlparse(request.url).query)
+        start = int(params.get("locator", ["0"])[0])
+        page_size = int(
+            params.get("maxRecords", [self.query_page_size or len(self.query_records)])[
+                0
+            ]
+        )
+        end = start + page_size
+        locator = str(end) if end < len(self.query_records) else "null"
+        return self._csv(
+            self.query_headers,
+            self.query_records[start:end],
+            {"Sforce-Locator": locator, "Sforce-NumberOfRecords": str(end - start)},
+        )
+
+
 class FakeBulkAPIDmlOperation(BaseDmlOperation):
     def __init__(
         self, *, context, sobject=None, operation=None, api_options=None, fields=None
@@ -36,7 +36,7 @@ class UpdateData(BaseSalesforceApiTask):
             "required": False,
         },
         "api": {
-            "description": "The desired Salesforce API to use, which may be 'rest', 'bulk', or "
+            "description": "The desired Salesforce API to use, which may be 'rest', 'bulk', 'bulk2', or "
             "'smart' to auto-select based on record volume. The default is 'smart'.",
             "required": False,
         },
@@ -98,12 +98,13 @@ class UpdateData(BaseSalesforceApiTask):
         try:
             self.api = {
                 "bulk": DataApi.BULK,
+                "bulk2": DataApi.BULK2,
                 "rest": DataApi.REST,
                 "smart": DataApi.SMART,
             }[self.options.get("api", "smart").lower()]
         except KeyError:
             raise TaskOptionsError(
-                f"{self.options['api']} is not a valid value for API (valid: bulk, rest, smart)"
+                f"{self.options['api']} is not a valid value for API (valid: bulk, bulk2, rest, smart)"
             )
 
     def _run_task(self):
@@ -20,6 +20,7 @@ class DataApi(StrEnum):
     """Enum defining requested Salesforce data API for an operation."""
 
     BULK = "bulk"
+    BULK2 = "bulk2"
     REST = "rest"
     SMART = "smart"
 
@@ -1,13 +1,15 @@
 import csv
-from collections import defaultdict
-from pathlib import PurePosixPath
-from typing import List, Optional, Union
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 from unittest.mock import Mock
 from zipfile import ZipFile
 
 from github3.repos.repo import Repository
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+import cumulusci
 from cumulusci.core.dependencies.dependencies import (
     Dependency,
     GitHubDynamicDependency,
@@ -19,7 +21,8 @@ from cumulusci.core.dependencies.github import (
     get_repo,
 )
 from cumulusci.core.dependencies.resolvers import get_static_dependencies
-from cumulusci.core.exceptions import TaskOptionsError
+from cumulusci.core.exceptions import GithubApiNotFoundError, TaskOptionsError
+from cumulusci.core.github import get_ref_for_tag
 from cumulusci.core.utils import process_bool_arg
 from cumulusci.tasks.github.base import BaseGithubTask
 from cumulusci.utils import download_extract_github_from_repo
@@ -66,9 +69,27 @@ class FieldDetail(BaseModel):
     valid_values: str
 
 
+class ReleaseSchema(BaseModel):
+    """The schema found in a single release, without its version,
+    so that it can be cached."""
+
+    cumulusci_version: str
+    namespace: str
+    include_protected_schema: bool
+    sobjects: List[dict]
+    fields: List[dict]
+    omit_sobjects: List[str]
+
+
 # "Version number" used to represent a prerelease.
 PRERELEASE_SIGIL = LooseVersion("100000001.0")
 
+# Number of release archives downloaded at the same time
+MAX_PARALLEL_DOWNLOADS = 4
+
+# Directory in the project cache for the schema of each release
+RELEASE_SCHEMA_CACHE_DIR = "data_dictionary"
+
 
 class GenerateDataDictionary(BaseGithubTask):
     task_docs = """
@@ -98,6 +119,9 @@ class GenerateDataDictionary(BaseGithubTask):
     - Version Help Text Last Changed
 
     Both MDAPI and SFDX format releases are supported.
+
+    The schema of each release is cached in the project's `.cci` directory
+    by the SHA of its tag, so later runs only download and analyze new releases.
     """
 
     task_options = {
@@ -262,7 +286,14 @@ class GenerateDataDictionary(BaseGithubTask):
 
     def _walk_releases(self, package: Package):
         """Traverse all of the releases in this project's repository and process
-        each one matching our tag (not draft/prerelease) to generate the data dictionary."""
+        each one matching our tag (not draft/prerelease) to generate the data dictionary.
+
+        Release archives are downloaded in parallel but processed in order.
+        The schema of each release is cached by the SHA of its tag, so
+        releases that were processed before are not downloaded again."""
+        # Each job is a version to process, the Git ref to download,
+        # and the tag to cache it by, if any.
+        jobs = []
         for release in package.repo.releases():
             # Skip this release if any are true:
             # It is a draft release
@@ -276,38 +307,135 @@ class GenerateDataDictionary(BaseGithubTask):
             ):
                 continue
 
-            zip_file = download_extract_github_from_repo(
-                package.repo, ref=release.tag_name
-            )
             version = PackageVersion(
                 package=package,
                 version=self._version_from_tag_name(
                     release.tag_name, package.prefix_release
                 ),
             )
-            self.package_versions[package].append(version.version)
-            self.logger.info(
-                f"Analyzing {package.package_name} version {version.version}"
-            )
-
-            self._process_zipfile(zip_file, version)
+            jobs.append((version, release.tag_name, release.tag_name))
 
         # If we are asked to process a prerelease, do so.
         if self.options["include_prerelease"]:
             # package.repo is guaranteed to be our repo (via _init_options())
-            zip_file = download_extract_github_from_repo(
-                package.repo, ref=self.project_config.repo_branch
-            )
             version = PackageVersion(
                 package=package,
                 version=PRERELEASE_SIGIL,
             )
-            self.package_versions[package].append(version.version)
-            self.logger.info(
-                f"Analyzing {package.package_name} prerelease from {self.project_config.repo_branch}"
+            jobs.append((version, self.project_config.repo_branch, None))
+
+        def fetch(job) -> tuple:
+            """Find the cached schema of a release, or download its archive"""
+            version, ref, tag_name = job
+            cache_file = self._get_release_schema_cache_file(package, tag_name)
+            schema = self._load_release_schema(cache_file, package)
+            if schema:
+                return None, schema, cache_file
+            return (
+                download_extract_github_from_repo(package.repo, ref=ref),
+                None,
+                cache_file,
             )
 
+        for (version, ref, tag_name), (zip_file, schema, cache_file) in zip(
+            jobs, _map_in_order(fetch, jobs, MAX_PARALLEL_DOWNLOADS)
+        ):
+            self.package_versions[package].append(version.version)
+            if tag_name:
+                self.logger.info(
+                    f"Analyzing {package.package_name} version {version.version}"
+                )
+            else:
+                self.logger.info(
+                    f"Analyzing {package.package_name} prerelease from {ref}"
+                )
+
+            if schema is None:
+                schema = self._process_release(zip_file, version)
+                if cache_file:
+                    self._save_release_schema(cache_file, schema)
+            self._merge_release_schema(schema, version)
+
+    def _process_release(
+        self, zip_file: ZipFile, version: PackageVersion
+    ) -> ReleaseSchema:
+        """Process a release's ZIP file on its own, to find its schema"""
+        merged_schema = (self.sobjects, self.fields, self.omit_sobjects)
+        self.sobjects = defaultdict(list)
+        self.fields = defaultdict(list)
+        self.omit_sobjects = set()
+        try:
             self._process_zipfile(zip_file, version)
+            return ReleaseSchema(
+                cumulusci_version=cumulusci.__version__,
+                namespace=version.package.namespace,
+                include_protected_schema=self.options["include_protected_schema"],
+                sobjects=[
+                    sobject.dict(exclude={"version"})
+                    for sobjects in self.sobjects.values()
+                    for sobject in sobjects
+                ],
+                fields=[
+                    field.dict(exclude={"version"})
+                    for fields in self.fields.values()
+                    for field in fields
+                ],
+                omit_sobjects=sorted(self.omit_sobjects),
+            )
+        finally:
+            self.sobjects, self.fields, self.omit_sobjects = merged_schema
+
+    def _merge_release_schema(self, schema: ReleaseSchema, version: PackageVersion):
+        """Add the schema of a release to the data dictionary"""
+        for sobject in schema.sobjects:
+            self.sobjects[sobject["api_name"]].append(
+                SObjectDetail(version=version, **sobject)
+            )
+        for field in schema.fields:
+            self.fields[f"{field['sobject']}.{field['api_name']}"].append(
+                FieldDetail(version=version, **field)
+            )
+        self.omit_sobjects.update(schema.omit_sobjects)
+
+    def _get_release_schema_cache_file(
+        self, package: Package, tag_name: Optional[str]
+    ) -> Optional[Path]:
+        """Find where the schema of the release with this tag is cached.
+        Branches are never cached, since they move."""
+        if not tag_name:
+            return None
+        try:
+            sha = get_ref_for_tag(package.repo, tag_name).object.sha
+        except GithubApiNotFoundError:
+            return None
+        return self.project_config.cache_dir / RELEASE_SCHEMA_CACHE_DIR / f"{sha}.json"
+
+    def _load_release_schema(
+        self, cache_file: Optional[Path], package: Package
+    ) -> Optional[ReleaseSchema]:
+        if not cache_file or not cache_file.exists():
+            return None
+        try:
+            schema = ReleaseSchema.parse_file(cache_file)
+        except (OSError, ValueError, ValidationError) as e:
+            self.logger.debug(f"Cannot read cached schema {cache_file}: {e}")
+            return None
+        # The schema depends on these as well as on the release
+        if (
+            schema.cumulusci_version != cumulusci.__version__
+            or schema.namespace != package.namespace
+            or schema.include_protected_schema
+            != self.options["include_protected_schema"]
+        ):
+            return None
+        return schema
+
+    def _save_release_schema(self, cache_file: Path, schema: ReleaseSchema):
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(schema.json(), encoding="utf-8")
+        except OSError as e:
+            self.logger.debug(f"Cannot write cached schema {cache_file}: {e}")
 
     def _process_zipfile(self, zip_file: ZipFile, version: PackageVersion):
         if "src/objects/" in zip_file.namelist():
@@ -747,3 +875,18 @@ class GenerateDataDictionary(BaseGithubTask):
     ) -> LooseVersion:
         """Parse a release's tag and return a LooseVersion"""
         return LooseVersion(tag_name[len(prefix_release) :])
+
+
+def _map_in_order(func: Callable, items: Iterable, max_workers: int) -> Iterator:
+    """Like map(), but run up to `max_workers` calls at the same time in threads.
+
+    Only a few results are computed ahead of the one being consumed, so
+    that large results like release archives don't pile up in memory."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import shutil
@@ -15,6 +16,30 @@ from cumulusci.utils.xml import metadata_tree
 __location__ = os.path.dirname(os.path.realpath(__file__))
 
 
+@functools.lru_cache()
+def get_metadata_map():
+    """Return the parsed metadata_map.yml, which maps each directory of a
+    metadata package to the parser configurations for its contents.
+
+    It is parsed once per process and shared, so it must not be modified."""
+    with open(
+        __location__ + "/metadata_map.yml", "r", encoding="utf-8"
+    ) as f_metadata_map:
+        return yaml.safe_load(f_metadata_map)
+
+
+@functools.lru_cache()
+def get_metadata_type_directories():
+    """Return the directory each metadata type is stored in.
+
+    Types found in more than one directory map to the first of them."""
+    directories = {}
+    for directory, parser_configs in get_metadata_map().items():
+        for parser_config in parser_configs:
+            directories.setdefault(parser_config["type"], directory)
+    return directories
+
+
 def metadata_sort_key(name):
     sections = []
     for section in re.split("[.|-]", name):
@@ -84,10 +109,7 @@ class PackageXmlGenerator(object):
         types=None,
         logger=None,
     ):
-        with open(
-            __location__ + "/metadata_map.yml", "r", encoding="utf-8"
-        ) as f_metadata_map:
-            self.metadata_map = yaml.safe_load(f_metadata_map)
+        self.metadata_map = get_metadata_map()
         self.directory = directory
         self.api_version = api_version
         self.package_name = package_name
@@ -2,6 +2,7 @@ import os
 from unittest import mock
 
 import pytest
+import yaml
 from defusedxml.minidom import parseString
 
 from cumulusci.core.config import (
@@ -27,6 +28,8 @@ from cumulusci.tasks.metadata.package import (
     ParserConfigurationError,
     RecordTypeParser,
     UpdatePackageXml,
+    get_metadata_map,
+    get_metadata_type_directories,
     metadata_sort_key,
     process_common_components,
 )
@@ -105,6 +108,23 @@ class TestPackageXmlGenerator:
             result = generator()
             assert EXPECTED_MANAGED == result
 
+    def test_metadata_map__parsed_once(self):
+        get_metadata_map.cache_clear()
+        with mock.patch("yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            first = PackageXmlGenerator(None, "43.0")
+            second = PackageXmlGenerator(None, "43.0")
+
+        safe_load.assert_called_once()
+        assert first.metadata_map is second.metadata_map
+
+    def test_metadata_type_directories(self):
+        directories = get_metadata_type_directories()
+
+        assert directories["ApexClass"] == "classes"
+        assert directories["CustomObject"] == "objects"
+        assert directories["CustomField"] == "objects"
+        assert "Bogus" not in directories
+
 
 EXPECTED_MANAGED = """<?xml version="1.0" encoding="UTF-8"?>
 <Package xmlns="http://soap.sforce.com/2006/04/metadata">
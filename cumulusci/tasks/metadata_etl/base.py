@@ -9,7 +9,11 @@ from cumulusci.core.exceptions import CumulusCIException, TaskOptionsError
 from cumulusci.core.tasks import BaseSalesforceTask
 from cumulusci.core.utils import process_bool_arg, process_list_arg
 from cumulusci.salesforce_api.metadata import ApiRetrieveUnpackaged
-from cumulusci.tasks.metadata.package import PackageXmlGenerator
+from cumulusci.tasks.metadata.package import (
+    PackageXmlGenerator,
+    get_metadata_map,
+    get_metadata_type_directories,
+)
 from cumulusci.utils import inject_namespace
 from cumulusci.utils.xml import metadata_tree
 from cumulusci.utils.xml.metadata_tree import MetadataElement
@@ -277,25 +281,13 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
         # if the entity is an XML file, provide a parsed version
         # and write the returned metadata into the deploy directory
 
-        parser = PackageXmlGenerator(
-            None, self.api_version
-        )  # We'll use it for its metadata_map
-        entity_configurations = [
-            entry
-            for entry in parser.metadata_map
-            if any(
-                [
-                    subentry["type"] == self.entity
-                    for subentry in parser.metadata_map[entry]
-                ]
-            )
-        ]
-        if not entity_configurations:
+        directory = get_metadata_type_directories().get(self.entity)
+        if not directory:
             raise CumulusCIException(
                 f"Unable to locate configuration for entity {self.entity}"
             )
 
-        configuration = parser.metadata_map[entity_configurations[0]][0]
+        configuration = get_metadata_map()[directory][0]
         if configuration["class"] not in [
             "MetadataFilenameParser",
             "CustomObjectParser",
@@ -305,7 +297,6 @@ class MetadataSingleEntityTransformTask(BaseMetadataTransformTask, metaclass=ABC
             )
 
         extension = configuration["extension"]
-        directory = entity_configurations[0]
         source_metadata_dir = self.retrieve_dir / directory
 
         if "*" in self.api_names:
@@ -1,5 +1,6 @@
 from cumulusci.core.datasets import Dataset
 from cumulusci.core.exceptions import BulkDataException
+from cumulusci.salesforce_api.describe_cache import DescribeCache
 from cumulusci.tasks.bulkdata.mapping_parser import (
     parse_from_yaml,
     validate_and_inject_mapping,
@@ -41,6 +42,7 @@ class LoadDataSetCheck(BaseSalesforceApiTask):
                 data_operation=DataOperationType.INSERT,
                 inject_namespaces=True,
                 drop_missing=False,
+                describe_cache=DescribeCache(self.sf, self.org_config, self.logger),
             )
             self.return_values = True
         except BulkDataException as e:
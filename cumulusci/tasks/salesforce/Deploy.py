@@ -65,6 +65,9 @@ class Deploy(BaseSalesforceMetadataApiTask):
             "description": "Apply source transforms before deploying. See the CumulusCI documentation for details on how to specify transforms."
         },
         "rest_deploy": {"description": "If True, deploy metadata using REST API"},
+        "cache_package": {
+            "description": "If True, keep the built deployment package in the project's .cci directory and reuse it for later deployments of unchanged source with the same options and transforms. Defaults to False."
+        },
     }
 
     namespaces = {"sf": "http://soap.sforce.com/2006/04/metadata"}
@@ -113,6 +116,7 @@ class Deploy(BaseSalesforceMetadataApiTask):
 
         # Set class variable to true if rest_deploy is set to True
         self.rest_deploy = process_bool_arg(self.options.get("rest_deploy", False))
+        self.cache_package = process_bool_arg(self.options.get("cache_package", False))
 
     def _get_api(self, path=None):
         if not path:
@@ -223,6 +227,11 @@ class Deploy(BaseSalesforceMetadataApiTask):
                     context=context,
                     options=options,
                     transforms=self.transforms,
+                    cache_dir=(
+                        self.project_config.cache_dir / "deploy_packages"
+                        if self.cache_package
+                        else None
+                    ),
                 )
 
                 # If the package is empty, do nothing.
@@ -236,6 +236,21 @@ class TestDeploy:
             assert api.run_tests == ["TestA", "TestB"]
             assert api.test_level == "RunSpecifiedTests"
 
+    def test_get_api__cache_package(self, tmp_path):
+        with temporary_dir() as path:
+            touch("package.xml")
+            task = create_task(Deploy, {"path": path, "cache_package": True})
+            task.project_config._cache_dir = tmp_path
+
+            payload = task._get_api().package_zip
+            assert len(list((tmp_path / "deploy_packages").glob("*.zip"))) == 1
+
+            with mock.patch(
+                "cumulusci.salesforce_api.package_zip.MetadataPackageZipBuilder._process"
+            ) as process:
+                assert task._get_api().package_zip == payload
+            process.assert_not_called()
+
     @pytest.mark.parametrize("rest_deploy", [True, False])
     def test_get_api__skip_clean_meta_xml(self, rest_deploy):
         with temporary_dir() as path:
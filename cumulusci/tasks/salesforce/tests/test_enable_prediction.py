@@ -175,7 +175,7 @@ def test_run_task__namespaced_org(mock_oauth, task):
 
     mock_oauth.add(
         "GET",
-        f"https://test-dev-ed.my.salesforce.com/services/data/v{CURRENT_SF_API_VERSION}/tooling/query/?q=SELECT%20SubscriberPackage.Id,%20SubscriberPackage.NamespacePrefix,%20SubscriberPackageVersionId%20FROM%20InstalledSubscriberPackage",
+        f"https://test-dev-ed.my.salesforce.com/services/data/v{CURRENT_SF_API_VERSION}/tooling/query/?q=SELECT%20SubscriberPackage.Id,%20SubscriberPackage.NamespacePrefix,%20SubscriberPackageVersion.Id,%20SubscriberPackageVersion.MajorVersion,%20SubscriberPackageVersion.MinorVersion,%20SubscriberPackageVersion.PatchVersion,%20SubscriberPackageVersion.BuildNumber,%20SubscriberPackageVersion.IsBeta%20FROM%20InstalledSubscriberPackage",
         json={"totalSize": 0, "records": []},
     )
     mock_oauth.replace(
@@ -222,6 +222,23 @@ def test_run_task_gets_static_dependencies_and_installs():
     )
 
 
+@mock.patch("cumulusci.tasks.salesforce.update_dependencies.get_static_dependencies")
+def test_run_task__cache_resolution(get_static_dependencies):
+    get_static_dependencies.return_value = []
+    task = create_task(
+        UpdateDependencies,
+        {
+            "dependencies": [{"github": "https://github.com/Test/TestRepo"}],
+            "resolution_strategy": "production",
+            "cache_resolution": "True",
+        },
+    )
+
+    task()
+
+    assert get_static_dependencies.call_args.kwargs["use_lockfile"] is True
+
+
 @mock.patch("cumulusci.tasks.salesforce.update_dependencies.click.confirm")
 def test_run_task_gets_static_dependencies_and_installs__interactive(confirm):
     confirm.return_value = True
@@ -61,6 +61,11 @@ class UpdateDependencies(BaseSalesforceTask):
         "interactive": {
             "description": "If True, stop after identifying all dependencies and output the package Ids that will be installed. Defaults to False."
         },
+        "cache_resolution": {
+            "description": "If True, store the resolved dependencies in the project's .cci directory "
+            "and reuse them until one of the GitHub repositories they were resolved from changes. "
+            "Not supported by resolution strategies that use commit statuses. Defaults to False."
+        },
         "base_package_url_format": {
             "description": "If `interactive` is set to True, display package Ids using a format string ({} will be replaced with the package Id)."
         },
@@ -77,6 +82,9 @@ class UpdateDependencies(BaseSalesforceTask):
         self.options["packages_only"] = process_bool_arg(
             self.options.get("packages_only") or False
         )
+        self.cache_resolution = process_bool_arg(
+            self.options.get("cache_resolution") or False
+        )
         if "allow_uninstalls" in self.options or "allow_newer" in self.options:
             self.logger.warning(
                 "The allow_uninstalls and allow_newer options for update_dependencies are no longer supported. "
@@ -198,6 +206,7 @@ class UpdateDependencies(BaseSalesforceTask):
                 dependencies=self.dependencies,
                 strategies=self.resolution_strategy,
                 filter_function=filter_function,
+                use_lockfile=self.cache_resolution,
             )
         )
         self.logger.info("Collected dependencies:")
@@ -255,6 +264,7 @@ class UpdateDependencies(BaseSalesforceTask):
                 dependencies=self.dependencies,
                 strategies=self.resolution_strategy,
                 filter_function=filter_function,
+                use_lockfile=self.cache_resolution,
             )
         )
 
@@ -278,53 +278,32 @@ class TestCreatePackageVersion:
                             "Id": "033000000000002AAA",
                             "NamespacePrefix": "pub",
                         },
-                        "SubscriberPackageVersionId": "04t000000000002AAA",
+                        "SubscriberPackageVersion": {
+                            "Id": "04t000000000002AAA",
+                            "MajorVersion": 1,
+                            "MinorVersion": 5,
+                            "PatchVersion": 0,
+                            "BuildNumber": 1,
+                            "IsBeta": False,
+                        },
                     },
                     {
                         "SubscriberPackage": {
                             "Id": "033000000000003AAA",
                             "NamespacePrefix": "hed",
                         },
-                        "SubscriberPackageVersionId": "04t000000000003AAA",
+                        "SubscriberPackageVersion": {
+                            "Id": "04t000000000003AAA",
+                            "MajorVersion": 1,
+                            "MinorVersion": 99,
+                            "PatchVersion": 0,
+                            "BuildNumber": 1,
+                            "IsBeta": False,
+                        },
                     },
                 ],
             },
         )
-        # query dependency org for installed package 1
-        responses.add(
-            "GET",
-            f"{self.scratch_base_url}/tooling/query/",
-            json={
-                "size": 1,
-                "records": [
-                    {
-                        "Id": "04t000000000002AAA",
-                        "MajorVersion": 1,
-                        "MinorVersion": 5,
-                        "PatchVersion": 0,
-                        "BuildNumber": 1,
-                        "IsBeta": False,
-                    }
-                ],
-            },
-        )
-        responses.add(  # query dependency org for installed package 2)
-            "GET",
-            f"{self.scratch_base_url}/tooling/query/",
-            json={
-                "size": 1,
-                "records": [
-                    {
-                        "Id": "04t000000000003AAA",
-                        "MajorVersion": 1,
-                        "MinorVersion": 99,
-                        "PatchVersion": 0,
-                        "BuildNumber": 1,
-                        "IsBeta": False,
-                    }
-                ],
-            },
-        )
         responses.add(  # query for existing package (dependency from github)
             "GET",
             f"{self.devhub_base_url}/tooling/query/",
@@ -1,4 +1,5 @@
 import io
+import threading
 from collections import defaultdict
 from unittest.mock import Mock, call, mock_open, patch
 
@@ -1043,8 +1044,9 @@ class TestGenerateDataDictionary:
         )
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_walk_releases__mdapi(self, extract_github):
+    def test_walk_releases__mdapi(self, extract_github, tmp_path):
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.project__git__prefix_release = "rel/"
         project_config.project__name = "Project"
         task = create_task(GenerateDataDictionary, {}, project_config=project_config)
@@ -1070,8 +1072,9 @@ class TestGenerateDataDictionary:
         )
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_walk_releases__sfdx(self, extract_github):
+    def test_walk_releases__sfdx(self, extract_github, tmp_path):
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.project__git__prefix_release = "rel/"
         project_config.project__name = "Project"
 
@@ -1101,8 +1104,9 @@ class TestGenerateDataDictionary:
         )
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_walk_releases__draft(self, extract_github):
+    def test_walk_releases__draft(self, extract_github, tmp_path):
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.project__git__prefix_release = "rel/"
         project_config.project__name = "Project"
         task = create_task(GenerateDataDictionary, {}, project_config=project_config)
@@ -1129,8 +1133,9 @@ class TestGenerateDataDictionary:
         task._process_zipfile.assert_called_once()
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_walk_releases__prerelease(self, extract_github):
+    def test_walk_releases__prerelease(self, extract_github, tmp_path):
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.project__git__prefix_release = "rel/"
         project_config.project__name = "Project"
         project_config.repo_info["branch"] = "feature/foo"
@@ -1171,6 +1176,145 @@ class TestGenerateDataDictionary:
             ]
         )
 
+    def _make_walk_releases_task(self, tmp_path, tag_names, options=None):
+        project_config = create_project_config()
+        project_config._cache_dir = tmp_path
+        project_config.project__name = "Project"
+        task = create_task(
+            GenerateDataDictionary, options or {}, project_config=project_config
+        )
+        task._init_schema()
+
+        repo = Mock()
+        releases = []
+        for tag_name in tag_names:
+            release = Mock()
+            release.draft = False
+            release.prerelease = False
+            release.tag_name = tag_name
+            releases.append(release)
+        repo.releases.return_value = releases
+        repo.ref.side_effect = lambda ref: Mock(
+            object=Mock(sha=f"sha-{ref.replace('/', '-')}")
+        )
+        p = Package(
+            repo=repo, package_name="Test", namespace="test__", prefix_release="rel/"
+        )
+        return task, p
+
+    @staticmethod
+    def _mdapi_zip_file(field_name="Type__c"):
+        zip_file = Mock()
+        zip_file.namelist.return_value = ["src/objects/", "src/objects/Test__c.object"]
+        zip_file.read.return_value = f"""<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <label>Test</label>
+    <fields>
+        <fullName>{field_name}</fullName>
+        <label>Type</label>
+        <type>Text</type>
+        <length>255</length>
+    </fields>
+</CustomObject>""".encode(
+            "utf-8"
+        )
+        return zip_file
+
+    @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
+    def test_walk_releases__cached(self, extract_github, tmp_path):
+        extract_github.return_value = self._mdapi_zip_file()
+        task, p = self._make_walk_releases_task(tmp_path, ["rel/1.1"])
+        task._walk_releases(p)
+        assert (tmp_path / "data_dictionary" / "sha-tags-rel-1.1.json").exists()
+        assert extract_github.call_count == 1
+
+        cached_task, p = self._make_walk_releases_task(tmp_path, ["rel/1.1", "rel/1.2"])
+        cached_task._walk_releases(p)
+
+        # only the new release was downloaded
+        extract_github.assert_called_with(p.repo, ref="rel/1.2")
+        assert extract_github.call_count == 2
+        assert cached_task.package_versions[p] == [
+            LooseVersion("1.1"),
+            LooseVersion("1.2"),
+        ]
+        assert [
+            (field.version.version, field.type)
+            for field in cached_task.fields["test__Test__c.test__Type__c"]
+        ] == [(LooseVersion("1.1"), "Text (255)"), (LooseVersion("1.2"), "Text (255)")]
+        assert [
+            sobject.version.version for sobject in cached_task.sobjects["test__Test__c"]
+        ] == [LooseVersion("1.1"), LooseVersion("1.2")]
+        assert cached_task.sobjects["test__Test__c"][0].dict(
+            exclude={"version"}
+        ) == task.sobjects["test__Test__c"][0].dict(exclude={"version"})
+
+    @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
+    def test_walk_releases__cache_not_used(self, extract_github, tmp_path):
+        extract_github.return_value = self._mdapi_zip_file()
+        task, p = self._make_walk_releases_task(tmp_path, ["rel/1.1", "rel/1.2"])
+        task._walk_releases(p)
+        (tmp_path / "data_dictionary" / "sha-tags-rel-1.2.json").write_text("{")
+
+        # The cached schema depends on this option
+        task, p = self._make_walk_releases_task(
+            tmp_path, ["rel/1.1", "rel/1.2"], {"include_protected_schema": True}
+        )
+        task._walk_releases(p)
+
+        assert extract_github.call_count == 4
+        assert len(task.fields["test__Test__c.test__Type__c"]) == 2
+
+    @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
+    def test_walk_releases__cache_from_other_version(self, extract_github, tmp_path):
+        extract_github.return_value = self._mdapi_zip_file()
+        task, p = self._make_walk_releases_task(tmp_path, ["rel/1.1"])
+        task._walk_releases(p)
+
+        # The schema a release yields can change with CumulusCI
+        with patch("cumulusci.__version__", "0.0.1"):
+            task, p = self._make_walk_releases_task(tmp_path, ["rel/1.1"])
+            task._walk_releases(p)
+
+        assert extract_github.call_count == 2
+        assert len(task.fields["test__Test__c.test__Type__c"]) == 1
+
+    @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
+    def test_walk_releases__parallel_downloads(self, extract_github, tmp_path):
+        first_download_started = threading.Event()
+        last_download_finished = threading.Event()
+
+        def download(repo, ref):
+            if ref == "rel/1.1":
+                first_download_started.set()
+                # Finish after a later release has been downloaded
+                assert last_download_finished.wait(5)
+                return self._mdapi_zip_file("Old__c")
+            assert first_download_started.wait(5)
+            if ref == "rel/1.3":
+                last_download_finished.set()
+            return self._mdapi_zip_file("New__c")
+
+        extract_github.side_effect = download
+        task, p = self._make_walk_releases_task(
+            tmp_path, ["rel/1.1", "rel/1.2", "rel/1.3"]
+        )
+        task._walk_releases(p)
+
+        # results are merged in the order of the releases
+        assert task.package_versions[p] == [
+            LooseVersion("1.1"),
+            LooseVersion("1.2"),
+            LooseVersion("1.3"),
+        ]
+        assert list(task.fields) == [
+            "test__Test__c.test__Old__c",
+            "test__Test__c.test__New__c",
+        ]
+        assert [
+            field.version.version for field in task.fields["test__Test__c.test__New__c"]
+        ] == [LooseVersion("1.2"), LooseVersion("1.3")]
+
     def test_init_schema(self):
         task = create_task(GenerateDataDictionary, {})
         task._init_schema()
@@ -1232,7 +1376,7 @@ class TestGenerateDataDictionary:
         )
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_run_task(self, extract_github):
+    def test_run_task(self, extract_github, tmp_path):
         # This is an integration test. We mock out `get_repo()` and the filesystem.
         xml_source = """<?xml version="1.0" encoding="UTF-8"?>
 <CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
@@ -1247,6 +1391,7 @@ class TestGenerateDataDictionary:
     </fields>
 </CustomObject>"""
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.keychain.get_service = Mock()
         project_config.project__package__name = "Project"
         project_config.project__name = "Project"
@@ -1293,7 +1438,7 @@ class TestGenerateDataDictionary:
         )
 
     @patch("cumulusci.tasks.datadictionary.download_extract_github_from_repo")
-    def test_run_task__prerelease(self, extract_github):
+    def test_run_task__prerelease(self, extract_github, tmp_path):
         # This is an integration test. We mock out `get_repo()` and the filesystem.
         xml_source = """<?xml version="1.0" encoding="UTF-8"?>
 <CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
@@ -1328,6 +1473,7 @@ class TestGenerateDataDictionary:
 </CustomObject>"""
 
         project_config = create_project_config()
+        project_config._cache_dir = tmp_path
         project_config.keychain.get_service = Mock()
         project_config.project__package__name = "Project"
         project_config.project__name = "Project"
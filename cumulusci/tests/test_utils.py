@@ -3,7 +3,9 @@
 import io
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from unittest import mock
 from xml.etree import ElementTree as ET
 
@@ -17,6 +19,7 @@ from cumulusci.core.exceptions import CumulusCIException
 from cumulusci.core.flowrunner import FlowCoordinator
 from cumulusci.core.tasks import BaseTask
 from cumulusci.tests.util import create_project_config
+from cumulusci.utils import ziputils
 from cumulusci.utils.xml import elementtree_parse_file, lxml_parse_file
 
 
@@ -396,6 +399,134 @@ Options\n------------------------------------------\n\n
         result = zf.read("test")
         assert b"test" in result
 
+    def test_download_extract_github__cached_by_commit(self, tmp_path):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w") as zf:
+            zf.writestr("top/", "top")
+            zf.writestr("top/src/", "top_src")
+            zf.writestr("top/src/test", "test")
+        zipbytes = f.getvalue()
+        mock_repo = mock.Mock(full_name="TestOwner/TestRepo")
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            zip_content.write(zipbytes)
+            return True
+
+        mock_repo.archive.side_effect = assign_bytes
+        sha = "a" * 40
+
+        zf = utils.download_extract_github_from_repo(mock_repo, "src", ref=sha)
+        assert zf.namelist() == ["test"]
+        zf.close()
+
+        zf = utils.download_extract_github_from_repo(mock_repo, ref=sha)
+        assert zf.namelist() == ["src/", "src/test"]
+        zf.extractall(tmp_path)
+        assert (tmp_path / "src" / "test").read_text() == "test"
+        zf.close()
+
+        mock_repo.archive.assert_called_once()
+        assert (
+            Path.home() / ".cumulusci/github_archives/TestOwner/TestRepo" / f"{sha}.zip"
+        ).exists()
+
+        # Branches can move, so they aren't cached
+        utils.download_extract_github_from_repo(mock_repo, ref="main").close()
+        utils.download_extract_github_from_repo(mock_repo, ref="main").close()
+        assert mock_repo.archive.call_count == 3
+
+    def test_download_extract_github__evicted_before_use(self):
+        mock_repo = mock.Mock(full_name="TestOwner/TestRepo")
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            with zipfile.ZipFile(zip_content, "w") as zf:
+                zf.writestr(f"top-{ref}/", "")
+                zf.writestr(f"top-{ref}/test", ref)
+            return True
+
+        mock_repo.archive.side_effect = assign_bytes
+        sha = "a" * 40
+        utils.download_extract_github_from_repo(mock_repo, ref=sha).close()
+        cache_file = (
+            Path.home() / ".cumulusci/github_archives/TestOwner/TestRepo" / f"{sha}.zip"
+        )
+
+        # Another process evicts the archive after this one finds it
+        def evict(path):
+            Path(path).unlink()
+            raise FileNotFoundError(path)
+
+        with mock.patch("os.utime", side_effect=evict):
+            zf = utils.download_extract_github_from_repo(mock_repo, ref=sha)
+        assert zf.read("test") == sha.encode()
+        zf.close()
+        assert mock_repo.archive.call_count == 2
+        assert cache_file.stat().st_size > 0
+
+    def test_download_extract_github__concurrent_downloads(self):
+        mock_repo = mock.Mock(full_name="TestOwner/TestRepo")
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            with zipfile.ZipFile(zip_content, "w") as zf:
+                zf.writestr(f"top-{ref}/", "")
+                zf.writestr(f"top-{ref}/test", ref * 1000)
+            return True
+
+        mock_repo.archive.side_effect = assign_bytes
+        sha = "a" * 40
+
+        def download(_):
+            with utils.download_extract_github_from_repo(mock_repo, ref=sha) as zf:
+                return zf.read("test")
+
+        # Every thread downloads and saves the archive itself
+        with mock.patch("os.utime", side_effect=FileNotFoundError), ThreadPoolExecutor(
+            max_workers=8
+        ) as executor:
+            results = list(executor.map(download, range(16)))
+
+        assert results == [sha.encode() * 1000] * 16
+        cache_dir = Path.home() / ".cumulusci/github_archives/TestOwner/TestRepo"
+        assert [f.name for f in cache_dir.iterdir()] == [f"{sha}.zip"]
+
+    def test_download_extract_github__evicts_least_recently_used(self):
+        mock_repo = mock.Mock(full_name="TestOwner/TestRepo")
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            with zipfile.ZipFile(zip_content, "w") as zf:
+                zf.writestr(f"top-{ref}/test", ref)
+            return True
+
+        mock_repo.archive.side_effect = assign_bytes
+        with mock.patch("cumulusci.utils.MAX_CACHED_ARCHIVES", 1):
+            utils.download_extract_github_from_repo(mock_repo, ref="a" * 40).close()
+            utils.download_extract_github_from_repo(mock_repo, ref="b" * 40).close()
+
+        cache_dir = Path.home() / ".cumulusci/github_archives/TestOwner/TestRepo"
+        assert [f.name for f in cache_dir.iterdir()] == [f"{'b' * 40}.zip"]
+
+    def test_download_extract_github__archive_in_use(self):
+        mock_repo = mock.Mock(full_name="TestOwner/TestRepo")
+
+        def assign_bytes(archive_type, zip_content, ref=None):
+            with zipfile.ZipFile(zip_content, "w") as zf:
+                zf.writestr(f"top-{ref}/", "")
+                zf.writestr(f"top-{ref}/test", ref)
+            return True
+
+        mock_repo.archive.side_effect = assign_bytes
+        with mock.patch("cumulusci.utils.MAX_CACHED_ARCHIVES", 1):
+            zf = utils.download_extract_github_from_repo(mock_repo, ref="a" * 40)
+            with mock.patch.object(
+                Path, "unlink", side_effect=PermissionError("in use")
+            ):
+                utils.download_extract_github_from_repo(mock_repo, ref="b" * 40).close()
+            assert zf.read("test") == b"a" * 40
+            zf.close()
+
+        cache_dir = Path.home() / ".cumulusci/github_archives/TestOwner/TestRepo"
+        assert len(list(cache_dir.iterdir())) == 2
+
     def test_download_extract_github__failure(self):
         mock_repo = mock.Mock(default_branch="main")
         mock_github = mock.Mock()
@@ -450,6 +581,79 @@ Options\n------------------------------------------\n\n
         assert contents == result
         zf.close()
 
+    def test_zip_subfolder_view(self, tmp_path):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w") as zf:
+            zf.writestr("top/src/", "")
+            zf.writestr("top/src/classes/Foo.cls", "foo")
+            zf.writestr("top/other", "other")
+
+        zf = ziputils.zip_subfolder_view(zipfile.ZipFile(f), "top/src")
+
+        assert zf.namelist() == ["classes/Foo.cls"]
+        assert zf.read("classes/Foo.cls") == b"foo"
+        zf.extractall(tmp_path)
+        assert (tmp_path / "classes" / "Foo.cls").read_text() == "foo"
+        assert ziputils.zip_subfolder_view(zf, "classes").namelist() == ["Foo.cls"]
+
+    def test_zip_subfolder_view__reads_members(self):
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("top/src/classes/Foo.cls", "foo")
+            zf.writestr("top/src/classes/Bar.cls", "bar" * 100)
+            zf.writestr("top/other", "other")
+        zip_src = zipfile.ZipFile(f)
+
+        with ziputils.zip_subfolder_view(zip_src, "top/src/classes") as zf:
+            assert isinstance(zf, zipfile.ZipFile)
+            assert {info.filename: zf.read(info) for info in zf.infolist()} == {
+                "Foo.cls": b"foo",
+                "Bar.cls": b"bar" * 100,
+            }
+            with zf.open("Foo.cls") as member:
+                assert member.read() == b"foo"
+            with pytest.raises(KeyError):
+                zf.read("other")
+            with pytest.raises(ValueError):
+                zf.writestr("Baz.cls", "baz")
+
+            # The wrapped zipfile is unchanged
+            assert zip_src.namelist() == [
+                "top/src/classes/Foo.cls",
+                "top/src/classes/Bar.cls",
+                "top/other",
+            ]
+            assert zip_src.read("top/other") == b"other"
+
+    def test_zip_subfolder_view__writable(self):
+        zf = zipfile.ZipFile(io.BytesIO(), "w")
+        zf.writestr("src/test", "test")
+
+        subfolder = ziputils.zip_subfolder_view(zf, "src")
+
+        assert subfolder is not zf
+        assert subfolder.read("test") == b"test"
+
+    def test_hash_directory_contents(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b.txt").write_text("b")
+        (tmp_path / "c.txt").write_text("c")
+        zf = zipfile.ZipFile(io.BytesIO(), "w")
+        zf.writestr("a/b.txt", "b")
+        zf.writestr("c.txt", "c")
+
+        assert ziputils.hash_directory_contents(
+            tmp_path
+        ) == ziputils.hash_zipfile_contents(zf)
+        assert ziputils.hash_directory_contents(
+            tmp_path, [tmp_path / "c.txt"]
+        ) != ziputils.hash_directory_contents(tmp_path)
+
+        (tmp_path / "c.txt").write_text("d")
+        assert ziputils.hash_directory_contents(
+            tmp_path
+        ) != ziputils.hash_zipfile_contents(zf)
+
     def test_inject_namespace__managed(self):
         logger = mock.Mock()
         name = "___NAMESPACE___test"
@@ -160,12 +160,18 @@ def big_objs(traced_only=False):
 
 
 class FakeSObjectProxy:
+    base_url = "https://fakesf.example.org/sobjects/"
+
     def __init__(self, describe_data):
         self.describe_data = describe_data
 
     def describe(self):
         return self.describe_data
 
+    def _call_salesforce(self, method, url, **kwargs):
+        assert method == "GET" and url.endswith("describe")
+        return mock.Mock(headers={}, json=mock.Mock(return_value=self.describe_data))
+
 
 class FakeSF:
     """Simplistic mock of the Simple-Salesforce API
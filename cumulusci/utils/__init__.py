@@ -24,7 +24,7 @@ from .xml import (  # noqa
     remove_xml_element_string,
 )
 from .ziputils import process_text_in_zipfile  # noqa
-from .ziputils import zip_subfolder
+from .ziputils import zip_subfolder, zip_subfolder_view
 
 CUMULUSCI_PATH = os.path.realpath(
     os.path.join(os.path.dirname(os.path.realpath(__file__)), "../..")
@@ -32,6 +32,10 @@ CUMULUSCI_PATH = os.path.realpath(
 META_XML_CLEAN_DIRS = ("classes/", "triggers/", "pages/", "aura/", "components/")
 API_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 DATETIME_LEN = len("2018-08-07T16:00:56.000")
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+# Number of GitHub archives kept in ~/.cumulusci/github_archives
+MAX_CACHED_ARCHIVES = 50
 
 BREW_DEPRECATION_MSG = (
     "It looks like you have installed CumulusCI using brew."
@@ -151,6 +155,32 @@ def download_extract_github(
 def download_extract_github_from_repo(github_repo, subfolder=None, ref=None):
     if not ref:
         ref = github_repo.default_branch
+    zip_file = zipfile.ZipFile(_get_github_archive(github_repo, ref))
+    path = sorted(zip_file.namelist())[0]
+    if subfolder:
+        path = path + subfolder
+    return zip_subfolder_view(zip_file, path)
+
+
+def _get_github_archive(github_repo, ref):
+    """Download a zipball of a Git ref, returning it as a path or a file object.
+
+    The archive of a commit never changes, so when `ref` is a commit SHA
+    the archive is kept in ~/.cumulusci/github_archives and only downloaded
+    once per machine. The least recently used archives are discarded."""
+    cache_file = None
+    if COMMIT_SHA_RE.match(ref):
+        cache_dir = Path.home() / ".cumulusci" / "github_archives"
+        cache_file = cache_dir.joinpath(*github_repo.full_name.split("/"), f"{ref}.zip")
+        try:
+            # Mark this archive as recently used. Unlike touch(), this
+            # doesn't create an empty file if the archive was just evicted.
+            os.utime(cache_file)
+        except FileNotFoundError:
+            pass
+        else:
+            return cache_file
+
     zip_content = io.BytesIO()
     if not github_repo.archive("zipball", zip_content, ref=ref):
         raise CumulusCIException(
@@ -160,12 +190,26 @@ def download_extract_github_from_repo(github_repo, subfolder=None, ref=None):
             "does not have permission to access it, or that your access "
             "is restricted by an IP address allow list."
         )
-    zip_file = zipfile.ZipFile(zip_content)
-    path = sorted(zip_file.namelist())[0]
-    if subfolder:
-        path = path + subfolder
-    zip_file = zip_subfolder(zip_file, path)
-    return zip_file
+    if cache_file is None:
+        return zip_content
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Each download gets its own temporary file, even between threads
+    with tempfile.NamedTemporaryFile(
+        dir=cache_file.parent, prefix=f"{ref}.", suffix=".tmp", delete=False
+    ) as f:
+        f.write(zip_content.getvalue())
+    Path(f.name).replace(cache_file)
+
+    cached = sorted(
+        cache_dir.glob("*/*/*.zip"), key=lambda f: f.stat().st_mtime, reverse=True
+    )
+    for stale_file in cached[MAX_CACHED_ARCHIVES:]:
+        try:
+            stale_file.unlink(missing_ok=True)
+        except OSError:  # e.g. still open in another process on Windows
+            pass
+    return cache_file
 
 
 def process_text_in_directory(path, process_file):
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+# Headers whose value changes what the server returns
+VARY_HEADERS = ("Accept", "Authorization")
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter that stores GET responses with an ETag or Last-Modified
+    validator on disk, and revalidates them with a conditional request
+    the next time the same URL is requested.
+
+    When the server answers 304 Not Modified, the stored response is
+    returned in its place. Entries are keyed by URL and by the headers that
+    change the response, so responses fetched with one credential are never
+    returned for another. The least recently used entries are discarded
+    once the stored bodies exceed `max_size` bytes.
+
+    Requests that already carry their own validators, and streamed requests,
+    are passed through untouched."""
+
+    def __init__(self, cache_dir: Path, max_size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, **kwargs):
+        if (
+            request.method != "GET"
+            or stream
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+        ):
+            return super().send(request, stream=stream, **kwargs)
+
+        key = self._get_key(request)
+        cached = self._load(key)
+        if cached:
+            meta, body = cached
+            if meta.get("etag"):
+                request.headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request.headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if cached and response.status_code == 304:
+            self._record("hit", request.url)
+            return self._build_cached_response(response, meta, body)
+
+        self._record("miss", request.url)
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            self._save(key, response)
+        return response
+
+    def _record(self, result: str, url: str):
+        with self._lock:
+            if result == "hit":
+                self.hits += 1
+            else:
+                self.misses += 1
+        logger.debug(
+            f"GitHub HTTP cache {result}: {url} ({self.hits} hits, {self.misses} misses)"
+        )
+
+    def _get_key(self, request) -> str:
+        h = hashlib.sha256(request.url.encode("utf-8"))
+        for header in VARY_HEADERS:
+            h.update(b"\0" + request.headers.get(header, "").encode("utf-8"))
+        return h.hexdigest()
+
+    def _load(self, key: str):
+        meta_file = self.cache_dir / f"{key}.json"
+        body_file = self.cache_dir / f"{key}.body"
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            body = body_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.debug(f"Cannot read GitHub HTTP cache entry {key}: {e}")
+            return None
+
+        # Mark this entry as recently used
+        body_file.touch()
+        return meta, body
+
+    def _save(self, key: str, response):
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "headers": dict(response.headers),
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for suffix, content in (
+            ("body", response.content),
+            ("json", json.dumps(meta).encode("utf-8")),
+        ):
+            # Write to a temporary file first so that other processes
+            # sharing the cache never see part of an entry.
+            temp_file = (
+                self.cache_dir
+                / f"{key}.{suffix}.{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            temp_file.write_bytes(content)
+            temp_file.replace(self.cache_dir / f"{key}.{suffix}")
+        self._evict()
+
+    def _evict(self):
+        """Discard the least recently used entries until the cache fits in max_size."""
+        with self._lock:
+            entries = []
+            for body_file in self.cache_dir.glob("*.body"):
+                try:
+                    stat = body_file.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, body_file))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, body_file in sorted(entries, key=lambda e: e[0]):
+                if total_size <= self.max_size:
+                    break
+                body_file.with_suffix(".json").unlink(missing_ok=True)
+                body_file.unlink(missing_ok=True)
+                total_size -= size
+
+    def _build_cached_response(self, response, meta: dict, body: bytes):
+        # Keep headers from the 304 response, such as rate limits,
+        # on top of the headers that came with the stored body.
+        headers = CaseInsensitiveDict(meta["headers"])
+        headers.update(
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() != "content-length"
+        )
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = body
+        return response
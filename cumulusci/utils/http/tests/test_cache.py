@@ -0,0 +1,114 @@
+import logging
+
+import pytest
+import requests
+import responses
+
+from cumulusci.utils.http.cache import CachingHTTPAdapter
+
+URL = "https://api.github.com/repos/SFDO-Tooling/CumulusCI"
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    return CachingHTTPAdapter(tmp_path, max_size=1024)
+
+
+@pytest.fixture
+def session(adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+class TestCachingHTTPAdapter:
+    @responses.activate
+    def test_etag(self, session, adapter, caplog):
+        caplog.set_level(logging.DEBUG)
+        responses.add(
+            "GET",
+            URL,
+            json={"name": "CumulusCI"},
+            headers={"ETag": '"abc"', "X-RateLimit-Remaining": "10"},
+        )
+        responses.add("GET", URL, status=304, headers={"X-RateLimit-Remaining": "9"})
+
+        assert session.get(URL).json() == {"name": "CumulusCI"}
+        response = session.get(URL)
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "CumulusCI"}
+        assert response.headers["ETag"] == '"abc"'
+        assert response.headers["X-RateLimit-Remaining"] == "9"
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+        assert (adapter.hits, adapter.misses) == (1, 1)
+        assert f"GitHub HTTP cache hit: {URL} (1 hits, 1 misses)" in caplog.text
+
+    @responses.activate
+    def test_last_modified__changed(self, session, adapter):
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        responses.add(
+            "GET", URL, json={"v": 1}, headers={"Last-Modified": last_modified}
+        )
+        responses.add("GET", URL, json={"v": 2})
+        responses.add("GET", URL, json={"v": 3})
+
+        assert session.get(URL).json() == {"v": 1}
+        assert session.get(URL).json() == {"v": 2}
+        assert session.get(URL).json() == {"v": 3}
+
+        assert responses.calls[1].request.headers["If-Modified-Since"] == last_modified
+        assert (adapter.hits, adapter.misses) == (0, 3)
+
+    @responses.activate
+    def test_varies_by_authorization(self, session, adapter):
+        responses.add("GET", URL, json={}, headers={"ETag": '"abc"'})
+
+        session.get(URL, headers={"Authorization": "token one"})
+        session.get(URL, headers={"Authorization": "token two"})
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_passes_through(self, session, adapter, tmp_path):
+        responses.add("GET", URL, json={}, headers={"ETag": '"abc"'})
+        responses.add("POST", URL, json={}, headers={"ETag": '"abc"'})
+
+        session.post(URL)
+        session.get(URL, stream=True)
+        session.get(URL, headers={"If-None-Match": '"def"'})
+
+        assert not list(tmp_path.iterdir())
+        assert responses.calls[2].request.headers["If-None-Match"] == '"def"'
+        assert (adapter.hits, adapter.misses) == (0, 0)
+
+    @responses.activate
+    def test_evicts_least_recently_used(self, session, adapter, tmp_path):
+        for name in ("a", "b", "c"):
+            responses.add(
+                "GET", f"{URL}/{name}", body="x" * 400, headers={"ETag": name}
+            )
+            responses.add("GET", f"{URL}/{name}", status=304)
+
+        session.get(f"{URL}/a")
+        session.get(f"{URL}/b")
+        # Use a so that b is the least recently used
+        session.get(f"{URL}/a")
+        session.get(f"{URL}/c")
+
+        assert len(list(tmp_path.glob("*.body"))) == 2
+        assert session.get(f"{URL}/a").text == "x" * 400
+        assert session.get(f"{URL}/c").text == "x" * 400
+        assert (adapter.hits, adapter.misses) == (3, 3)
+
+    @responses.activate
+    def test_unreadable_entry(self, session, adapter, tmp_path):
+        responses.add("GET", URL, json={}, headers={"ETag": '"abc"'})
+        session.get(URL)
+        (meta_file,) = tmp_path.glob("*.json")
+        meta_file.write_text("{")
+
+        session.get(URL)
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
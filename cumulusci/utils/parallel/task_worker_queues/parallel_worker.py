@@ -1,9 +1,11 @@
 import json
 import logging
 import shutil
+import time
 import typing as T
 from contextlib import contextmanager
-from multiprocessing import Queue
+from multiprocessing import Pipe, Queue
+from multiprocessing.connection import Connection
 from pathlib import Path
 from traceback import format_exc
 
@@ -20,6 +22,10 @@ from cumulusci.core.config import (
 from cumulusci.core.keychain.subprocess_keychain import SubprocessKeychain
 from cumulusci.core.utils import import_global
 
+# A pooled worker reuses the org connection from its earlier jobs, and
+# refreshes its credentials when they are older than this many seconds.
+CREDENTIALS_MAX_AGE = 10 * 60
+
 
 class SharedConfig(BaseModel):
     "Properties available both in the Queue and also each worker"
@@ -97,8 +103,16 @@ def dotted_class_name(cls):
 class TaskWorker:
     """This class runs in a sub-thread or sub-process"""
 
-    def __init__(self, worker_dict, results_reporter, filesystem_lock):
-        self.worker_config = WorkerConfig.from_dict(worker_dict)
+    def __init__(
+        self,
+        worker_dict,
+        results_reporter,
+        filesystem_lock,
+        worker_config: T.Optional[WorkerConfig] = None,
+        refresh_credentials: bool = True,
+    ):
+        self.worker_config = worker_config or WorkerConfig.from_dict(worker_dict)
+        self.refresh_credentials = refresh_credentials
         self.redirect_logging = worker_dict["redirect_logging"]
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
@@ -117,12 +131,15 @@ class TaskWorker:
         keychain = SubprocessKeychain(connected_app)
         self.project_config.set_keychain(keychain)
         self.org_config.keychain = keychain
-        return task_class(
+        task = task_class(
             project_config=self.project_config,
             task_config=task_config,
             org_config=self.org_config,
             logger=logger,
+            # An earlier job in this worker may have refreshed them recently
+            refresh_credentials=self.refresh_credentials,
         )
+        return task
 
     def save_exception(self, e):
         """Write an exception to disk for later analysis"""
@@ -180,10 +197,80 @@ class TaskWorker:
             yield logger, f
 
 
-def run_task_in_worker(worker_dict: dict, results_reporter: Queue, filesystem_lock):
+def run_task_in_worker(
+    worker_dict: dict,
+    results_reporter: Queue,
+    filesystem_lock,
+    worker_finished: T.Optional[Connection] = None,
+):
     assert filesystem_lock
-    worker = TaskWorker(worker_dict, results_reporter, filesystem_lock)
-    return worker.run()
+    try:
+        worker = TaskWorker(worker_dict, results_reporter, filesystem_lock)
+        return worker.run()
+    finally:
+        # Wake up the controller so it can start the next job right away.
+        # Messages this small are written atomically, so workers can
+        # share one connection.
+        if worker_finished:
+            worker_finished.send(worker_dict["working_dir"])
+
+
+def run_tasks_in_pooled_worker(
+    jobs: Connection,
+    results_reporter: Queue,
+    filesystem_lock,
+    worker_finished: T.Optional[Connection] = None,
+):
+    """Run the jobs sent over `jobs` one after another, until it is closed
+    or sent None. Runs in a sub-thread or sub-process.
+
+    The project config, org config and org connection built for the first
+    job are reused by the later ones, along with every imported module."""
+    assert filesystem_lock
+    worker_config = None
+    credentials_refreshed = None
+    while True:
+        try:
+            worker_dict = jobs.recv()
+        except EOFError:
+            return
+        if worker_dict is None:
+            return
+
+        if worker_config is None:
+            worker_config = WorkerConfig.from_dict(worker_dict)
+        else:
+            worker_config = worker_config.copy(
+                update={
+                    "task_options": worker_dict["task_options"],
+                    "working_dir": Path(worker_dict["working_dir"]),
+                    "outbox_dir": Path(worker_dict["outbox_dir"]),
+                }
+            )
+        refresh_credentials = (
+            credentials_refreshed is None
+            or time.monotonic() - credentials_refreshed > CREDENTIALS_MAX_AGE
+        )
+
+        try:
+            worker = TaskWorker(
+                worker_dict,
+                results_reporter,
+                filesystem_lock,
+                worker_config,
+                refresh_credentials,
+            )
+            worker.run()
+        except Exception:
+            # The failure is recorded in the job directory.
+            pass
+        else:
+            if refresh_credentials:
+                credentials_refreshed = time.monotonic()
+        finally:
+            jobs.send(worker_dict["working_dir"])
+            if worker_finished:
+                worker_finished.send(worker_dict["working_dir"])
 
 
 def simplify(x):
@@ -200,11 +287,13 @@ class ParallelWorker:
         worker_config: WorkerConfig,
         results_reporter: Queue,
         filesystem_lock,
+        worker_finished: T.Optional[Connection] = None,
     ):
         self.spawn_class = spawn_class
         self.worker_config = worker_config
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
+        self.worker_finished = worker_finished
         assert filesystem_lock
 
     def _validate_worker_config_is_simple(self, worker_config):
@@ -218,7 +307,12 @@ class ParallelWorker:
         # under the covers, Python will pass this as Pickles.
         self.process = self.spawn_class(
             target=run_task_in_worker,
-            args=[dct, self.results_reporter, self.filesystem_lock],
+            args=[
+                dct,
+                self.results_reporter,
+                self.filesystem_lock,
+                self.worker_finished,
+            ],
             # quit if the parent process decides to exit (e.g. after a timeout)
             daemon=True,
         )
@@ -227,6 +321,9 @@ class ParallelWorker:
     def is_alive(self) -> bool:
         return self.process.is_alive()
 
+    def join(self, timeout: T.Optional[float] = None):
+        self.process.join(timeout)
+
     def terminate(self):
         # Note that this will throw an exception for threads
         # and should be used carefully for processes because
@@ -236,3 +333,63 @@ class ParallelWorker:
 
     def __repr__(self):
         return f"<Worker {self.worker_config.task_class.__name__} {self.worker_config.working_dir.name} Alive: {self.is_alive()}>"
+
+
+class PooledWorker:
+    """Representation of a pooled worker in the controller process.
+
+    The worker runs one job at a time, and waits for another job when it
+    has finished."""
+
+    def __init__(
+        self,
+        spawn_class,
+        results_reporter: Queue,
+        filesystem_lock,
+        worker_finished: T.Optional[Connection] = None,
+    ):
+        self.jobs, worker_jobs = Pipe()
+        self.worker_config = None  # the job in progress, if any
+        self.jobs_started = 0
+        self.process = spawn_class(
+            target=run_tasks_in_pooled_worker,
+            args=[worker_jobs, results_reporter, filesystem_lock, worker_finished],
+            # quit if the parent process decides to exit (e.g. after a timeout)
+            daemon=True,
+        )
+        self.process.start()
+
+    def start_job(self, worker_config: WorkerConfig):
+        dct = worker_config.as_dict()
+        assert json.dumps(dct, default=simplify)
+        self.jobs.send(dct)
+        self.worker_config = worker_config
+        self.jobs_started += 1
+
+    def is_alive(self) -> bool:
+        """Is the worker still running its job?"""
+        self.join(0)
+        return bool(self.worker_config) and self.process.is_alive()
+
+    def join(self, timeout: T.Optional[float] = None):
+        """Wait for the worker to finish its job"""
+        if self.worker_config and self.jobs.poll(timeout):
+            try:
+                self.jobs.recv()
+            except EOFError:  # the worker has exited
+                pass
+            self.worker_config = None
+
+    def stop(self):
+        """Let the worker exit once it has finished its job"""
+        try:
+            self.jobs.send(None)
+        except OSError:  # the worker has already exited
+            pass
+
+    def terminate(self):
+        self.process.terminate()
+
+    def __repr__(self):
+        job = self.worker_config.working_dir.name if self.worker_config else None
+        return f"<PooledWorker Job: {job} Jobs Started: {self.jobs_started}>"
@@ -6,16 +6,20 @@ import logging
 import shutil
 import typing as T
 from multiprocessing import get_context
+from multiprocessing.connection import Connection
 from pathlib import Path
 from queue import Queue
 from tempfile import gettempdir
 from threading import Thread
 
-from .parallel_worker import ParallelWorker, SharedConfig, WorkerConfig
+from .parallel_worker import ParallelWorker, PooledWorker, SharedConfig, WorkerConfig
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.DEBUG)
 
+# how long to wait for a worker to exit after it says it is finished
+REAP_TIMEOUT = 5
+
 
 class WorkerQueueConfig(SharedConfig):
     """Configure a worker queue to do its job"""
@@ -30,6 +34,9 @@ class WorkerQueueConfig(SharedConfig):
     # callable to generate task options
     make_task_options: T.Callable[..., T.Mapping[str, T.Any]]
     rename_directory: T.Optional[T.Callable]
+    # how many jobs a worker runs before it is replaced. Workers that run
+    # more than one job are pooled, and keep their org connection.
+    max_jobs_per_worker: int = 1
 
     def __init__(self, **kwargs):
         kwargs.setdefault("failures_dir", kwargs["parent_dir"] / "failures")
@@ -70,13 +77,17 @@ class WorkerQueue:
         # race conditions. See PR #3076 for more info.
         filesystem_lock,
         results_reporter: Queue = None,
+        # workers send their working directory here when they finish
+        worker_finished: Connection = None,
     ):
         self.config = queue_config
         # convenience access to names
         self._create_dirs()
         self.workers = []
+        self.idle_workers: T.List[PooledWorker] = []
         self.results_reporter = results_reporter
         self.filesystem_lock = filesystem_lock
+        self.worker_finished = worker_finished
 
     def __getattr__(self, name):
         """Convenience proxy for config values
@@ -221,20 +232,73 @@ class WorkerQueue:
             **worker_config_data,
         )
 
-        worker = ParallelWorker(
+        if self.max_jobs_per_worker > 1:
+            worker = self._get_pooled_worker()
+            worker.start_job(worker_config)
+        else:
+            worker = ParallelWorker(
+                self.config.spawn_class,
+                worker_config,
+                self.results_reporter,
+                self.filesystem_lock,
+                self.worker_finished,
+            )
+            worker.start()
+        self.workers.append(worker)
+
+    def _get_pooled_worker(self) -> PooledWorker:
+        """Reuse an idle worker from the pool, or start a new one"""
+        while self.idle_workers:
+            worker = self.idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+        return PooledWorker(
             self.config.spawn_class,
-            worker_config,
             self.results_reporter,
             self.filesystem_lock,
+            self.worker_finished,
         )
-        worker.start()
-        self.workers.append(worker)
+
+    def _release_worker(self, worker):
+        """Return a worker that finished its job to the pool, or retire it"""
+        if not isinstance(worker, PooledWorker):
+            return
+        if worker.jobs_started < self.max_jobs_per_worker and worker.process.is_alive():
+            self.idle_workers.append(worker)
+        else:
+            worker.stop()
+
+    def shutdown(self):
+        """Let pooled workers exit once they have finished their jobs"""
+        for worker in self.workers + self.idle_workers:
+            if isinstance(worker, PooledWorker):
+                worker.stop()
+        self.idle_workers = []
+
+    def reap_worker(self, working_dir: str) -> bool:
+        """Wait for the worker on `working_dir` to exit once it has
+        reported that it is finished, so that its slot is free by the
+        next tick. Returns whether the worker belongs to this queue."""
+        for worker in self.workers:
+            if (
+                worker.worker_config
+                and str(worker.worker_config.working_dir) == working_dir
+            ):
+                worker.join(REAP_TIMEOUT)
+                return True
+        return False
 
     def tick(self):
         """Things are moved from place to place in the 'tick'.
         The tick runs in the parent/controller/original process
         so there are no threading/locking issues."""
-        self.workers = [w for w in self.workers if w.is_alive()]
+        busy_workers = []
+        for worker in self.workers:
+            if worker.is_alive():
+                busy_workers.append(worker)
+            else:
+                self._release_worker(worker)
+        self.workers = busy_workers
 
         for idx, job_dir in zip(range(self.num_free_workers), self.queued_job_dirs):
             logger.info(f"Starting job {job_dir}")
@@ -1,8 +1,9 @@
 from contextlib import contextmanager
 from logging import getLogger
-from multiprocessing import Lock
+from multiprocessing import Lock, Pipe
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from threading import Thread
 from unittest import mock
 
 import pytest
@@ -10,11 +11,14 @@ import pytest
 from cumulusci.core import exceptions as exc
 from cumulusci.core.config import BaseProjectConfig, OrgConfig, UniversalConfig
 from cumulusci.tasks.util import Sleep
+from cumulusci.utils.parallel.task_worker_queues import parallel_worker
 from cumulusci.utils.parallel.task_worker_queues.parallel_worker import (
     ParallelWorker,
     SubprocessKeychain,
     TaskWorker,
     WorkerConfig,
+    run_task_in_worker,
+    run_tasks_in_pooled_worker,
 )
 from cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue import (
     WorkerQueue,
@@ -51,6 +55,9 @@ class DelaySpawner:
     def terminate(self):
         self._is_alive = False
 
+    def join(self, timeout=None):
+        pass
+
 
 class TestWorkerQueue:
     @contextmanager
@@ -220,27 +227,99 @@ class TestWorkerQueue:
             q2.tick()
 
     def test_worker_queues_together__outbox_cannot_be_removed(self, tmpdir):
-        with self.configure_worker_queue(
-            parent_dir=tmpdir,
+        with (
+            self.configure_worker_queue(
+                parent_dir=tmpdir,
+                name="start",
+                task_class=Sleep,
+                make_task_options=lambda *args, **kwargs: {"seconds": 0},
+                queue_size=3,
+                num_workers=2,
+            ) as q1,
+            self.configure_worker_queue(
+                parent_dir=tmpdir,
+                name="next",
+                task_class=Sleep,
+                make_task_options=lambda *args, **kwargs: {"seconds": 0},
+                queue_size=3,
+                num_workers=2,
+            ) as q2,
+        ):
+            q1.outbox_dir.rmdir()
+            with mock.patch(
+                "cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue.logger.info"
+            ) as logger_info:
+                q1.feeds_data_to(q2)
+                assert "Cannot remove outbox dir" in logger_info.mock_calls[0][1][0]
+
+    def test_worker_finished(self, tmpdir):
+        worker_events, worker_finished = Pipe(duplex=False)
+        config = WorkerQueueConfig(
+            project_config=dummy_project_config,
+            org_config=dummy_org_config,
+            connected_app=None,
+            redirect_logging=True,
+            spawn_class=DelaySpawner,
+            parent_dir=Path(tmpdir),
             name="start",
             task_class=Sleep,
             make_task_options=lambda *args, **kwargs: {"seconds": 0},
             queue_size=3,
             num_workers=2,
-        ) as q1, self.configure_worker_queue(
-            parent_dir=tmpdir,
-            name="next",
+        )
+        q = WorkerQueue(config, Lock(), worker_finished=worker_finished)
+        q.push(name="a")
+        q.push(name="b")
+        assert not worker_events.poll()
+
+        q.workers[0].process._finish()
+
+        working_dir = worker_events.recv()
+        assert Path(working_dir).name == "a"
+        assert q.reap_worker(working_dir)
+        assert not q.reap_worker(str(tmpdir / "c"))
+        q.tick()
+        assert q.num_free_workers == 1
+
+    def test_worker_pool(self, tmpdir):
+        worker_events, worker_finished = Pipe(duplex=False)
+        threads = []
+
+        def spawn_class(**kwargs):
+            threads.append(Thread(**kwargs))
+            return threads[-1]
+
+        config = WorkerQueueConfig(
+            project_config=dummy_project_config,
+            org_config=dummy_org_config,
+            connected_app=None,
+            redirect_logging=True,
+            spawn_class=spawn_class,
+            parent_dir=Path(tmpdir),
+            name="start",
             task_class=Sleep,
             make_task_options=lambda *args, **kwargs: {"seconds": 0},
             queue_size=3,
-            num_workers=2,
-        ) as q2:
-            q1.outbox_dir.rmdir()
-            with mock.patch(
-                "cumulusci.utils.parallel.task_worker_queues.parallel_worker_queue.logger.info"
-            ) as logger_info:
-                q1.feeds_data_to(q2)
-                assert "Cannot remove outbox dir" in logger_info.mock_calls[0][1][0]
+            num_workers=1,
+            max_jobs_per_worker=2,
+        )
+        q = WorkerQueue(config, Lock(), worker_finished=worker_finished)
+        for name in ("a", "b", "c"):
+            q.push(name=name)
+        while q.queued_jobs or q.workers:
+            assert worker_events.poll(5)
+            q.reap_worker(worker_events.recv())
+            q.tick()
+
+        assert sorted(q.outbox_jobs) == ["a", "b", "c"]
+        # the first worker ran two jobs and was replaced for the third
+        assert len(threads) == 2
+        assert len(q.idle_workers) == 1
+
+        q.shutdown()
+        assert not q.idle_workers
+        threads[-1].join(5)
+        assert not threads[-1].is_alive()
 
     def test_worker_queue_from_path(self, tmpdir):
         parentdirs = [
@@ -334,6 +413,29 @@ class TestTaskWorker:
                     p.run()
             assert Path(working_dir, "exception.txt").exists()
 
+    def test_run_task_in_worker__failure_signals_finished(self):
+        worker_events, worker_finished = Pipe(duplex=False)
+        with (
+            TemporaryDirectory() as failures_dir,
+            TemporaryDirectory() as outbox_dir,
+            TemporaryDirectory() as working_dir,
+        ):
+            config = WorkerConfig(
+                project_config=dummy_project_config,
+                org_config=dummy_org_config,
+                connected_app=None,
+                redirect_logging=True,
+                task_class=Sleep,
+                task_options={"seconds": "not a number"},
+                failures_dir=failures_dir,
+                outbox_dir=outbox_dir,
+                working_dir=working_dir,
+            )
+            with pytest.raises(Exception):
+                run_task_in_worker(config.as_dict(), None, Lock(), worker_finished)
+
+            assert worker_events.recv() == working_dir
+
 
 # Frankly these tests are primarily for coverage-counting purposes.
 # Meaningful tests of keychain stuff are by definition integration
@@ -351,3 +453,56 @@ class TestSubprocessKeychain:
         skc.set_org()
         with pytest.raises(exc.ServiceNotConfigured):
             skc.get_service("xyzzy")
+
+
+class TestPooledWorker:
+    @mock.patch.object(parallel_worker, "TaskWorker")
+    @mock.patch.object(parallel_worker.WorkerConfig, "from_dict")
+    def test_run_tasks_in_pooled_worker(self, from_dict, TaskWorker):
+        TaskWorker.return_value.run.side_effect = [AssertionError, None, None]
+        jobs, worker_jobs = Pipe()
+        worker_events, worker_finished = Pipe(duplex=False)
+        for name in ("a", "b", "c"):
+            jobs.send(
+                {
+                    "task_options": {"seconds": 0},
+                    "working_dir": name,
+                    "outbox_dir": "outbox",
+                }
+            )
+        jobs.send(None)
+
+        run_tasks_in_pooled_worker(worker_jobs, None, Lock(), worker_finished)
+
+        from_dict.assert_called_once()
+        refresh_credentials = [call.args[4] for call in TaskWorker.call_args_list]
+        # the first job failed, so the second one refreshes the credentials too
+        assert refresh_credentials == [True, True, False]
+        assert [jobs.recv() for _ in range(3)] == ["a", "b", "c"]
+        assert [worker_events.recv() for _ in range(3)] == ["a", "b", "c"]
+
+    def test_run_tasks_in_pooled_worker__closed(self):
+        jobs, worker_jobs = Pipe()
+        jobs.close()
+
+        run_tasks_in_pooled_worker(worker_jobs, None, Lock())
+
+    def test_make_task__reused_credentials(self):
+        with TemporaryDirectory() as working_dir:
+            config = WorkerConfig(
+                project_config=dummy_project_config,
+                org_config=dummy_org_config,
+                connected_app=None,
+                redirect_logging=True,
+                task_class=Sleep,
+                task_options={"seconds": 0},
+                failures_dir=working_dir,
+                outbox_dir=working_dir,
+                working_dir=working_dir,
+            )
+            worker = TaskWorker(
+                config.as_dict(), None, Lock(), config, refresh_credentials=False
+            )
+            task = worker._make_task(Sleep, logger)
+
+        assert not task.refresh_credentials
@@ -10,6 +10,7 @@ from cumulusci.core.config import (
     UniversalConfig,
 )
 from cumulusci.core.exceptions import TaskOptionsError
+from cumulusci.core.polling import LinearPollingStrategy
 from cumulusci.core.tasks import BaseTask
 from cumulusci.utils.options import (
     READONLYDICT_ERROR_MSG,
@@ -109,6 +110,13 @@ class TestTaskOptionsParsing:
         task = TaskToTestTypes(self.project_config, task_config, self.org_config)
         assert task.parsed_options.the_path.exists()
 
+    def test_polling_option(self):
+        task_config = TaskConfig(
+            {"options": {"req": 1, "polling": {"strategy": "linear"}}}
+        )
+        task = TaskToTestTypes(self.project_config, task_config, self.org_config)
+        assert isinstance(task.poll_strategy, LinearPollingStrategy)
+
     def test_missing_option(self):
         task_config = TaskConfig({"options": {"the_path": __file__}})
         with pytest.raises(TaskOptionsError) as e:
@@ -1,7 +1,9 @@
-import gzip
 import json
 import re
+import sqlite3
+from contextlib import closing
 from itertools import chain
+from logging import getLogger
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,10 +13,13 @@ import yaml
 from sqlalchemy import create_engine
 
 from cumulusci.salesforce_api.org_schema import (
+    BUSY_TIMEOUT,
     BufferedSession,
+    DescribeUpdate,
     Filters,
+    create_schema_engine,
     get_org_schema,
-    zip_database,
+    retire_database,
 )
 from cumulusci.salesforce_api.org_schema_models import Base, SObject
 from cumulusci.tasks.bulkdata.tests.integration_test_utils import (
@@ -150,14 +155,16 @@ class TestOrgSchema:
 
         # Step 2: Call the server again.
         #         This time it has nothing new to tell us so nothing
-        # should be written to the local database except an updated
-        # LastModifiedDate.
-        with mock_return_cached_responses(), patch(
-            "cumulusci.salesforce_api.org_schema.create_row"
-        ) as create_row, get_org_schema(FakeSF(), org_config) as schema:
+        # should be written to the local database.
+        with (
+            mock_return_cached_responses(),
+            patch("cumulusci.salesforce_api.org_schema.create_row") as create_row,
+            get_org_schema(FakeSF(), org_config) as schema,
+        ):
             self.validate_schema_data(schema)
-            for call in create_row.mock_calls:
-                assert call[1][1].__name__ == "FileMetadata"
+            assert schema.from_cache
+            assert schema.content_version == 1
+            assert not create_row.mock_calls
 
     def test_errors(self, org_config):
         with mock_return_uncached_responses(self.cassette_data), get_org_schema(
@@ -172,8 +179,6 @@ class TestOrgSchema:
                 schema.session.execute("insert into sobjects (name) values ('Foo')")
                 assert "Foo" in [obj.name for obj in schema.session.query(SObject.name)]
                 schema.session._real_commit__()
-                dbpath = schema.engine.url.translate_connect_args()["database"]
-                zip_database(Path(dbpath), schema.path)
             with get_org_schema(FakeSF(), org_config) as schema:
                 assert "Foo" in [obj.name for obj in schema.session.query(SObject.name)]
             with get_org_schema(FakeSF(), org_config, force_recache=True) as schema:
@@ -208,7 +213,7 @@ class TestOrgSchema:
         with mock_return_uncached_responses(self.cassette_data):
             with get_org_schema(FakeSF(), org_config) as schema:
                 assert "Account" in schema
-                path = schema.path
+            path = schema.path
             assert not caplog.text
             with open(path, "w") as p:
                 p.write("xxx")
@@ -218,20 +223,148 @@ class TestOrgSchema:
             assert caplog.text
 
     def test_corrupted_schema__sqlite(self, caplog, org_config):
-        "What if the schema inside the gzip is corrupted"
+        "What if the schema is a database without the expected tables"
         with mock_return_uncached_responses(self.cassette_data):
             with get_org_schema(FakeSF(), org_config) as schema:
                 assert "Account" in schema
-                path = schema.path
+            path = schema.path
             assert not caplog.text
-            with open(path, "wb") as p:
-                with gzip.GzipFile(fileobj=p, mode="w") as gzipped:
-                    gzipped.write(b"xxx")
+            path.unlink()
+            with create_engine(f"sqlite:///{path}").connect() as connection:
+                connection.execute("create table unrelated (id integer)")
 
             with get_org_schema(FakeSF(), org_config) as schema:
                 assert "Account" in schema
             assert caplog.text
 
+    def test_legacy_gzipped_schema_removed(self, org_config):
+        with org_config.get_orginfo_cache_dir(
+            "cumulusci.salesforce_api.org_schema"
+        ) as directory:
+            legacy_path = Path(directory.getsyspath()) / "org_schema.db.gz"
+            legacy_path.write_bytes(b"xxx")
+
+        with mock_return_uncached_responses(self.cassette_data):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert "Account" in schema
+                assert not schema.from_cache
+
+        assert not legacy_path.exists()
+        assert re.fullmatch(r"org_schema\.\d{20}\.db", schema.path.name)
+
+    def test_schema_opened_in_place(self, org_config):
+        with mock_return_uncached_responses(self.cassette_data):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                journal_mode = schema.session.execute("PRAGMA journal_mode").scalar()
+                assert journal_mode == "wal"
+                assert schema.content_version == 1
+        path = schema.path
+        modified = path.stat().st_mtime_ns
+
+        with mock_return_cached_responses():
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert schema.from_cache
+                assert schema.content_version == 1
+        assert path.stat().st_mtime_ns == modified
+        assert not path.with_name(path.name + "-wal").exists()
+
+        changed_account = {**account_data, "label": "Business Account"}
+        with patch(
+            "cumulusci.salesforce_api.org_schema.deep_describe",
+            return_value=[
+                DescribeUpdate(changed_account, "Tue, 1 Jan 2030 00:00:00 GMT")
+            ],
+        ):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert schema.content_version == 2
+                assert schema["Account"].label == "Business Account"
+
+    def test_forced_recache_writes_new_file(self, org_config):
+        with mock_return_uncached_responses(self.cassette_data):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                pass
+            old_path = schema.path
+            # another process still has the old cache open
+            engine = create_engine(f"sqlite:///{old_path}")
+            with engine.connect() as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("select count(*) from sobjects")
+                with get_org_schema(FakeSF(), org_config, force_recache=True) as schema:
+                    assert not schema.from_cache
+                new_path = schema.path
+                assert new_path.name > old_path.name
+                # so it is left alone
+                assert old_path.with_name(old_path.name + "-wal").exists()
+                assert connection.execute("select count(*) from sobjects").scalar()
+            engine.dispose()
+            assert sorted(old_path.parent.iterdir()) == [old_path, new_path]
+
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert schema.from_cache
+                assert schema.path == new_path
+        assert list(new_path.parent.iterdir()) == [new_path]
+
+    def test_replaces_single_file_cache(self, org_config):
+        with org_config.get_orginfo_cache_dir(
+            "cumulusci.salesforce_api.org_schema"
+        ) as directory:
+            old_path = Path(directory.getsyspath()) / "org_schema.db"
+            create_engine(f"sqlite:///{old_path}").connect().close()
+
+        with mock_return_uncached_responses(self.cassette_data):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert not schema.from_cache
+        assert list(old_path.parent.iterdir()) == [schema.path]
+
+    def test_recache_cannot_name_file(self, caplog, org_config):
+        with (
+            mock_return_uncached_responses(self.cassette_data),
+            patch(
+                "cumulusci.salesforce_api.org_schema.os.rename",
+                side_effect=PermissionError("no access"),
+            ),
+        ):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                assert "Account" in schema
+                directory = schema.path.parent
+        assert "no access" in caplog.text
+        assert not list(directory.iterdir())
+
+    def test_recache_failure_removes_new_file(self, org_config):
+        with mock_return_uncached_responses(self.cassette_data):
+            with pytest.raises(ZeroDivisionError):
+                with get_org_schema(FakeSF(), org_config) as schema:
+                    directory = schema.path.parent
+                    1 / 0
+        assert not list(directory.iterdir())
+
+    def test_retire_database(self, tmp_path):
+        logger = getLogger(__name__)
+        in_use = tmp_path / "org_schema.1.db"
+        engine = create_schema_engine(in_use)
+        with engine.connect() as connection:
+            connection.execute("create table unrelated (id integer)")
+            retire_database(in_use, logger)
+            assert in_use.exists()
+        engine.dispose()
+        retire_database(in_use, logger)
+        assert not list(tmp_path.iterdir())
+
+        not_a_database = tmp_path / "org_schema.2.db"
+        not_a_database.write_bytes(b"xxx")
+        retire_database(not_a_database, logger)
+        assert not not_a_database.exists()
+
+        retire_database(tmp_path / "org_schema.3.db", logger)
+        assert not list(tmp_path.iterdir())
+
+    def test_schema_engine_waits_for_writers(self, tmp_path):
+        engine = create_schema_engine(tmp_path / "org_schema.db")
+        with engine.connect() as connection:
+            busy_timeout = connection.execute("PRAGMA busy_timeout").scalar()
+        engine.dispose()
+        assert busy_timeout == BUSY_TIMEOUT * 1000
+
     @responses.activate
     def test_http_level_errors(self, sf, org_config, global_describe):
         # This is a bit complex. We're trying to test what happens
@@ -412,17 +545,46 @@ class TestOrgSchema:
                 assert "Account" in schema
                 assert "PermissionSet" not in schema
 
-    def test_error_while_counting(self, sf, org_config, caplog):
+    def test_counts_not_saved(self, sf, org_config):
         with mock_return_uncached_responses(self.cassette_data):
+            with get_org_schema(FakeSF(), org_config) as schema:
+                pass
+            path = schema.path
+
+            counts = ({"Account": 10, "Contact": 5}, [], [])
             with patch(
                 "cumulusci.salesforce_api.org_schema.count_sobjects",
-                lambda *args: (
-                    {"Account": 10, "Contact": 5, "PermissionSet": 0},
-                    [],
-                    [HTTPRequestError("Error! Apostasy!", None)] * 15,
+                lambda *args: counts,
+            ), get_org_schema(FakeSF(), org_config, include_counts=True) as schema:
+                assert schema["Account"].count == 10
+                # another process can still write to the cache
+                with closing(sqlite3.connect(path, timeout=0)) as connection:
+                    connection.execute("BEGIN IMMEDIATE")
+                    connection.rollback()
+                assert schema["Account"].count == 10
+
+        with closing(sqlite3.connect(path)) as connection:
+            assert not connection.execute(
+                "select count from sobjects where count is not null"
+            ).fetchall()
+
+    def test_error_while_counting(self, sf, org_config, caplog):
+        with mock_return_uncached_responses(self.cassette_data):
+            with (
+                patch(
+                    "cumulusci.salesforce_api.org_schema.count_sobjects",
+                    lambda *args: (
+                        {"Account": 10, "Contact": 5, "PermissionSet": 0},
+                        [],
+                        [HTTPRequestError("Error! Apostasy!", None)] * 15,
+                    ),
+                ),
+                get_org_schema(
+                    FakeSF(),
+                    org_config,
+                    include_counts=True,
+                    filters=[Filters.populated],
                 ),
-            ), get_org_schema(
-                FakeSF(), org_config, include_counts=True, filters=[Filters.populated]
             ):
                 pass
             assert "Apostasy" in caplog.text
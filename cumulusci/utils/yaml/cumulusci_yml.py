@@ -74,6 +74,7 @@ class Flow(CCIDictModel):
     description: str = None
     steps: Dict[str, Step] = None
     group: str = None
+    polling: Dict[str, Any] = None
 
 
 class Package(CCIDictModel):
@@ -1,5 +1,7 @@
+import copy
 import hashlib
 import io
+import os
 import zipfile
 
 
@@ -21,6 +23,63 @@ def zip_subfolder(zip_src: zipfile.ZipFile, path):
     return zip_dest
 
 
+class ZipSubfolderView(zipfile.ZipFile):
+    """A read-only view of the members of a zipfile under one folder,
+    renamed relative to it.
+
+    Names are mapped back onto the wrapped zipfile whenever a member is
+    opened, so members are read from its underlying file and the wrapped
+    zipfile itself is left unchanged. Closing the view closes it."""
+
+    def __init__(self, zip_src: zipfile.ZipFile, path: str):
+        # ZipFile.__init__ is not called: there is no archive to read,
+        # only names to map onto zip_src.
+        self._zip_src = zip_src
+        self._src_names = {}
+        self.mode = "r"
+        self.filelist = []
+        self.NameToInfo = {}
+        for src_info in zip_src.infolist():
+            if src_info.filename.startswith(path) and src_info.filename != path:
+                info = copy.copy(src_info)
+                info.filename = src_info.filename[len(path) :]
+                self._src_names[info.filename] = src_info.filename
+                self.filelist.append(info)
+                self.NameToInfo[info.filename] = info
+
+    def __getattr__(self, name):
+        # Anything not specific to the view, such as fp, comes from zip_src
+        if name == "_zip_src":
+            raise AttributeError(name)
+        return getattr(self._zip_src, name)
+
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        if mode != "r":
+            raise ValueError("A zipfile subfolder view is read-only")
+        if isinstance(name, zipfile.ZipInfo):
+            name = name.filename
+        info = self.getinfo(name)
+        return self._zip_src.open(self._src_names[info.filename], pwd=pwd)
+
+    def close(self):
+        if hasattr(self, "_zip_src"):
+            self._zip_src.close()
+
+
+def zip_subfolder_view(zip_src: zipfile.ZipFile, path):
+    """Narrow a zipfile opened for reading to the members under `path`,
+    renamed relative to it, like zip_subfolder().
+
+    Unlike zip_subfolder(), nothing is copied: a ZipSubfolderView of
+    `zip_src` is returned, which reads members from the same file.
+    Zipfiles open for writing are copied with zip_subfolder() instead."""
+    if zip_src.mode != "r":
+        return zip_subfolder(zip_src, path)
+    if not path.endswith("/"):
+        path = path + "/"
+    return ZipSubfolderView(zip_src, path)
+
+
 def process_text_in_zipfile(zf, process_file):
     """Process each file in a zip file using the `process_file` function.
 
@@ -59,3 +118,26 @@ def hash_zipfile_contents(zf):
         h.update(name.encode("utf-8"))
         h.update(zf.read(name))
     return h.hexdigest()
+
+
+def hash_directory_contents(path, files=None):
+    """Returns a hash of the contents of the files in a directory.
+
+    `files` may be given to hash only some of the files under `path`.
+    Names are hashed relative to `path` in the same way as
+    `hash_zipfile_contents`, so modtimes and the location of the
+    directory don't affect the result.
+    """
+    if files is None:
+        files = (
+            os.path.join(root, f)
+            for root, _, filenames in os.walk(path)
+            for f in filenames
+        )
+    h = hashlib.blake2b()
+    for file_path in sorted(str(f) for f in files):
+        name = os.path.relpath(file_path, path).replace(os.sep, "/")
+        h.update(name.encode("utf-8"))
+        with open(file_path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()